@@ -0,0 +1,151 @@
+"""
+Benchmarks das etapas do algoritmo genético (pytest-benchmark), executados com um cenário sintético, sem acesso ao sharepoint.
+
+Não fazem parte dos testes (o arquivo não segue o padrão test_*.py) e devem ser executados explicitamente, gravando o resultado
+para comparação antes e depois de cada otimização:
+
+    pytest benchmark/bench_algoritmo_genetico.py --benchmark-autosave
+    pytest benchmark/bench_algoritmo_genetico.py --benchmark-compare
+
+Populações maiores podem ser filtradas com -k (ex.: -k "1000 and not 100000").
+Além dos tempos, cada benchmark grava em extra_info o pico de memória (tracemalloc) e, quando aplicável, as avaliações por segundo
+"""
+
+import tracemalloc
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from carteira_energia.entidades.algoritmo_genetico import AlgoritmoGenetico
+from carteira_energia.entidades.algoritmo_genetico_vetorizado import AlgoritmoGeneticoVetorizado
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
+from carteira_energia.dao.fonte_cenario import DadosCenario, FonteCenarioMemoria
+from carteira_energia.parada.criterios_parada import CriterioMaximoGeracoes
+
+LISTA_TAMANHOS_POPULACAO = [1_000, 10_000, 100_000]
+LISTA_CLASSES_ALGORITMO = [AlgoritmoGenetico, AlgoritmoGeneticoVetorizado]
+
+QTDADE_RODADAS = 3
+QTDADE_GERACOES_EXECUCAO = 3
+
+FONTE_CENARIO_SINTETICO = FonteCenarioMemoria(DadosCenario(meta_anual_venda_kwm=14,
+                                                           volume_financeiro_meta_ganhos=3000000000,
+                                                           volume_financeiro_risco_anual=5000000,
+                                                           lista_preco_pld_mes=[100, 200, 300, 90, 100, 200, 100, 200, 300, 90, 100, 200],
+                                                           lista_risco_mes=[90, 85, 70, 90, 80, 110, 90, 120, 150, 90, 100, 70]))
+
+def _criar_configuracao_cenario(tamanho_populacao: int, modo_inicializacao: str = 'simplex') -> ConfiguracaoCenario:
+    return ConfiguracaoCenario(ano_simulacao=1,
+                               tamanho_populacao=tamanho_populacao,
+                               modo_inicializacao=modo_inicializacao,
+                               fonte_cenario=FONTE_CENARIO_SINTETICO)
+
+def _criar_algoritmo(classe_algoritmo, tamanho_populacao: int, modo_inicializacao: str = 'simplex') -> AlgoritmoGenetico:
+    return classe_algoritmo(ano_simulacao=1,
+                            configuracao_cenario=_criar_configuracao_cenario(tamanho_populacao, modo_inicializacao),
+                            criterios_parada=[CriterioMaximoGeracoes(QTDADE_GERACOES_EXECUCAO)])
+
+def _criar_restauracao_populacao(algoritmo: AlgoritmoGenetico):
+    """
+    As etapas alteram a população (avaliação descarta inválidos, ajuste e mutação alteram cromossomos), portanto cada rodada
+    parte de uma cópia da população inicial, recriada fora da medição e ainda não avaliada
+    """
+    matriz_populacao, vetor_geracao = algoritmo._get_matriz_populacao()
+
+    return lambda: algoritmo._definir_matriz_populacao(matriz_populacao.copy(), vetor_geracao.copy())
+
+def _medir(benchmark, funcao, preparar=None):
+    """
+    Mede o tempo da função (cada rodada precedida por preparar, fora da medição) e, em uma execução adicional, o pico de memória
+    """
+    def setup():
+        if preparar is not None:
+            preparar()
+
+    resultado = benchmark.pedantic(funcao, setup=setup, rounds=QTDADE_RODADAS, iterations=1)
+
+    setup()
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico_memoria = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    benchmark.extra_info['pico_memoria_mb'] = pico_memoria / 2 ** 20
+
+    return resultado
+
+def _registrar_avaliacoes_por_segundo(benchmark, qtdade_avaliacoes: int):
+    benchmark.extra_info['avaliacoes_por_segundo'] = qtdade_avaliacoes / benchmark.stats.stats.mean
+
+@pytest.mark.parametrize('tamanho_populacao', LISTA_TAMANHOS_POPULACAO)
+@pytest.mark.parametrize('classe_algoritmo', LISTA_CLASSES_ALGORITMO, ids=lambda classe: classe.__name__)
+def test_benchmark_inicializacao(benchmark, classe_algoritmo, tamanho_populacao: int):
+    configuracao_cenario = _criar_configuracao_cenario(tamanho_populacao)
+
+    _medir(benchmark, lambda: classe_algoritmo(ano_simulacao=1, configuracao_cenario=configuracao_cenario))
+
+@pytest.mark.parametrize('tamanho_populacao', LISTA_TAMANHOS_POPULACAO)
+@pytest.mark.parametrize('classe_algoritmo', LISTA_CLASSES_ALGORITMO, ids=lambda classe: classe.__name__)
+def test_benchmark_avaliar_populacao(benchmark, classe_algoritmo, tamanho_populacao: int):
+    algoritmo = _criar_algoritmo(classe_algoritmo, tamanho_populacao)
+
+    _medir(benchmark, algoritmo._avaliar_populacao, _criar_restauracao_populacao(algoritmo))
+    _registrar_avaliacoes_por_segundo(benchmark, tamanho_populacao)
+
+@pytest.mark.parametrize('tamanho_populacao', LISTA_TAMANHOS_POPULACAO)
+@pytest.mark.parametrize('classe_algoritmo', LISTA_CLASSES_ALGORITMO, ids=lambda classe: classe.__name__)
+def test_benchmark_selecao_pais(benchmark, classe_algoritmo, tamanho_populacao: int):
+    algoritmo = _criar_algoritmo(classe_algoritmo, tamanho_populacao)
+    algoritmo._avaliar_populacao()
+    qtdade_pares = round(tamanho_populacao / 2)
+
+    if isinstance(algoritmo, AlgoritmoGeneticoVetorizado):
+        funcao = lambda: algoritmo._selecao_pais(qtdade_pares)
+    else:
+        def funcao():
+            algoritmo.estrategia_selecao.preparar(algoritmo.lista_populacao, algoritmo._rng)
+            return algoritmo.estrategia_selecao.sortear_lista_pais(qtdade_pares)
+
+    _medir(benchmark, funcao)
+
+@pytest.mark.parametrize('tamanho_populacao', LISTA_TAMANHOS_POPULACAO)
+@pytest.mark.parametrize('classe_algoritmo', LISTA_CLASSES_ALGORITMO, ids=lambda classe: classe.__name__)
+def test_benchmark_crossover(benchmark, classe_algoritmo, tamanho_populacao: int):
+    algoritmo = _criar_algoritmo(classe_algoritmo, tamanho_populacao)
+    restaurar_populacao = _criar_restauracao_populacao(algoritmo)
+
+    def preparar():
+        restaurar_populacao()
+        algoritmo._avaliar_populacao()
+
+    # Inclui a avaliação dos filhos, feita ao final do crossover
+    _medir(benchmark, algoritmo._crossover, preparar)
+
+@pytest.mark.parametrize('tamanho_populacao', LISTA_TAMANHOS_POPULACAO)
+@pytest.mark.parametrize('classe_algoritmo', LISTA_CLASSES_ALGORITMO, ids=lambda classe: classe.__name__)
+def test_benchmark_mutacao_gene(benchmark, classe_algoritmo, tamanho_populacao: int):
+    algoritmo = _criar_algoritmo(classe_algoritmo, tamanho_populacao)
+
+    _medir(benchmark, algoritmo._mutacao_gene, _criar_restauracao_populacao(algoritmo))
+
+@pytest.mark.parametrize('tamanho_populacao', LISTA_TAMANHOS_POPULACAO)
+@pytest.mark.parametrize('classe_algoritmo', LISTA_CLASSES_ALGORITMO, ids=lambda classe: classe.__name__)
+def test_benchmark_ajustar_individuos(benchmark, classe_algoritmo, tamanho_populacao: int):
+    # Sorteio uniforme: a maior parte dos cromossomos ultrapassa a meta e precisa de ajuste
+    algoritmo = _criar_algoritmo(classe_algoritmo, tamanho_populacao, modo_inicializacao='uniforme')
+
+    _medir(benchmark, algoritmo._ajustar_individuos, _criar_restauracao_populacao(algoritmo))
+
+@pytest.mark.parametrize('tamanho_populacao', LISTA_TAMANHOS_POPULACAO)
+@pytest.mark.parametrize('classe_algoritmo', LISTA_CLASSES_ALGORITMO, ids=lambda classe: classe.__name__)
+def test_benchmark_executar(benchmark, classe_algoritmo, tamanho_populacao: int):
+    # Cada rodada executa um algoritmo novo, criado fora da medição
+    dict_algoritmo = {}
+
+    def preparar():
+        dict_algoritmo['algoritmo'] = _criar_algoritmo(classe_algoritmo, tamanho_populacao)
+
+    _medir(benchmark, lambda: dict_algoritmo['algoritmo'].executar(), preparar)
+    _registrar_avaliacoes_por_segundo(benchmark, dict_algoritmo['algoritmo'].estado_execucao.qtdade_avaliacoes)
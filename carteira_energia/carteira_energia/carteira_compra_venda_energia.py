@@ -1,5 +1,12 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from carteira_energia.entidades.algoritmo_genetico import AlgoritmoGenetico
-from carteira_energia.sharepoint.gerenciador_dados_sharepoint import GerenciadorArquivosSharepointPortifolioRecomendacao
+from carteira_energia.entidades.algoritmo_genetico_vetorizado import AlgoritmoGeneticoVetorizado
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
+from carteira_energia.parada.criterios_parada import CriterioParada
+from carteira_energia.util.checkpoint import get_lista_qtdades_melhores_checkpoint
+from carteira_energia.dao.fonte_cenario import FonteCenario, FonteCenarioSharepoint
+from carteira_energia.sharepoint.gerenciador_dados_sharepoint import GerenciadorArquivosSharepointPortifolioRecomendacao, GerenciadorArquivosPLDSharepoint
 
 
 class CarteiraCompraVendaEnergia:
@@ -7,8 +14,24 @@ class CarteiraCompraVendaEnergia:
     Classe que representa uma carteirta de sugestao de compra e venda de energia eletrica
     """
 
-    def __init__(self, ano_simulacao: int):
-        self.algoritmo = AlgoritmoGenetico(ano_simulacao)
+    def __init__(self, ano_simulacao: int, motor_vetorizado: bool = False, criterios_parada: list[CriterioParada] = None,
+                 partida_quente: bool = False, caminho_checkpoint_partida_quente: str = None):
+        """
+        Args:
+            ano_simulacao (int): ano da simulação
+            motor_vetorizado (bool, optional): utiliza o AlgoritmoGeneticoVetorizado, onde a população é uma matriz NumPy. Defaults to False.
+            criterios_parada (list[CriterioParada], optional): critérios de parada do algoritmo (ex.: CriterioTempoLimite). Defaults to critérios da configuração do cenário.
+            partida_quente (bool, optional): semeia parte da população inicial com o portfólio exportado na execução anterior. Defaults to False.
+            caminho_checkpoint_partida_quente (str, optional): semeia parte da população inicial com os melhores indivíduos de um
+                checkpoint local (tem prioridade sobre o portfólio exportado). Defaults to None.
+        """
+        self.partida_quente = partida_quente
+        self.caminho_checkpoint_partida_quente = caminho_checkpoint_partida_quente
+
+        if motor_vetorizado:
+            self.algoritmo = AlgoritmoGeneticoVetorizado(ano_simulacao, criterios_parada=criterios_parada)
+        else:
+            self.algoritmo = AlgoritmoGenetico(ano_simulacao, criterios_parada=criterios_parada)
 
     def encontrar_recomendacao(self) -> list:
         """
@@ -18,10 +41,21 @@ class CarteiraCompraVendaEnergia:
             list: lista contendo as 3 melhores carteiras de venda de energia
         """
 
+        self.algoritmo.semear_populacao(self._get_lista_qtdades_partida_quente())
         self.algoritmo.executar()
 
         return  self.algoritmo.get_lista_melhores_individuos()
         
+    def _get_lista_qtdades_partida_quente(self) -> list:
+        if self.caminho_checkpoint_partida_quente is not None:
+            return get_lista_qtdades_melhores_checkpoint(self.caminho_checkpoint_partida_quente)
+
+        if self.partida_quente:
+            return GerenciadorArquivosSharepointPortifolioRecomendacao() \
+                        .get_lista_qtdades_portfolio_exportado(ano_simulacao=self.algoritmo.configuracao_cenario.horizonte)
+
+        return []
+
     def exportar_resultado_pasta_sharepoint(self):
         """
         Exporta conteúdo dos 3 melhores indivíduos no diretório do sharepoint para relatório Power BI exibir os seus dados
@@ -29,3 +63,102 @@ class CarteiraCompraVendaEnergia:
         
         GerenciadorArquivosSharepointPortifolioRecomendacao() \
                     .exportar_resultado_carteira_recomendacao(lista_individuos_exportacao=self.algoritmo.get_lista_melhores_individuos()[0:3])
+
+
+def _executar_algoritmo_cenario(configuracao_cenario: ConfiguracaoCenario, motor_vetorizado: bool, criterios_parada: list[CriterioParada] = None,
+                                lista_qtdades_partida_quente: list = None, semente: int | np.random.SeedSequence = 146) -> list:
+    """
+    Executa o algoritmo genético de um cenário já carregado. Utilizado pelos processos da execução de vários anos
+    """
+    if motor_vetorizado:
+        algoritmo = AlgoritmoGeneticoVetorizado(configuracao_cenario.ano_simulacao, configuracao_cenario=configuracao_cenario,
+                                                semente=semente, criterios_parada=criterios_parada)
+    else:
+        algoritmo = AlgoritmoGenetico(configuracao_cenario.ano_simulacao, configuracao_cenario=configuracao_cenario,
+                                      semente=semente, criterios_parada=criterios_parada)
+
+    algoritmo.semear_populacao(lista_qtdades_partida_quente)
+    algoritmo.executar()
+
+    return algoritmo.get_lista_melhores_individuos()
+
+
+class CarteiraCompraVendaEnergiaMultiAno:
+    """
+    Carteira de compra e venda de energia para vários anos (A+1 até A+4) em uma única execução.
+
+    Os dados de todos os anos são obtidos com uma única autenticação no sharepoint, os algoritmos genéticos de cada ano
+    rodam em paralelo (um processo por ano) e os portfólios são exportados em lote
+    """
+
+    def __init__(self, lista_anos_simulacao: tuple = (1, 2, 3, 4), motor_vetorizado: bool = False, n_workers: int = None,
+                 criterios_parada: list[CriterioParada] = None, partida_quente: bool = False, semente: int = 146,
+                 fonte_cenario: FonteCenario = None):
+        """
+        Args:
+            lista_anos_simulacao (tuple, optional): anos do estudo (1 para A+1, 2 para A+2, ...). Defaults to (1, 2, 3, 4).
+            motor_vetorizado (bool, optional): utiliza o AlgoritmoGeneticoVetorizado. Defaults to False.
+            n_workers (int, optional): quantidade de processos. Defaults to um processo por ano.
+            criterios_parada (list[CriterioParada], optional): critérios de parada aplicados ao algoritmo de cada ano. Defaults to critérios da configuração do cenário.
+            partida_quente (bool, optional): semeia parte da população inicial de cada ano com o portfólio exportado na execução anterior. Defaults to False.
+            semente (int, optional): semente da execução. Cada ano recebe um fluxo independente de números aleatórios derivado dela. Defaults to 146.
+            fonte_cenario (FonteCenario, optional): origem dos dados de entrada de cada ano (ex.: FonteCenarioArquivo). Defaults to sharepoint.
+        """
+        self.motor_vetorizado = motor_vetorizado
+        self.criterios_parada = criterios_parada
+        self.partida_quente = partida_quente
+        self.semente = semente
+        self.n_workers = n_workers or len(lista_anos_simulacao)
+
+        # Os gerenciadores autenticam no sharepoint, portanto só são criados quando utilizados (dados de entrada, partida quente ou exportação)
+        self.sharepoint_pld = None
+        self.sharepoint_portfolio_recomendacao = None
+
+        if fonte_cenario is None:
+            fonte_cenario = FonteCenarioSharepoint(sharepoint_portfolio_recomendacao=self._get_sharepoint_portfolio_recomendacao(),
+                                                   sharepoint_pld=self.sharepoint_pld)
+
+        self.dict_configuracao_cenario = {ano_simulacao: ConfiguracaoCenario(ano_simulacao=ano_simulacao,
+                                                                             horizonte=ano_simulacao,
+                                                                             fonte_cenario=fonte_cenario)
+                                          for ano_simulacao in lista_anos_simulacao}
+
+        self.dict_melhores_individuos = {}
+
+    def _get_sharepoint_portfolio_recomendacao(self) -> GerenciadorArquivosSharepointPortifolioRecomendacao:
+        if self.sharepoint_portfolio_recomendacao is None:
+            if self.sharepoint_pld is None:
+                self.sharepoint_pld = GerenciadorArquivosPLDSharepoint()
+
+            self.sharepoint_portfolio_recomendacao = GerenciadorArquivosSharepointPortifolioRecomendacao(sharepoint_pld=self.sharepoint_pld)
+
+        return self.sharepoint_portfolio_recomendacao
+
+    def encontrar_recomendacao(self) -> dict[int, list]:
+        """
+        Executa, em paralelo, o algoritmo genético de cada ano
+
+        Returns:
+            dict[int, list]: para cada ano a lista de melhores indivíduos encontrados
+        """
+        dict_qtdades_partida_quente = {ano_simulacao: self._get_sharepoint_portfolio_recomendacao().get_lista_qtdades_portfolio_exportado(ano_simulacao=ano_simulacao)
+                                       if self.partida_quente else None
+                                       for ano_simulacao in self.dict_configuracao_cenario}
+
+        lista_sementes_anos = np.random.SeedSequence(self.semente).spawn(len(self.dict_configuracao_cenario))
+
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            dict_futuros = {ano_simulacao: executor.submit(_executar_algoritmo_cenario, configuracao_cenario, self.motor_vetorizado, self.criterios_parada,
+                                                           dict_qtdades_partida_quente[ano_simulacao], semente)
+                            for (ano_simulacao, configuracao_cenario), semente in zip(self.dict_configuracao_cenario.items(), lista_sementes_anos)}
+
+            self.dict_melhores_individuos = {ano_simulacao: futuro.result() for ano_simulacao, futuro in dict_futuros.items()}
+
+        return self.dict_melhores_individuos
+
+    def exportar_resultado_pasta_sharepoint(self):
+        """
+        Exporta, em lote, os 3 melhores indivíduos de cada ano no diretório do sharepoint
+        """
+        self._get_sharepoint_portfolio_recomendacao().exportar_resultados_carteiras_recomendacao(
+            {ano_simulacao: lista_individuos[0:3] for ano_simulacao, lista_individuos in self.dict_melhores_individuos.items()})
@@ -0,0 +1,172 @@
+""" Fontes dos dados de entrada do cenário (metas de venda, preços PLD e risco de cada mês) utilizados pelo ConfiguracaoCenario """
+
+import os
+from dataclasses import dataclass, field
+import pandas as pd
+from carteira_energia.formulas.formulas_agoritmo_genetico import calcular_variavel_prisco
+from carteira_energia.sharepoint.gerenciador_dados_sharepoint import GerenciadorArquivosSharepointPortifolioRecomendacao, GerenciadorArquivosPLDSharepoint
+
+MSG_ERRO_CENARIO_P75_VAZIO = 'Não foi encontrado valores para o cenário pencentil 75'
+
+MSG_ERRO_CENARIO_MEDIA_VAZIO = 'Não foi encontrado valores de média dos cenários para O preço PLD'
+
+@dataclass(frozen=True)
+class DadosCenario():
+    """
+    Dados de entrada de um cenário. Cada índice das listas representa um mês do ano
+    """
+    meta_anual_venda_kwm: int
+    volume_financeiro_meta_ganhos: float
+    volume_financeiro_risco_anual: float
+    lista_preco_pld_mes: list[float] = field(default_factory=list)
+    lista_risco_mes: list[float] = field(default_factory=list)
+
+class FonteCenario():
+    """
+    Classe base das fontes de dados do cenário
+    """
+
+    def get_dados_cenario(self, ano_simulacao: int, horizonte: int) -> DadosCenario:
+        """
+        Args:
+            ano_simulacao (int): ano da simulação
+            horizonte (int): qual ano à frente (A+1, A+2, ...) deve ser obtido
+
+        Returns:
+            DadosCenario: dados de entrada do cenário
+        """
+        raise NotImplementedError
+
+class FonteCenarioSharepoint(FonteCenario):
+    """
+    Dados obtidos das planilhas do sharepoint (metas e risco do portfólio recomendado e previsões de PLD).
+    Os gerenciadores do sharepoint são criados no primeiro acesso e reaproveitados entre os cenários
+    """
+
+    def __init__(self, sharepoint_portfolio_recomendacao: GerenciadorArquivosSharepointPortifolioRecomendacao = None,
+                 sharepoint_pld: GerenciadorArquivosPLDSharepoint = None) -> None:
+        """
+        Args:
+            sharepoint_portfolio_recomendacao (GerenciadorArquivosSharepointPortifolioRecomendacao, optional): gerenciador já autenticado. Defaults to None.
+            sharepoint_pld (GerenciadorArquivosPLDSharepoint, optional): gerenciador já autenticado. Defaults to None.
+        """
+        self.sharepoint_portfolio_recomendacao = sharepoint_portfolio_recomendacao
+        self.sharepoint_pld = sharepoint_pld
+
+    def get_dados_cenario(self, ano_simulacao: int, horizonte: int) -> DadosCenario:
+        if self.sharepoint_pld is None:
+            self.sharepoint_pld = GerenciadorArquivosPLDSharepoint()
+
+        if self.sharepoint_portfolio_recomendacao is None:
+            self.sharepoint_portfolio_recomendacao = GerenciadorArquivosSharepointPortifolioRecomendacao(ano_simulacao=horizonte, sharepoint_pld=self.sharepoint_pld)
+
+        dataframe_informacoes_meta_anual = self.sharepoint_portfolio_recomendacao.get_dataframe_portfolio_ano(ano_simulacao=horizonte)
+
+        dataframe_media_previsao_preco_pld = self.sharepoint_pld.get_dataframe_media_meses_ano(ano_simulacao=horizonte)
+        dataframe_preco_cenarios_pld = self.sharepoint_pld.get_valores_pld_cenario('P75', ano_simulacao=horizonte)
+
+        _validar_dataframe_coluna_vazia(dataframe=dataframe_preco_cenarios_pld, msg=MSG_ERRO_CENARIO_P75_VAZIO)
+        _validar_dataframe_coluna_vazia(dataframe=dataframe_media_previsao_preco_pld, msg=MSG_ERRO_CENARIO_MEDIA_VAZIO)
+
+        dataframe_valor_risco_mes = calcular_variavel_prisco(dataframe_cenarios_pld=dataframe_preco_cenarios_pld,
+                                                             dataframe_preco_pld_medio_mes=dataframe_media_previsao_preco_pld,
+                                                             ano_simulacao=ano_simulacao)
+
+        return DadosCenario(meta_anual_venda_kwm=dataframe_informacoes_meta_anual['Meta (MWmédio)'][0],
+                            volume_financeiro_meta_ganhos=dataframe_informacoes_meta_anual['VE Fat (R$^6)'][0] * 1000000,
+                            volume_financeiro_risco_anual=dataframe_informacoes_meta_anual['RISK A (R$^6)'][0] * 1000000,
+                            lista_preco_pld_mes=dataframe_media_previsao_preco_pld['VALOR'].to_list(),
+                            lista_risco_mes=dataframe_valor_risco_mes['VALOR_RISCO'].to_list())
+
+class FonteCenarioArquivo(FonteCenario):
+    """
+    Dados gravados em arquivos locais (Parquet ou CSV), um arquivo por horizonte (cenario_A+1.parquet, cenario_A+2.parquet, ...).
+    Cada arquivo tem uma linha por mês com as colunas MES, PRECO_PLD e RISCO, e as metas repetidas em todas as linhas.
+
+    Permite repetir execuções (ex.: benchmarks, CI, estudos) sem acesso à rede. Os arquivos podem ser gerados a partir de
+    qualquer outra fonte com salvar_dados_cenario
+    """
+    EXTENSAO_PARQUET = 'parquet'
+    EXTENSAO_CSV = 'csv'
+
+    def __init__(self, caminho_diretorio: str, extensao: str = EXTENSAO_PARQUET) -> None:
+        """
+        Args:
+            caminho_diretorio (str): diretório dos arquivos
+            extensao (str, optional): parquet (requer pyarrow ou fastparquet) ou csv. Defaults to parquet.
+        """
+        if extensao not in (self.EXTENSAO_PARQUET, self.EXTENSAO_CSV):
+            raise ValueError(f'Extensão {extensao} inválida. Valores aceitos: {self.EXTENSAO_PARQUET} ou {self.EXTENSAO_CSV}')
+
+        self.caminho_diretorio = caminho_diretorio
+        self.extensao = extensao
+
+    def get_caminho_arquivo(self, horizonte: int) -> str:
+        return os.path.join(self.caminho_diretorio, f'cenario_A+{horizonte}.{self.extensao}')
+
+    def get_dados_cenario(self, ano_simulacao: int, horizonte: int) -> DadosCenario:
+        caminho_arquivo = self.get_caminho_arquivo(horizonte)
+
+        if self.extensao == self.EXTENSAO_PARQUET:
+            dataframe_cenario = pd.read_parquet(caminho_arquivo)
+        else:
+            dataframe_cenario = pd.read_csv(caminho_arquivo)
+
+        dataframe_cenario = dataframe_cenario.sort_values('MES')
+
+        return DadosCenario(meta_anual_venda_kwm=dataframe_cenario['META_ANUAL_VENDA_KWM'].iloc[0].item(),
+                            volume_financeiro_meta_ganhos=dataframe_cenario['VOLUME_FINANCEIRO_META_GANHOS'].iloc[0].item(),
+                            volume_financeiro_risco_anual=dataframe_cenario['VOLUME_FINANCEIRO_RISCO_ANUAL'].iloc[0].item(),
+                            lista_preco_pld_mes=dataframe_cenario['PRECO_PLD'].to_list(),
+                            lista_risco_mes=dataframe_cenario['RISCO'].to_list())
+
+    def salvar_dados_cenario(self, dados_cenario: DadosCenario, horizonte: int) -> str:
+        """
+        Grava os dados do cenário no arquivo do horizonte
+
+        Args:
+            dados_cenario (DadosCenario): dados do cenário (ex.: obtidos de FonteCenarioSharepoint)
+            horizonte (int): qual ano à frente (A+1, A+2, ...) os dados representam
+
+        Returns:
+            str: caminho do arquivo gravado
+        """
+        os.makedirs(self.caminho_diretorio, exist_ok=True)
+        caminho_arquivo = self.get_caminho_arquivo(horizonte)
+
+        dataframe_cenario = pd.DataFrame({'MES': range(1, len(dados_cenario.lista_preco_pld_mes) + 1),
+                                          'PRECO_PLD': dados_cenario.lista_preco_pld_mes,
+                                          'RISCO': dados_cenario.lista_risco_mes,
+                                          'META_ANUAL_VENDA_KWM': dados_cenario.meta_anual_venda_kwm,
+                                          'VOLUME_FINANCEIRO_META_GANHOS': dados_cenario.volume_financeiro_meta_ganhos,
+                                          'VOLUME_FINANCEIRO_RISCO_ANUAL': dados_cenario.volume_financeiro_risco_anual})
+
+        if self.extensao == self.EXTENSAO_PARQUET:
+            dataframe_cenario.to_parquet(caminho_arquivo, index=False)
+        else:
+            dataframe_cenario.to_csv(caminho_arquivo, index=False)
+
+        return caminho_arquivo
+
+class FonteCenarioMemoria(FonteCenario):
+    """
+    Dados informados diretamente (ex.: testes). O mesmo DadosCenario pode ser usado em todos os horizontes
+    ou um DadosCenario diferente para cada horizonte
+    """
+
+    def __init__(self, dados_cenario: DadosCenario | dict[int, DadosCenario]) -> None:
+        """
+        Args:
+            dados_cenario (DadosCenario | dict[int, DadosCenario]): dados de todos os horizontes ou dicionário horizonte -> dados
+        """
+        self.dados_cenario = dados_cenario
+
+    def get_dados_cenario(self, ano_simulacao: int, horizonte: int) -> DadosCenario:
+        if isinstance(self.dados_cenario, dict):
+            return self.dados_cenario[horizonte]
+
+        return self.dados_cenario
+
+def _validar_dataframe_coluna_vazia(dataframe, nome_coluna: str = 'VALOR', msg: str = 'Coluna VALOR está vazia'):
+    if dataframe[nome_coluna].isnull().any():
+        raise ValueError(msg)
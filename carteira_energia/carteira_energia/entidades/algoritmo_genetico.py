@@ -1,14 +1,26 @@
-import copy
 import logging
 import csv
 import locale
-from random import random, choice, seed
-from operator import add, sub
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from operator import attrgetter
+import numpy as np
 from pandas import DataFrame
 import matplotlib.pyplot as plt
 from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
 from carteira_energia.entidades.individuo import Individuo
-from carteira_energia.util.utilidades import get_maior_nota_avaliacao_disponivel
+from carteira_energia.entidades.avaliacao_individuo import AvaliacaoIndividuo
+from carteira_energia.entidades.hall_da_fama import HallDaFama
+from carteira_energia.selecao.estrategias_selecao import EstrategiaSelecao, SelecaoRoleta
+from carteira_energia.parada.criterios_parada import CriterioParada, EstadoExecucao, criar_criterios_parada_padrao
+from carteira_energia.operadores.crossover import crossover_ponto_unico
+from carteira_energia.util.modelo_ilhas import executar_modelo_ilhas
+from carteira_energia.util.instrumentacao import InstrumentacaoExecucao, RegistroGeracao
+from carteira_energia.util.checkpoint import salvar_checkpoint, carregar_checkpoint, get_parametros_configuracao_cenario
+from carteira_energia.util.utilidades import get_maior_nota_avaliacao_disponivel, criar_sequencia_sementes, criar_gerador_individuo
+from carteira_energia.util.processamento_paralelo import DadosAvaliacaoCenario, compactar_lote_cromossomos, dividir_em_lotes, \
+                                                         avaliar_lote_cromossomos, ajustar_lote_cromossomos
 
 locale.setlocale(locale.LC_ALL, 'pt_BR.UTF-8') 
 
@@ -17,152 +29,379 @@ class AlgoritmoGenetico():
     Classe que utiliza algoritmo genético para a solução do problema de sugestão de carteira de compra e venda de energia
     """
 
-    def __init__(self, ano_simulacao: int) -> None:
+    QTDADE_LOTES_POR_PROCESSO = 4
+    # Quantidade de melhores indivíduos (sem duplicidade) guardados durante a execução
+    TAMANHO_HALL_DA_FAMA = 100
+
+    def __init__(self, ano_simulacao: int, n_workers: int = 1, executor: Executor = None, estrategia_selecao: EstrategiaSelecao = None,
+                 configuracao_cenario: ConfiguracaoCenario = None, semente: int | np.random.SeedSequence = 146,
+                 criterios_parada: list[CriterioParada] = None, instrumentacao: InstrumentacaoExecucao = None) -> None:
+        """
+        Args:
+            ano_simulacao (int): ano da simulação
+            n_workers (int, optional): quantidade de processos utilizados na avaliação e no ajuste dos indivíduos.
+                Com 1 (padrão) tudo é executado no processo atual. O resultado de uma mesma semente não depende de n_workers. Defaults to 1.
+            executor (Executor, optional): executor já existente (ex.: ProcessPoolExecutor compartilhado). 
+                Quando informado, n_workers é utilizado apenas para definir a quantidade de lotes. Defaults to None.
+            estrategia_selecao (EstrategiaSelecao, optional): estratégia de seleção dos pais no crossover
+                (SelecaoRoleta, SelecaoTorneio, SelecaoRanking). Defaults to SelecaoRoleta().
+            configuracao_cenario (ConfiguracaoCenario, optional): cenário já carregado (ex.: execução de vários anos).
+                Quando não informado o cenário do ano_simulacao é obtido do sharepoint. Defaults to None.
+            semente (int | np.random.SeedSequence, optional): semente do gerador de números aleatórios (numpy.random.Generator) próprio
+                da execução. Todos os sorteios (população inicial, seleção, crossover, mutação e ajuste) usam esse gerador,
+                portanto execuções no mesmo processo não interferem entre si. Defaults to 146.
+            criterios_parada (list[CriterioParada], optional): a execução termina quando qualquer um dos critérios é atingido.
+                Defaults to criar_criterios_parada_padrao(configuracao_cenario).
+            instrumentacao (InstrumentacaoExecucao, optional): recebe o tempo de cada etapa e as métricas de cada geração
+                (exportáveis para CSV/JSON). Defaults to InstrumentacaoExecucao().
+        """
         logging.info("Iniciando algoritmo genético para o ano %s", ano_simulacao)
 
-        seed(146)
+        self.n_workers = n_workers
+        self._executor = executor
+        self._executor_proprio = False
 
-        self.configuracao_cenario = ConfiguracaoCenario(ano_simulacao)
+        self.estrategia_selecao = estrategia_selecao if estrategia_selecao is not None else SelecaoRoleta()
+
+        self.sequencia_sementes = criar_sequencia_sementes(semente)
+        self._rng = np.random.default_rng(self.sequencia_sementes)
+
+        self.configuracao_cenario = configuracao_cenario if configuracao_cenario is not None else ConfiguracaoCenario(ano_simulacao)
         
-        self.lista_populacao = [Individuo(self.configuracao_cenario) for _ in range(self.configuracao_cenario.tamanho_populacao)]
-        logging.info("Gerando população inicial. Quantidade de individuos: %s", len(self.lista_populacao))
+        self._gerar_populacao_inicial()
 
-        self._lista_melhores_individuos = []
+        self.hall_da_fama = HallDaFama(capacidade=self.TAMANHO_HALL_DA_FAMA)
+        self._lista_notas_melhores_rodada = []
         
         self.melhor_individuo = None
+
+        self.criterios_parada = criterios_parada if criterios_parada is not None else criar_criterios_parada_padrao(self.configuracao_cenario)
+        self.estado_execucao = EstadoExecucao()
+        # Quando o algoritmo é retomado de um checkpoint as métricas da execução anterior são mantidas
+        self._estado_execucao_retomado = False
+        self.instrumentacao = instrumentacao if instrumentacao is not None else InstrumentacaoExecucao()
+    
+    def _gerar_populacao_inicial(self):
+        self.lista_populacao = [Individuo(self.configuracao_cenario, rng=self._rng) for _ in range(self.configuracao_cenario.tamanho_populacao)]
+        # Indivíduos criados na última geração (os únicos que passam pela mutação)
+        self._lista_novos_individuos = self.lista_populacao
+        logging.info("Gerando população inicial. Quantidade de individuos: %s", len(self.lista_populacao))
     
     def get_lista_melhores_individuos(self, sem_duplicidade=True):
-        self._lista_melhores_individuos.sort(reverse=True)
-
-        if sem_duplicidade:
-            lista_sem_duplicidade = []
-
-            for individuo in self._lista_melhores_individuos:
-                if individuo not in lista_sem_duplicidade:
-                    lista_sem_duplicidade.append(individuo)
-
-            return lista_sem_duplicidade
-
-        return self._lista_melhores_individuos
+        """
+        Melhores indivíduos encontrados, do melhor para o pior.
+        O hall da fama já descarta cromossomos repetidos na inserção, portanto sem_duplicidade é mantido apenas por compatibilidade.
+        A evolução da nota a cada geração fica em get_lista_notas_melhores_rodada
+        """
+        return self.hall_da_fama.get_lista_individuos()
+
+    def get_lista_notas_melhores_rodada(self) -> list[float]:
+        """
+        Nota do melhor indivíduo de cada geração, na ordem de execução
+        """
+        return self._lista_notas_melhores_rodada
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None and self.n_workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_workers)
+            self._executor_proprio = True
+
+        return self._executor
+
+    def encerrar_executor(self):
+        """
+        Encerra o ProcessPoolExecutor criado pelo próprio algoritmo. Executores informados no construtor não são encerrados
+        """
+        if self._executor_proprio:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_proprio = False
+
+    def _avaliar_individuos_pendentes(self):
+        """
+        Avalia em paralelo os indivíduos cujo cromossomo foi alterado desde a última avaliação.
+        Os cromossomos são enviados aos processos como arrays de inteiros e apenas o registro de avaliação retorna
+        """
+        executor = self._get_executor()
+        lista_pendentes = [individuo for individuo in self.lista_populacao if individuo.avaliacao_pendente]
+
+        # Sem processos auxiliares os pendentes são avaliados logo em seguida, no acesso à nota
+        self.estado_execucao.qtdade_avaliacoes += len(lista_pendentes)
+
+        if executor is None or not lista_pendentes:
+            return
+
+        dados_avaliacao = DadosAvaliacaoCenario.a_partir_configuracao(self.configuracao_cenario)
+        lotes_individuos = dividir_em_lotes(lista_pendentes, self.n_workers * self.QTDADE_LOTES_POR_PROCESSO)
+        lotes_cromossomos = [compactar_lote_cromossomos(individuo.qtdades_energia for individuo in lote) for lote in lotes_individuos]
+
+        for lote, lista_avaliacoes in zip(lotes_individuos, executor.map(partial(avaliar_lote_cromossomos, dados_avaliacao), lotes_cromossomos)):
+            for individuo, (nota, ganhos, risco, estourou_limite) in zip(lote, lista_avaliacoes):
+                individuo.avaliacao = AvaliacaoIndividuo(nota_avaliacao=nota,
+                                                         ganhos_financeiro_melhor_cenario=ganhos,
+                                                         risco_financeiro_cenario=risco,
+                                                         estourou_limite_venda_energia=estourou_limite)
 
     def _avaliar_populacao(self):
+        self._avaliar_individuos_pendentes()
+
         self.lista_populacao = [individuo for individuo in self.lista_populacao if individuo.ganhos_financeiro_melhor_cenario > 0]
-        self.lista_populacao.sort(reverse=True)
+        self.lista_populacao.sort(key=attrgetter('chave_ordenacao'), reverse=True)
 
     def _selecionar_melhores_individuos(self):
         if self.lista_populacao:
             melhor_individuo_rodada = self.lista_populacao[0]
-            self._lista_melhores_individuos.append(melhor_individuo_rodada)
+            self.hall_da_fama.adicionar(melhor_individuo_rodada)
+            self._lista_notas_melhores_rodada.append(melhor_individuo_rodada.nota_avaliacao)
 
             if self.melhor_individuo is None or self.melhor_individuo < melhor_individuo_rodada:
 
                 self.melhor_individuo = melhor_individuo_rodada
 
-    def _selecao_pais(self):
-        soma_pontuacao = sum(individuo.nota_avaliacao for individuo in self.lista_populacao)
+    def _crossover(self):
+        """
+        Gera a nova população. Os melhores indivíduos (elite ou, no modo estado_estacionario, todos os que não serão substituídos)
+        são mantidos sem alteração e aproveitam a avaliação já calculada. Apenas os filhos passam pela mutação
+        """
+        qtdade_meses_ano = 12
+        lista_individuo_nova_geracao = []
 
-        pai = self._sortear_individuo(valor_sorteado=random() * soma_pontuacao)
-        mae = self._sortear_individuo(valor_sorteado=random() * soma_pontuacao)
+        qtdade_sobreviventes = self.configuracao_cenario.get_qtdade_sobreviventes()
+        lista_sobreviventes = self.lista_populacao[:qtdade_sobreviventes]
 
-        return pai, mae
+        # Índice de seleção (ex.: soma acumulada das notas) montado uma única vez por geração
+        self.estrategia_selecao.preparar(self.lista_populacao, self._rng)
 
-    def _sortear_individuo(self, valor_sorteado):
-        indice_selecionado = 0
-        aux_andamento_sorteio = 0
+        # Como é adicionado 2 filhos por rodada, a quantidade de pares é a metade da quantidade de filhos
+        qtdade_pares = round((self.configuracao_cenario.tamanho_populacao - qtdade_sobreviventes) / 2)
+        lista_pais = self.estrategia_selecao.sortear_lista_pais(qtdade_pares)
+        lista_areas_corte = np.rint(self._rng.random(qtdade_pares) * qtdade_meses_ano).astype(int).tolist()
 
-        for indice, individuo in enumerate(self.lista_populacao):
-            logging.debug('Nota do individuo: %s', individuo.nota_avaliacao)
-            logging.debug('aux_andamento_sorteio: %s', aux_andamento_sorteio)
+        for (pai, mae), area_corte_cromosso_individuo in zip(lista_pais, lista_areas_corte):
+            qtdades_filho1, qtdades_filho2 = crossover_ponto_unico(pai.qtdades_energia, mae.qtdades_energia, area_corte_cromosso_individuo)
 
-            if aux_andamento_sorteio < valor_sorteado:
-                aux_andamento_sorteio +=  individuo.nota_avaliacao
-                indice_selecionado = indice
-            else:
-                break
+            filho1 = Individuo.criar_a_partir_qtdades(self.configuracao_cenario, qtdades_filho1, geracao=pai.geracao+1)
+            filho2 = Individuo.criar_a_partir_qtdades(self.configuracao_cenario, qtdades_filho2, geracao=pai.geracao+1)
+
+            lista_individuo_nova_geracao.append(filho1)
+            lista_individuo_nova_geracao.append(filho2)
         
-        # Logica para priorizar os primeiros individuos da lista pois são esses que possuem o melhor resultado esperado (menor pontuação)
-        # Queremos obter o menor valor possível
-        indice_selecionado = (len(self.lista_populacao) - 1) - indice_selecionado
-        individuo_sorteado = self.lista_populacao[indice_selecionado]
+        self._lista_novos_individuos = lista_individuo_nova_geracao
+        self.lista_populacao = lista_sobreviventes + lista_individuo_nova_geracao
+        self._avaliar_populacao()
 
-        logging.debug('Indice individuo selecionado: %s', indice_selecionado)
+    def _mutacao_gene(self):
+        vetor_sorteio_mutacao = self._rng.random(len(self._lista_novos_individuos)) < self.configuracao_cenario.taxa_mutacao
 
-        return individuo_sorteado
+        for individuo, sofre_mutacao in zip(self._lista_novos_individuos, vetor_sorteio_mutacao.tolist()):
+            if sofre_mutacao:
+                self._mutar_individuo(individuo)
 
+    def _mutar_individuo(self, individuo: Individuo):
+        qtdades = individuo.qtdades_energia
+        valor_sorteado_posicao, valor_sorteado_mutacao, valor_sorteado_operacao = self._rng.random(3).tolist()
 
+        posicao_gene_mutacao = round(valor_sorteado_posicao * (len(qtdades) - 1))
 
-    def _crossover(self):
-        qtdade_meses_ano = 12
-        lista_individuo_nova_geracao = []
+        valor_antigo_gene = qtdades[posicao_gene_mutacao]
+        valor_mutacao = round(valor_antigo_gene * valor_sorteado_mutacao)
 
-        # Como é adicionado 2 filhos por rodada, o laço de repetição tem que ir até a metade do tamanho da população
-        for indice in range(round(self.configuracao_cenario.tamanho_populacao / 2)):
-            pai, mae = self._selecao_pais()
+        # Soma ou subtrai o valor da mutação com a mesma probabilidade
+        sinal_operacao = 1 if valor_sorteado_operacao < 0.5 else -1
+        individuo.definir_qtdade_energia(posicao_gene_mutacao, valor_antigo_gene + sinal_operacao * valor_mutacao)
 
-            area_corte_cromosso_individuo = round(random() * qtdade_meses_ano)
+        logging.debug('Gene %s do individuo %s sofreu mutacao', posicao_gene_mutacao, individuo)
+        logging.debug('Qtdade de energia era %s e foi para %s', valor_antigo_gene, qtdades[posicao_gene_mutacao])
 
-            filho1 = Individuo(configuracao_cenario=self.configuracao_cenario, gerar_cromossomo=False, geracao=pai.geracao+1)
-            filho2 = Individuo(configuracao_cenario=self.configuracao_cenario, gerar_cromossomo=False, geracao=pai.geracao+1)
+    def semear_populacao(self, lista_qtdades_semente: list, fracao_populacao: float = 0.2):
+        """
+        Partida quente: substitui parte da população inicial por soluções conhecidas (ex.: portfólio exportado na execução anterior
+        ou melhores indivíduos de um checkpoint). Cada solução entra uma vez sem alteração e o restante da fração é preenchido
+        com cópias perturbadas pela mutação
 
-            filho1.lista_cromossomo = copy.deepcopy(pai.lista_cromossomo[0:area_corte_cromosso_individuo] + mae.lista_cromossomo[area_corte_cromosso_individuo::])
-            filho2.lista_cromossomo = copy.deepcopy(pai.lista_cromossomo[0:area_corte_cromosso_individuo] + mae.lista_cromossomo[area_corte_cromosso_individuo::])
+        Args:
+            lista_qtdades_semente (list): quantidades de energia de cada mês das soluções conhecidas
+            fracao_populacao (float, optional): fração da população inicial substituída. Defaults to 0.2.
+        """
+        if not lista_qtdades_semente:
+            return
 
-            lista_individuo_nova_geracao.append(filho1)
-            lista_individuo_nova_geracao.append(filho2)
-        
-        self.lista_populacao = lista_individuo_nova_geracao
-        self._avaliar_populacao()
+        qtdade_individuos_semeados = min(max(len(lista_qtdades_semente), round(len(self.lista_populacao) * fracao_populacao)), len(self.lista_populacao))
 
-    def _mutacao_gene(self):
-        for individuo in self.lista_populacao:
-            if random() < self.configuracao_cenario.taxa_mutacao:
-                posicao_gene_mutacao = round(random() * (len(individuo.lista_cromossomo) - 1))
+        for indice in range(qtdade_individuos_semeados):
+            individuo = Individuo.criar_a_partir_qtdades(self.configuracao_cenario, lista_qtdades_semente[indice % len(lista_qtdades_semente)])
+
+            if indice >= len(lista_qtdades_semente):
+                self._mutar_individuo(individuo)
 
-                gene_mutacao = individuo.lista_cromossomo[posicao_gene_mutacao]
-                valor_mutacao = round(gene_mutacao.qtdade_energia_mwm_venda * random())
+            self.lista_populacao[indice] = individuo
 
-                valor_antigo_gene = gene_mutacao.qtdade_energia_mwm_venda
+        logging.info('Populacao inicial semeada com %s individuos a partir de %s solucoes conhecidas', qtdade_individuos_semeados, len(lista_qtdades_semente))
 
-                operacao_matematica_randomica = choice((add, sub))
-                gene_mutacao.qtdade_energia_mwm_venda = operacao_matematica_randomica(gene_mutacao.qtdade_energia_mwm_venda, valor_mutacao)
+    def _ajustar_individuos(self) -> int:
+        """
+        Sorteia, entre os indivíduos que ultrapassam a meta anual de venda, os que terão o cromossomo reparado
 
-                logging.debug('Gene %s do individuo %s sofreu mutacao', individuo, gene_mutacao)
-                logging.debug('Qtdade de energia era %s e foi para %s', valor_antigo_gene, gene_mutacao.qtdade_energia_mwm_venda)
+        Returns:
+            int: quantidade de indivíduos ajustados
+        """
+        self._avaliar_individuos_pendentes()
 
-    def _ajustar_individuos(self):
         lista_individuos_ajuste = [individuo for individuo in self.lista_populacao if individuo.nota_avaliacao == get_maior_nota_avaliacao_disponivel(self.configuracao_cenario.tamanho_populacao)]
 
         probabilidade_ajuste_individuo = 0.8
 
-        for individuo in lista_individuos_ajuste:
-            numero_sorteado = random()
-            
-            if numero_sorteado < probabilidade_ajuste_individuo:
-                individuo.ajustar_cromossomo()
-
-    def executar(self):
-        geracao = 0
+        vetor_sorteio_ajuste = self._rng.random(len(lista_individuos_ajuste)) < probabilidade_ajuste_individuo
+        lista_individuos_sorteados = [individuo for individuo, sorteado in zip(lista_individuos_ajuste, vetor_sorteio_ajuste.tolist()) if sorteado]
+
+        # Uma semente por geração, sorteada pelo gerador da execução. Cada indivíduo usa o gerador da sua posição entre os sorteados,
+        # portanto o ajuste é o mesmo com ou sem processos auxiliares e independe da divisão em lotes
+        semente_ajuste = int(self._rng.integers(2 ** 63))
+
+        executor = self._get_executor()
+
+        if executor is None:
+            for indice, individuo in enumerate(lista_individuos_sorteados):
+                individuo.ajustar_cromossomo(criar_gerador_individuo(semente_ajuste, indice))
+            return len(lista_individuos_sorteados)
+
+        qtdade_meses_ano = len(self.configuracao_cenario.lista_preco_pld_mes)
+        lotes_individuos = dividir_em_lotes(lista_individuos_sorteados, self.n_workers * self.QTDADE_LOTES_POR_PROCESSO)
+        lotes_cromossomos = [compactar_lote_cromossomos(individuo.qtdades_energia for individuo in lote) for lote in lotes_individuos]
+        lista_indices_iniciais = np.cumsum([0] + [len(lote) for lote in lotes_individuos[:-1]]).tolist()
+
+        for lote, lote_ajustado in zip(lotes_individuos, executor.map(partial(ajustar_lote_cromossomos, self.configuracao_cenario.meta_anual_venda_kwm, qtdade_meses_ano),
+                                                                      lotes_cromossomos, [semente_ajuste] * len(lotes_individuos), lista_indices_iniciais)):
+            for indice, individuo in enumerate(lote):
+                individuo.definir_qtdades_energia(lote_ajustado[indice * qtdade_meses_ano:(indice + 1) * qtdade_meses_ano])
+
+        return len(lista_individuos_sorteados)
+
+    def executar(self, qtdade_ilhas: int = 1, intervalo_migracao: int = 5, qtdade_migrantes: int = 3,
+                 caminho_checkpoint: str = None, intervalo_checkpoint: int = 10):
+        """
+        Executa o algoritmo genético até o melhor indivíduo ficar estagnado
+
+        Args:
+            qtdade_ilhas (int, optional): quantidade de subpopulações (ilhas), cada uma em um processo e com semente própria.
+                Com 1 (padrão) a execução ocorre no processo atual. Defaults to 1.
+            intervalo_migracao (int, optional): a cada quantas gerações as ilhas trocam seus melhores indivíduos. Defaults to 5.
+            qtdade_migrantes (int, optional): quantidade de melhores indivíduos enviados para a ilha vizinha. Defaults to 3.
+            caminho_checkpoint (str, optional): arquivo local (.npz) onde o estado da população é gravado periodicamente.
+                A execução pode ser continuada com AlgoritmoGenetico.retomar. Não utilizado no modelo de ilhas. Defaults to None.
+            intervalo_checkpoint (int, optional): a cada quantas gerações o checkpoint é gravado. Defaults to 10.
+        """
+        if qtdade_ilhas > 1:
+            self._executar_ilhas(qtdade_ilhas, intervalo_migracao, qtdade_migrantes)
+            return
+
+        try:
+            self._executar_geracoes(caminho_checkpoint, intervalo_checkpoint)
+        finally:
+            self.encerrar_executor()
+
+    def _executar_geracao(self):
+        melhor_individuo_anterior = self.melhor_individuo
+        qtdade_avaliacoes_anterior = self.estado_execucao.qtdade_avaliacoes
+
+        logging.debug("_ajustar_individuos")
+        inicio = time.perf_counter()
+        qtdade_individuos_ajustados = self._ajustar_individuos()
+        tempo_ajuste = time.perf_counter() - inicio
+
+        logging.debug("_avaliar_populacao")  
+        inicio = time.perf_counter()
+        self._avaliar_populacao()
+        tempo_avaliacao = time.perf_counter() - inicio
+        tamanho_populacao = self._get_qtdade_individuos()
+
+        logging.debug("_selecionar_melhores_individuos")
+        inicio = time.perf_counter()
+        self._selecionar_melhores_individuos()
+        tempo_selecao = time.perf_counter() - inicio
+
+        logging.debug("_crossover")
+        inicio = time.perf_counter()
+        self._crossover()
+        tempo_crossover = time.perf_counter() - inicio
+
+        logging.debug("_mutacao_gene")
+        inicio = time.perf_counter()
+        self._mutacao_gene()
+        tempo_mutacao = time.perf_counter() - inicio
+
+        nota_melhor_individuo = self.melhor_individuo.nota_avaliacao if self.melhor_individuo is not None else None
+        calcular_diversidade = self.instrumentacao.calcular_diversidade or any(criterio.requer_diversidade for criterio in self.criterios_parada)
+        diversidade = self._calcular_diversidade() if calcular_diversidade else None
+
+        self.estado_execucao.registrar_geracao(nota_melhor_individuo=nota_melhor_individuo,
+                                               houve_melhora=self.melhor_individuo is not melhor_individuo_anterior,
+                                               diversidade=diversidade)
+
+        self.instrumentacao.registrar(RegistroGeracao(geracao=self.estado_execucao.geracao,
+                                                      tempo_ajuste=tempo_ajuste,
+                                                      tempo_avaliacao=tempo_avaliacao,
+                                                      tempo_selecao=tempo_selecao,
+                                                      tempo_crossover=tempo_crossover,
+                                                      tempo_mutacao=tempo_mutacao,
+                                                      qtdade_avaliacoes=self.estado_execucao.qtdade_avaliacoes - qtdade_avaliacoes_anterior,
+                                                      qtdade_individuos_ajustados=qtdade_individuos_ajustados,
+                                                      tamanho_populacao=tamanho_populacao,
+                                                      nota_melhor_individuo=nota_melhor_individuo,
+                                                      diversidade=diversidade))
+
+    def _get_qtdade_individuos(self) -> int:
+        return len(self.lista_populacao)
+
+    def _calcular_diversidade(self) -> float:
+        """
+        Desvio padrão médio das quantidades de energia de cada mês na população, dividido pela quantidade média mensal da meta de venda
+        """
+        if not self.lista_populacao:
+            return 0.0
+
+        matriz_qtdades = np.array([individuo.qtdades_energia for individuo in self.lista_populacao])
+
+        return float(matriz_qtdades.std(axis=0).mean() / self._get_qtdade_media_energia_mes())
+
+    def _get_qtdade_media_energia_mes(self) -> float:
+        return max(self.configuracao_cenario.meta_anual_venda_kwm / len(self.configuracao_cenario.lista_preco_pld_mes), 1)
+
+    def _verificar_parada(self) -> CriterioParada:
+        """
+        Returns:
+            CriterioParada: primeiro critério de parada atingido ou None para continuar a execução
+        """
+        return next((criterio for criterio in self.criterios_parada if criterio.verificar(self.estado_execucao)), None)
+
+    def _iniciar_execucao(self):
+        """
+        Reinicia as métricas usadas pelos critérios de parada (gerações, avaliações e tempo de execução).
+        Em uma execução retomada de um checkpoint apenas o tempo de execução é reiniciado
+        """
+        if self._estado_execucao_retomado:
+            self._estado_execucao_retomado = False
+            self.estado_execucao.tempo_inicio = time.monotonic()
+            return
+
+        self.estado_execucao = EstadoExecucao()
+
+    def _executar_geracoes(self, caminho_checkpoint: str = None, intervalo_checkpoint: int = 10):
+        self._iniciar_execucao()
         
         while True:
-            logging.info('Executando a rodada/geracao %s', geracao)
+            logging.info('Executando a rodada/geracao %s', self.estado_execucao.geracao)
 
-            logging.debug("_ajustar_individuos")
-            self._ajustar_individuos()
+            self._executar_geracao()
 
-            logging.debug("_avaliar_populacao")  
-            self._avaliar_populacao()
+            criterio_atingido = self._verificar_parada()
 
-            logging.debug("_selecionar_melhores_individuos")
-            self._selecionar_melhores_individuos()
+            if caminho_checkpoint is not None and (criterio_atingido is not None or self.estado_execucao.geracao % intervalo_checkpoint == 0):
+                self.salvar_checkpoint(caminho_checkpoint)
 
-            logging.debug("_crossover")
-            self._crossover()
-
-            logging.debug("_mutacao_gene")
-            self._mutacao_gene()
-
-            if self.melhor_individuo.geracao + self.configuracao_cenario.limite_qtdade_geracoes_melhor_individuo == geracao:
-                logging.info('O melhor individuo esta a %s rodadas no top da selecao. Resolucao proplema finalizado', self.configuracao_cenario.limite_qtdade_geracoes_melhor_individuo)
+            if criterio_atingido is not None:
+                logging.info('Criterio de parada %s atingido na geracao %s apos %s avaliacoes e %.1f s. Resolucao proplema finalizado',
+                             criterio_atingido, self.estado_execucao.geracao, self.estado_execucao.qtdade_avaliacoes, self.estado_execucao.tempo_decorrido)
                 break
 
             logging.info('Geracao melhor individuo: %s. Nota: %s. Ganhos R$: %s. Risco: %s',
@@ -170,15 +409,149 @@ class AlgoritmoGenetico():
                             locale.format_string('%.2f',self.melhor_individuo.nota_avaliacao, grouping=True),
                             locale.format_string('%.2f', self.melhor_individuo.ganhos_financeiro_melhor_cenario, grouping=True),
                             locale.format_string('%.2f', self.melhor_individuo.risco_financeiro_cenario, grouping=True))
-            
-            geracao += 1
 
-    def plotar_imagem_evolucao_melhores_individuos(self):
-        lista_melhores_individuos = self.get_lista_melhores_individuos(sem_duplicidade=False)
-        lista_melhores_individuos.sort(key=lambda gene: gene.geracao)
-        lista_melhores_notas = [individuo.nota_avaliacao for individuo in lista_melhores_individuos]
+    def _get_matriz_populacao(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns:
+            tuple[np.ndarray, np.ndarray]: quantidades de energia (qtdade_individuos, 12) e geração de cada indivíduo da população
+        """
+        qtdade_meses_ano = len(self.configuracao_cenario.lista_preco_pld_mes)
+
+        matriz_populacao = np.array([individuo.qtdades_energia for individuo in self.lista_populacao], dtype=np.int64).reshape(-1, qtdade_meses_ano)
+        vetor_geracao = np.array([individuo.geracao for individuo in self.lista_populacao], dtype=np.int64)
+
+        return matriz_populacao, vetor_geracao
+
+    def _definir_matriz_populacao(self, matriz_populacao: np.ndarray, vetor_geracao: np.ndarray):
+        self.lista_populacao = [Individuo.criar_a_partir_qtdades(self.configuracao_cenario, qtdades, geracao=int(geracao))
+                                for qtdades, geracao in zip(matriz_populacao.tolist(), vetor_geracao)]
+        self._lista_novos_individuos = self.lista_populacao
+
+    def _get_estado_gerador_aleatorio(self) -> dict:
+        return self._rng.bit_generator.state
+
+    def _definir_estado_gerador_aleatorio(self, estado_gerador_aleatorio: dict):
+        self._rng.bit_generator.state = estado_gerador_aleatorio
+
+    def salvar_checkpoint(self, caminho_checkpoint: str):
+        """
+        Grava em um arquivo local o estado da execução: população, estado do gerador aleatório, métricas da execução,
+        melhores indivíduos e os dados de entrada do cenário (dispensando o acesso ao sharepoint ao retomar)
+
+        Args:
+            caminho_checkpoint (str): caminho do arquivo (.npz)
+        """
+        qtdade_meses_ano = len(self.configuracao_cenario.lista_preco_pld_mes)
+        matriz_populacao, vetor_geracao = self._get_matriz_populacao()
+        lista_melhores_individuos = self.hall_da_fama.get_lista_individuos()
+
+        salvar_checkpoint(caminho_checkpoint,
+                          matriz_populacao=matriz_populacao,
+                          vetor_geracao=vetor_geracao,
+                          matriz_melhores_individuos=np.array([individuo.qtdades_energia for individuo in lista_melhores_individuos], dtype=np.int64).reshape(-1, qtdade_meses_ano),
+                          vetor_geracao_melhores_individuos=np.array([individuo.geracao for individuo in lista_melhores_individuos], dtype=np.int64),
+                          dados={'classe_algoritmo': type(self).__name__,
+                                 'semente': self.sequencia_sementes.entropy,
+                                 'chave_derivacao_semente': list(self.sequencia_sementes.spawn_key),
+                                 'configuracao_cenario': get_parametros_configuracao_cenario(self.configuracao_cenario),
+                                 'estado_gerador_aleatorio': self._get_estado_gerador_aleatorio(),
+                                 'estado_execucao': {'geracao': self.estado_execucao.geracao,
+                                                     'geracao_ultima_melhora': self.estado_execucao.geracao_ultima_melhora,
+                                                     'qtdade_avaliacoes': self.estado_execucao.qtdade_avaliacoes,
+                                                     'lista_notas_melhor_individuo': self.estado_execucao.lista_notas_melhor_individuo},
+                                 'lista_notas_melhores_rodada': self._lista_notas_melhores_rodada,
+                                 'melhor_individuo': [list(self.melhor_individuo.qtdades_energia), self.melhor_individuo.geracao]
+                                                     if self.melhor_individuo is not None else None})
+
+        logging.info('Checkpoint da geracao %s gravado em %s', self.estado_execucao.geracao, caminho_checkpoint)
+
+    @classmethod
+    def retomar(cls, caminho_checkpoint: str, criterios_parada: list[CriterioParada] = None, **kwargs) -> 'AlgoritmoGenetico':
+        """
+        Recria o algoritmo a partir de um checkpoint gravado por salvar_checkpoint. O cenário é recriado com os dados gravados,
+        sem acessar o sharepoint, e a execução continua da geração gravada ao chamar executar
+
+        Args:
+            caminho_checkpoint (str): caminho do arquivo (.npz)
+            criterios_parada (list[CriterioParada], optional): critérios de parada. Defaults to critérios da configuração do cenário.
+            **kwargs: demais parâmetros do construtor (ex.: n_workers, estrategia_selecao)
+
+        Returns:
+            AlgoritmoGenetico: algoritmo pronto para continuar a execução
+        """
+        dados = carregar_checkpoint(caminho_checkpoint)
+
+        if dados['classe_algoritmo'] != cls.__name__:
+            raise ValueError(f'Checkpoint gravado por {dados["classe_algoritmo"]} não pode ser retomado por {cls.__name__}')
+
+        configuracao_cenario = ConfiguracaoCenario(**dados['configuracao_cenario'], carregar_dados_sharepoint=False)
+
+        semente = np.random.SeedSequence(dados['semente'], spawn_key=tuple(dados['chave_derivacao_semente']))
+
+        algoritmo = cls(configuracao_cenario.ano_simulacao, configuracao_cenario=configuracao_cenario, semente=semente,
+                        criterios_parada=criterios_parada, **kwargs)
+        algoritmo._restaurar_checkpoint(dados)
+
+        return algoritmo
+
+    def _restaurar_checkpoint(self, dados: dict):
+        self._definir_matriz_populacao(dados['matriz_populacao'], dados['vetor_geracao'])
+        self._definir_estado_gerador_aleatorio(dados['estado_gerador_aleatorio'])
+
+        for qtdades, geracao in zip(dados['matriz_melhores_individuos'].tolist(), dados['vetor_geracao_melhores_individuos']):
+            self.hall_da_fama.adicionar(Individuo.criar_a_partir_qtdades(self.configuracao_cenario, qtdades, geracao=int(geracao)))
+
+        if dados['melhor_individuo'] is not None:
+            qtdades, geracao = dados['melhor_individuo']
+            self.melhor_individuo = Individuo.criar_a_partir_qtdades(self.configuracao_cenario, qtdades, geracao=geracao)
+
+        self._lista_notas_melhores_rodada = dados['lista_notas_melhores_rodada']
+        self.estado_execucao = EstadoExecucao(**dados['estado_execucao'])
+        self._estado_execucao_retomado = True
+
+    def _obter_emigrantes(self, qtdade_migrantes: int) -> list[list[int]]:
+        """
+        Quantidades de energia dos melhores indivíduos da população atual, enviados para a ilha vizinha
+        """
+        return [list(individuo.qtdades_energia) for individuo in self.lista_populacao[:qtdade_migrantes]]
+
+    def _receber_migrantes(self, lista_qtdades: list, geracao: int):
+        """
+        Substitui os piores indivíduos da população pelos migrantes vindos de outra ilha
+        """
+        if not lista_qtdades:
+            return
+
+        lista_migrantes = [Individuo.criar_a_partir_qtdades(self.configuracao_cenario, qtdades, geracao=geracao) for qtdades in lista_qtdades]
+
+        self.lista_populacao[-len(lista_migrantes):] = lista_migrantes
+
+    def _get_parametros_ilha(self) -> dict:
+        """
+        Parâmetros do construtor repassados para os algoritmos de cada ilha (além de cenário e semente)
+        """
+        return {'estrategia_selecao': self.estrategia_selecao, 'criterios_parada': self.criterios_parada}
+
+    def _executar_ilhas(self, qtdade_ilhas: int, intervalo_migracao: int, qtdade_migrantes: int):
+        """
+        Modelo de ilhas: cada ilha roda em um processo próprio e, a cada intervalo_migracao gerações, envia seus melhores
+        indivíduos para a ilha vizinha (topologia em anel) através de um buffer em memória compartilhada.
+        Ao final, os melhores indivíduos de todas as ilhas são reunidos neste objeto
+        """
+        lista_resultados = executar_modelo_ilhas(classe_algoritmo=type(self),
+                                                 configuracao_cenario=self.configuracao_cenario,
+                                                 lista_sementes=self.sequencia_sementes.spawn(qtdade_ilhas),
+                                                 intervalo_migracao=max(1, intervalo_migracao),
+                                                 qtdade_migrantes=qtdade_migrantes,
+                                                 parametros_algoritmo=self._get_parametros_ilha())
+
+        for qtdades, geracao in lista_resultados:
+            self.hall_da_fama.adicionar(Individuo.criar_a_partir_qtdades(self.configuracao_cenario, qtdades, geracao=geracao))
+
+        self.melhor_individuo = next(iter(self.hall_da_fama.get_lista_individuos()), None)
 
-        plt.plot(lista_melhores_notas)
+    def plotar_imagem_evolucao_melhores_individuos(self):
+        plt.plot(self.get_lista_notas_melhores_rodada())
         
         plt.title("Acompanhamento das melhores notas")
         plt.xlabel('Geração')
@@ -0,0 +1,256 @@
+import logging
+from concurrent.futures import Executor
+import numpy as np
+from carteira_energia.entidades.algoritmo_genetico import AlgoritmoGenetico
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario, MODO_INICIALIZACAO_SIMPLEX
+from carteira_energia.entidades.individuo import Individuo
+from carteira_energia.selecao.estrategias_selecao import EstrategiaSelecao
+from carteira_energia.util.instrumentacao import InstrumentacaoExecucao
+from carteira_energia.parada.criterios_parada import CriterioParada
+from carteira_energia.operadores.inicializacao import gerar_matriz_qtdades_simplex
+from carteira_energia.operadores.reparo import calcular_reducao_proporcional_populacao
+from carteira_energia.formulas.formulas_agoritmo_genetico import calcular_ganhos_riscos, calcular_notas_populacao
+from carteira_energia.util.utilidades import get_maior_nota_avaliacao_disponivel
+
+class AlgoritmoGeneticoVetorizado(AlgoritmoGenetico):
+    """
+    Motor alternativo do algoritmo genético onde toda a população é representada por uma única matriz de inteiros
+    com dimensão (tamanho_populacao, 12). Cada linha da matriz é o cromossomo de um indivíduo.
+
+    Nota, ganhos e riscos de todos os indivíduos são calculados em uma única passada matriz-vetor por geração.
+    Os melhores indivíduos de cada rodada continuam sendo representados pela classe Individuo, mantendo a compatibilidade
+    com as rotinas de exportação.
+    """
+
+    def __init__(self, ano_simulacao: int, n_workers: int = 1, executor: Executor = None, estrategia_selecao: EstrategiaSelecao = None,
+                 configuracao_cenario: ConfiguracaoCenario = None, semente: int | np.random.SeedSequence = 146,
+                 criterios_parada: list[CriterioParada] = None, instrumentacao: InstrumentacaoExecucao = None) -> None:
+        """
+        Mesmos parâmetros de AlgoritmoGenetico. Como a avaliação e o ajuste já são vetorizados, n_workers e executor não são utilizados
+        """
+        if n_workers > 1 or executor is not None:
+            logging.warning('O algoritmo genetico vetorizado nao utiliza processos auxiliares: n_workers e executor serao ignorados')
+
+        super().__init__(ano_simulacao=ano_simulacao,
+                         n_workers=1,
+                         estrategia_selecao=estrategia_selecao,
+                         configuracao_cenario=configuracao_cenario,
+                         semente=semente,
+                         criterios_parada=criterios_parada,
+                         instrumentacao=instrumentacao)
+
+    def _gerar_populacao_inicial(self):
+        qtdade_meses_ano = len(self.configuracao_cenario.lista_preco_pld_mes)
+        if self.configuracao_cenario.modo_inicializacao == MODO_INICIALIZACAO_SIMPLEX:
+            self.matriz_populacao = gerar_matriz_qtdades_simplex(self.configuracao_cenario.tamanho_populacao, qtdade_meses_ano,
+                                                                 self.configuracao_cenario.meta_anual_venda_kwm, self._rng)
+        else:
+            self.matriz_populacao = np.rint(self._rng.random((self.configuracao_cenario.tamanho_populacao, qtdade_meses_ano))
+                                            * self.configuracao_cenario.meta_anual_venda_kwm).astype(np.int64)
+        self.vetor_geracao = np.zeros(self.configuracao_cenario.tamanho_populacao, dtype=np.int64)
+        # Marca os indivíduos mantidos sem alteração da geração anterior (elite), que não passam pela mutação
+        self.vetor_sobrevivente = np.zeros(self.configuracao_cenario.tamanho_populacao, dtype=bool)
+        logging.info("Gerando população inicial. Quantidade de individuos: %s", len(self.matriz_populacao))
+
+        self._reiniciar_avaliacao()
+
+    def _reiniciar_avaliacao(self):
+        """
+        Descarta as avaliações calculadas: todas as linhas da matriz da população serão avaliadas na próxima geração
+        """
+        # Linhas novas ou alteradas (filhos, mutação, ajuste, migrantes) desde a última avaliação. As demais linhas mantêm a posição
+        # da última avaliação e reaproveitam nota, ganhos e riscos já calculados (equivalente a Individuo.avaliacao_pendente)
+        self.vetor_avaliacao_pendente = np.ones(len(self.matriz_populacao), dtype=bool)
+
+        self._vetor_notas = np.empty(0)
+        self._vetor_ganhos = np.empty(0)
+        self._vetor_riscos = np.empty(0)
+
+    def _calcular_avaliacao_populacao(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Avalia apenas as linhas pendentes. Os sobreviventes sem alteração mantêm nota, ganhos e riscos da geração anterior
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: notas, ganhos e riscos de todas as linhas da matriz da população
+        """
+        indices_pendentes = np.flatnonzero(self.vetor_avaliacao_pendente)
+        matriz_pendentes = self.matriz_populacao[indices_pendentes]
+
+        self.estado_execucao.qtdade_avaliacoes += len(indices_pendentes)
+
+        vetor_ganhos_pendentes, vetor_riscos_pendentes = calcular_ganhos_riscos(matriz_pendentes,
+                                                                                self.configuracao_cenario.vetor_coeficientes_ganhos,
+                                                                                self.configuracao_cenario.vetor_coeficientes_riscos)
+
+        vetor_notas_pendentes = calcular_notas_populacao(vetor_ganhos=vetor_ganhos_pendentes,
+                                                         vetor_riscos=vetor_riscos_pendentes,
+                                                         vetor_qtdade_energia=matriz_pendentes.sum(axis=1),
+                                                         verec=self.configuracao_cenario.volume_financeiro_meta_ganhos,
+                                                         riskppd=self.configuracao_cenario.volume_financeiro_risco_anual,
+                                                         w1=self.configuracao_cenario.w1_penalizacao_desvio_negativo,
+                                                         meta_anual_venda_kwm=self.configuracao_cenario.meta_anual_venda_kwm,
+                                                         nota_maxima=get_maior_nota_avaliacao_disponivel(self.configuracao_cenario.tamanho_populacao))
+
+        # Linhas já avaliadas continuam na mesma posição da última avaliação
+        indices_avaliados = np.flatnonzero(~self.vetor_avaliacao_pendente)
+        lista_vetores = []
+        for vetor_anterior, vetor_pendentes in ((self._vetor_notas, vetor_notas_pendentes),
+                                                (self._vetor_ganhos, vetor_ganhos_pendentes),
+                                                (self._vetor_riscos, vetor_riscos_pendentes)):
+            vetor = np.empty(len(self.matriz_populacao))
+            vetor[indices_avaliados] = vetor_anterior[indices_avaliados]
+            vetor[indices_pendentes] = vetor_pendentes
+            lista_vetores.append(vetor)
+
+        return tuple(lista_vetores)
+
+    def _avaliar_populacao(self):
+        vetor_notas, vetor_ganhos, vetor_riscos = self._calcular_avaliacao_populacao()
+
+        # Mesma ordem de Individuo.__lt__: menor nota, maior ganho e menor risco primeiro
+        indices_validos = np.flatnonzero(vetor_ganhos > 0)
+        ordem = indices_validos[np.lexsort((vetor_riscos[indices_validos], -vetor_ganhos[indices_validos], vetor_notas[indices_validos]))]
+
+        self.matriz_populacao = self.matriz_populacao[ordem]
+        self.vetor_geracao = self.vetor_geracao[ordem]
+        self.vetor_sobrevivente = self.vetor_sobrevivente[ordem]
+        self.vetor_avaliacao_pendente = np.zeros(len(ordem), dtype=bool)
+        self._vetor_notas = vetor_notas[ordem]
+        self._vetor_ganhos = vetor_ganhos[ordem]
+        self._vetor_riscos = vetor_riscos[ordem]
+
+    def _criar_individuo(self, indice: int) -> Individuo:
+        return Individuo.criar_a_partir_qtdades(self.configuracao_cenario, self.matriz_populacao[indice].tolist(), geracao=int(self.vetor_geracao[indice]))
+
+    def _selecionar_melhores_individuos(self):
+        if len(self.matriz_populacao):
+            melhor_individuo_rodada = self._criar_individuo(0)
+            self.hall_da_fama.adicionar(melhor_individuo_rodada)
+            self._lista_notas_melhores_rodada.append(melhor_individuo_rodada.nota_avaliacao)
+
+            if self.melhor_individuo is None or self.melhor_individuo < melhor_individuo_rodada:
+                self.melhor_individuo = melhor_individuo_rodada
+
+    def _selecao_pais(self, qtdade_pares: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Sorteia, pela estratégia de seleção do algoritmo, os índices dos pais e mães de todos os pares de uma só vez
+
+        Args:
+            qtdade_pares (int, optional): quantidade de pares que serão sorteados. Defaults to 1.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: índices dos pais e das mães na matriz da população (vazios quando a população está vazia)
+        """
+        self.estrategia_selecao.preparar_indices(len(self.matriz_populacao), self._vetor_notas, self._rng)
+        matriz_indices = self.estrategia_selecao.sortear_matriz_indices_pais(qtdade_pares)
+
+        return matriz_indices[:, 0], matriz_indices[:, 1]
+
+    def _crossover(self):
+        qtdade_meses_ano = self.matriz_populacao.shape[1]
+        qtdade_sobreviventes = min(self.configuracao_cenario.get_qtdade_sobreviventes(), len(self.matriz_populacao))
+        qtdade_pares = round((self.configuracao_cenario.tamanho_populacao - qtdade_sobreviventes) / 2)
+
+        indices_pais, indices_maes = self._selecao_pais(qtdade_pares)
+        qtdade_pares = len(indices_pais)
+
+        area_corte_cromossomo = np.rint(self._rng.random(qtdade_pares) * qtdade_meses_ano)
+        mascara_genes_pai = np.arange(qtdade_meses_ano) < area_corte_cromossomo[:, np.newaxis]
+
+        matriz_pais = self.matriz_populacao[indices_pais]
+        matriz_maes = self.matriz_populacao[indices_maes]
+
+        filhos1 = np.where(mascara_genes_pai, matriz_pais, matriz_maes)
+        filhos2 = np.where(mascara_genes_pai, matriz_maes, matriz_pais)
+
+        geracao_filhos = self.vetor_geracao[indices_pais] + 1
+
+        self.matriz_populacao = np.concatenate((self.matriz_populacao[:qtdade_sobreviventes], filhos1, filhos2))
+        self.vetor_geracao = np.concatenate((self.vetor_geracao[:qtdade_sobreviventes], geracao_filhos, geracao_filhos))
+        self.vetor_sobrevivente = np.arange(len(self.matriz_populacao)) < qtdade_sobreviventes
+        # Os sobreviventes continuam nas primeiras linhas e reaproveitam a avaliação; apenas os filhos são avaliados
+        self.vetor_avaliacao_pendente = ~self.vetor_sobrevivente
+        self._avaliar_populacao()
+
+    def _mutacao_gene(self):
+        qtdade_individuos, qtdade_meses_ano = self.matriz_populacao.shape
+
+        indices_mutacao = np.flatnonzero((self._rng.random(qtdade_individuos) < self.configuracao_cenario.taxa_mutacao) & ~self.vetor_sobrevivente)
+
+        self._mutar_linhas(indices_mutacao)
+
+    def _mutar_linhas(self, indices_mutacao: np.ndarray):
+        qtdade_meses_ano = self.matriz_populacao.shape[1]
+
+        posicoes_gene = np.rint(self._rng.random(len(indices_mutacao)) * (qtdade_meses_ano - 1)).astype(np.int64)
+
+        valores_antigos = self.matriz_populacao[indices_mutacao, posicoes_gene]
+        valores_mutacao = np.rint(valores_antigos * self._rng.random(len(indices_mutacao))).astype(np.int64)
+        sinal_operacao = self._rng.choice((1, -1), size=len(indices_mutacao))
+
+        self.matriz_populacao[indices_mutacao, posicoes_gene] = valores_antigos + sinal_operacao * valores_mutacao
+        self.vetor_avaliacao_pendente[indices_mutacao] = True
+
+        logging.debug('%s individuos sofreram mutacao', len(indices_mutacao))
+
+    def semear_populacao(self, lista_qtdades_semente: list, fracao_populacao: float = 0.2):
+        if not lista_qtdades_semente:
+            return
+
+        qtdade_individuos_semeados = min(max(len(lista_qtdades_semente), round(len(self.matriz_populacao) * fracao_populacao)), len(self.matriz_populacao))
+
+        indices_sementes = np.arange(qtdade_individuos_semeados) % len(lista_qtdades_semente)
+        self.matriz_populacao[:qtdade_individuos_semeados] = np.asarray(lista_qtdades_semente, dtype=np.int64)[indices_sementes]
+        self.vetor_geracao[:qtdade_individuos_semeados] = 0
+        self.vetor_avaliacao_pendente[:qtdade_individuos_semeados] = True
+
+        self._mutar_linhas(np.arange(len(lista_qtdades_semente), qtdade_individuos_semeados))
+
+        logging.info('Populacao inicial semeada com %s individuos a partir de %s solucoes conhecidas', qtdade_individuos_semeados, len(lista_qtdades_semente))
+
+    def _ajustar_individuos(self) -> int:
+        probabilidade_ajuste_individuo = 0.8
+
+        vetor_excesso = self.matriz_populacao.sum(axis=1) - self.configuracao_cenario.meta_anual_venda_kwm
+        indices_ajuste = np.flatnonzero((vetor_excesso > 0) & (self._rng.random(len(vetor_excesso)) < probabilidade_ajuste_individuo))
+
+        # Remove o excesso de todos os indivíduos de uma só vez, proporcionalmente às quantidades, sem deixar nenhum gene negativo
+        self.matriz_populacao[indices_ajuste] -= calcular_reducao_proporcional_populacao(self.matriz_populacao[indices_ajuste],
+                                                                                        self.configuracao_cenario.meta_anual_venda_kwm,
+                                                                                        self._rng)
+        self.vetor_avaliacao_pendente[indices_ajuste] = True
+
+        return len(indices_ajuste)
+
+    def _obter_emigrantes(self, qtdade_migrantes: int) -> list[list[int]]:
+        return self.matriz_populacao[:qtdade_migrantes].tolist()
+
+    def _receber_migrantes(self, lista_qtdades: list, geracao: int):
+        if not lista_qtdades:
+            return
+
+        qtdade_migrantes = min(len(lista_qtdades), len(self.matriz_populacao))
+
+        self.matriz_populacao[-qtdade_migrantes:] = lista_qtdades[:qtdade_migrantes]
+        self.vetor_geracao[-qtdade_migrantes:] = geracao
+        self.vetor_sobrevivente[-qtdade_migrantes:] = False
+        self.vetor_avaliacao_pendente[-qtdade_migrantes:] = True
+
+    def _calcular_diversidade(self) -> float:
+        if not len(self.matriz_populacao):
+            return 0.0
+
+        return float(self.matriz_populacao.std(axis=0).mean() / self._get_qtdade_media_energia_mes())
+
+    def _get_qtdade_individuos(self) -> int:
+        return len(self.matriz_populacao)
+
+    def _get_matriz_populacao(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.matriz_populacao, self.vetor_geracao
+
+    def _definir_matriz_populacao(self, matriz_populacao: np.ndarray, vetor_geracao: np.ndarray):
+        self.matriz_populacao = np.asarray(matriz_populacao, dtype=np.int64)
+        self.vetor_geracao = np.asarray(vetor_geracao, dtype=np.int64)
+        self.vetor_sobrevivente = np.zeros(len(self.matriz_populacao), dtype=bool)
+        self._reiniciar_avaliacao()
+
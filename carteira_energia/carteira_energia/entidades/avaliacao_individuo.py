@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class AvaliacaoIndividuo():
+    """
+    Registro imutável com o resultado da avaliação de um indivíduo.
+    É calculado uma única vez e reaproveitado até que a quantidade de energia de algum gene seja alterada
+    """
+    nota_avaliacao: float
+    ganhos_financeiro_melhor_cenario: float
+    risco_financeiro_cenario: float
+    estourou_limite_venda_energia: bool
+
+    @property
+    def chave_ordenacao(self) -> tuple:
+        """
+        Chave utilizada na ordenação dos indivíduos. Quanto maior a chave, melhor o indivíduo:
+        menor nota, maior ganho financeiro e menor risco
+        """
+        return (-self.nota_avaliacao, self.ganhos_financeiro_melhor_cenario, -self.risco_financeiro_cenario)
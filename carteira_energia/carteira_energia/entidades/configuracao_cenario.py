@@ -1,10 +1,20 @@
-from dataclasses import dataclass, field
-from carteira_energia.formulas.formulas_agoritmo_genetico import calcular_variavel_prisco
+import numpy as np
+from dataclasses import dataclass, field, InitVar
+from carteira_energia.formulas.formulas_agoritmo_genetico import calcular_vetor_coeficientes
+from carteira_energia.util.utilidades import get_qtdade_horas_ano
+from carteira_energia.entidades.cromossomo import TabelaMesesCenario
+from carteira_energia.dao.fonte_cenario import DadosCenario, FonteCenario, FonteCenarioSharepoint
 from carteira_energia.sharepoint.gerenciador_dados_sharepoint import GerenciadorArquivosSharepointPortifolioRecomendacao, GerenciadorArquivosPLDSharepoint
 
-MSG_ERRO_CENARIO_P75_VAZIO = 'Não foi encontrado valores para o cenário pencentil 75'
+MODO_SUBSTITUICAO_GERACIONAL = 'geracional'
+MODO_SUBSTITUICAO_ESTADO_ESTACIONARIO = 'estado_estacionario'
 
-MSG_ERRO_CENARIO_MEDIA_VAZIO = 'Não foi encontrado valores de média dos cenários para O preço PLD'
+MSG_ERRO_MODO_SUBSTITUICAO = 'Modo de substituição da população inválido. Valores aceitos: geracional ou estado_estacionario'
+
+MODO_INICIALIZACAO_SIMPLEX = 'simplex'
+MODO_INICIALIZACAO_UNIFORME = 'uniforme'
+
+MSG_ERRO_MODO_INICIALIZACAO = 'Modo de inicialização da população inválido. Valores aceitos: simplex ou uniforme'
 @dataclass
 class ConfiguracaoCenario():
     """
@@ -21,6 +31,35 @@ class ConfiguracaoCenario():
 
     - lista_risco_mes: lista contendo a representação do risco de cada mês
 
+    - qtdade_elite: quantidade de melhores indivíduos copiados sem alteração (sem crossover e sem mutação) para a próxima geração
+
+    - modo_substituicao: geracional (toda a população é substituída pelos filhos, exceto a elite) ou estado_estacionario
+    (a cada geração apenas a fração fracao_substituicao com os piores indivíduos é substituída)
+
+    - fracao_substituicao: fração da população substituída a cada geração no modo estado_estacionario
+
+    - modo_inicializacao: simplex (cromossomos iniciais sorteados uniformemente entre as alocações cuja soma é igual à meta anual,
+    sem indivíduos inviáveis) ou uniforme (cada mês sorteado entre 0 e a meta anual, como nas versões anteriores)
+
+    - limite_tempo_execucao_segundos / limite_qtdade_geracoes: limites opcionais da execução do algoritmo, somados ao critério de
+    estagnação (limite_qtdade_geracoes_melhor_individuo). Garantem um tempo máximo para as execuções agendadas
+
+    - horizonte: qual ano à frente (A+1, A+2, ...) deve ser obtido do sharepoint (metas e previsões de PLD)
+
+    - qtdade_horas_ano: quantidade de horas do ano, calculada uma única vez na criação do cenário
+
+    - vetor_coeficientes_ganhos / vetor_coeficientes_riscos: preço PLD e risco de cada mês multiplicados pelas horas do ano
+    (vetores somente leitura usados na avaliação dos cromossomos)
+
+    Parâmetros de inicialização (não armazenados):
+    - fonte_cenario: origem das metas, de lista_preco_pld_mes e de lista_risco_mes (FonteCenarioSharepoint, FonteCenarioArquivo
+    ou FonteCenarioMemoria). Quando informada substitui os valores passados diretamente e dispensa o acesso ao sharepoint
+
+    - carregar_dados_sharepoint: sem fonte_cenario, quando False os dados do cenário devem ser informados diretamente
+    (metas, lista_preco_pld_mes e lista_risco_mes) e quando True são obtidos do sharepoint
+
+    - sharepoint_portfolio_recomendacao / sharepoint_pld: gerenciadores do sharepoint já autenticados, reaproveitados entre vários cenários
+
     """
     
     ano_simulacao: int
@@ -33,33 +72,107 @@ class ConfiguracaoCenario():
 
     tamanho_populacao: int = 1000
     limite_qtdade_geracoes_melhor_individuo: int = 5
+    limite_tempo_execucao_segundos: float = None
+    limite_qtdade_geracoes: int = None
     
     w1_penalizacao_desvio_negativo: int = 0.6
 
     taxa_mutacao: float = 0.15
 
-    def __post_init__(self):
-        sharepoint_portfolio_recomendacao = GerenciadorArquivosSharepointPortifolioRecomendacao()
-        sharepoint_pld = GerenciadorArquivosPLDSharepoint()
+    qtdade_elite: int = 0
+    modo_substituicao: str = MODO_SUBSTITUICAO_GERACIONAL
+    fracao_substituicao: float = 0.2
+    modo_inicializacao: str = MODO_INICIALIZACAO_SIMPLEX
+
+    horizonte: int = 1
+
+    carregar_dados_sharepoint: InitVar[bool] = True
+    sharepoint_portfolio_recomendacao: InitVar[GerenciadorArquivosSharepointPortifolioRecomendacao] = None
+    sharepoint_pld: InitVar[GerenciadorArquivosPLDSharepoint] = None
+    fonte_cenario: InitVar[FonteCenario] = None
+
+    qtdade_horas_ano: int = field(default=None, init=False, repr=False, compare=False)
+
+    _tabela_meses: TabelaMesesCenario = field(default=None, init=False, repr=False, compare=False)
+    _vetor_coeficientes_ganhos: np.ndarray = field(default=None, init=False, repr=False, compare=False)
+    _vetor_coeficientes_riscos: np.ndarray = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, nome: str, valor) -> None:
+        super().__setattr__(nome, valor)
+
+        # Dados mensais alterados após a criação (ex.: nos testes) invalidam a tabela e os coeficientes compartilhados
+        if nome in ('lista_preco_pld_mes', 'lista_risco_mes', 'qtdade_horas_ano'):
+            object.__setattr__(self, '_tabela_meses', None)
+            object.__setattr__(self, '_vetor_coeficientes_ganhos', None)
+            object.__setattr__(self, '_vetor_coeficientes_riscos', None)
+
+    @property
+    def tabela_meses(self) -> TabelaMesesCenario:
+        """
+        Tabela com o preço PLD e o risco de cada mês, compartilhada por todos os cromossomos do cenário
+        """
+        if self._tabela_meses is None:
+            self._tabela_meses = TabelaMesesCenario(self.lista_preco_pld_mes, self.lista_risco_mes)
+
+        return self._tabela_meses
+
+    @property
+    def vetor_coeficientes_ganhos(self) -> np.ndarray:
+        if self._vetor_coeficientes_ganhos is None:
+            self._vetor_coeficientes_ganhos = calcular_vetor_coeficientes(self.lista_preco_pld_mes, self.qtdade_horas_ano)
+
+        return self._vetor_coeficientes_ganhos
+
+    @property
+    def vetor_coeficientes_riscos(self) -> np.ndarray:
+        if self._vetor_coeficientes_riscos is None:
+            self._vetor_coeficientes_riscos = calcular_vetor_coeficientes(self.lista_risco_mes, self.qtdade_horas_ano)
+
+        return self._vetor_coeficientes_riscos
+
+    def __post_init__(self, carregar_dados_sharepoint: bool, sharepoint_portfolio_recomendacao: GerenciadorArquivosSharepointPortifolioRecomendacao,
+                      sharepoint_pld: GerenciadorArquivosPLDSharepoint, fonte_cenario: FonteCenario):
+        self.qtdade_horas_ano = get_qtdade_horas_ano()
+
+        if self.modo_substituicao not in (MODO_SUBSTITUICAO_GERACIONAL, MODO_SUBSTITUICAO_ESTADO_ESTACIONARIO):
+            raise ValueError(MSG_ERRO_MODO_SUBSTITUICAO)
+
+        if self.modo_inicializacao not in (MODO_INICIALIZACAO_SIMPLEX, MODO_INICIALIZACAO_UNIFORME):
+            raise ValueError(MSG_ERRO_MODO_INICIALIZACAO)
+
+        if fonte_cenario is None:
+            if not carregar_dados_sharepoint:
+                return
+
+            fonte_cenario = FonteCenarioSharepoint(sharepoint_portfolio_recomendacao=sharepoint_portfolio_recomendacao, sharepoint_pld=sharepoint_pld)
 
-        dataframe_informacoes_meta_anual = sharepoint_portfolio_recomendacao.get_dataframe_portfolio_ano()
-        self.meta_anual_venda_kwm = dataframe_informacoes_meta_anual['Meta (MWmédio)'][0]
-        self.volume_financeiro_meta_ganhos = dataframe_informacoes_meta_anual['VE Fat (R$^6)'][0] * 1000000
-        self.volume_financeiro_risco_anual = dataframe_informacoes_meta_anual['RISK A (R$^6)'][0] * 1000000
+        self.definir_dados_cenario(fonte_cenario.get_dados_cenario(ano_simulacao=self.ano_simulacao, horizonte=self.horizonte))
 
-        dataframe_media_previsao_preco_pld = sharepoint_pld.get_dataframe_media_meses_ano()
-        dataframe_preco_cenarios_pld = sharepoint_pld.get_valores_pld_cenario('P75')
+    def definir_dados_cenario(self, dados_cenario: DadosCenario) -> None:
+        self.meta_anual_venda_kwm = dados_cenario.meta_anual_venda_kwm
+        self.volume_financeiro_meta_ganhos = dados_cenario.volume_financeiro_meta_ganhos
+        self.volume_financeiro_risco_anual = dados_cenario.volume_financeiro_risco_anual
+        self.lista_preco_pld_mes = list(dados_cenario.lista_preco_pld_mes)
+        self.lista_risco_mes = list(dados_cenario.lista_risco_mes)
 
-        self._validar_dataframe_coluna_vazia(dataframe=dataframe_preco_cenarios_pld, msg=MSG_ERRO_CENARIO_P75_VAZIO)
-        self._validar_dataframe_coluna_vazia(dataframe=dataframe_media_previsao_preco_pld, msg=MSG_ERRO_CENARIO_MEDIA_VAZIO)
+    def get_dados_cenario(self) -> DadosCenario:
+        """
+        Dados de entrada do cenário, permitindo gravá-los localmente (FonteCenarioArquivo.salvar_dados_cenario) para execuções sem rede
+        """
+        return DadosCenario(meta_anual_venda_kwm=self.meta_anual_venda_kwm,
+                            volume_financeiro_meta_ganhos=self.volume_financeiro_meta_ganhos,
+                            volume_financeiro_risco_anual=self.volume_financeiro_risco_anual,
+                            lista_preco_pld_mes=list(self.lista_preco_pld_mes),
+                            lista_risco_mes=list(self.lista_risco_mes))
 
-        dataframe_valor_risco_mes = calcular_variavel_prisco(dataframe_cenarios_pld=dataframe_preco_cenarios_pld,
-                                                             dataframe_preco_pld_medio_mes=dataframe_media_previsao_preco_pld,
-                                                             ano_simulacao=self.ano_simulacao)
+    def get_qtdade_sobreviventes(self) -> int:
+        """
+        Quantidade de melhores indivíduos mantidos sem alteração de uma geração para a outra (elite ou, no modo estado_estacionario,
+        toda a parte da população que não é substituída)
+        """
+        qtdade_sobreviventes = 0
 
-        self.lista_preco_pld_mes = dataframe_media_previsao_preco_pld['VALOR'].to_list()
-        self.lista_risco_mes = dataframe_valor_risco_mes['VALOR_RISCO'].to_list()
+        if self.modo_substituicao == MODO_SUBSTITUICAO_ESTADO_ESTACIONARIO:
+            qtdade_sobreviventes = self.tamanho_populacao - round(self.tamanho_populacao * self.fracao_substituicao)
 
-    def _validar_dataframe_coluna_vazia(self, dataframe, nome_coluna: str = 'VALOR', msg: str = 'Coluna VALOR está vazia'):
-        if dataframe[nome_coluna].isnull().any():
-            raise ValueError(msg)
+        return min(max(qtdade_sobreviventes, self.qtdade_elite), self.tamanho_populacao)
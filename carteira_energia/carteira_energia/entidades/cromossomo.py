@@ -0,0 +1,127 @@
+from array import array
+
+MSG_ERRO_QTDADE_NAO_INTEIRA = 'Quantidade de energia do gene deve ser um número inteiro: {}'
+
+def _converter_qtdade(qtdade) -> int:
+    """
+    Converte para int valores inteiros de outros tipos (ex.: 3.0 lido do Excel pelo pandas ou numpy.int64)
+
+    Raises:
+        ValueError: quando o valor não é um número inteiro
+    """
+    if isinstance(qtdade, int):
+        return qtdade
+
+    try:
+        qtdade_inteira = int(qtdade)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(MSG_ERRO_QTDADE_NAO_INTEIRA.format(repr(qtdade))) from None
+
+    if qtdade_inteira != qtdade:
+        raise ValueError(MSG_ERRO_QTDADE_NAO_INTEIRA.format(repr(qtdade)))
+
+    return qtdade_inteira
+
+class TabelaMesesCenario():
+    """
+    Dados imutáveis de cada mês do cenário (preço PLD e risco).
+    Uma única tabela é compartilhada por todos os cromossomos de um mesmo ConfiguracaoCenario
+    """
+    __slots__ = ('lista_preco_pld_mes', 'lista_risco_mes')
+
+    def __init__(self, lista_preco_pld_mes, lista_risco_mes) -> None:
+        self.lista_preco_pld_mes = tuple(lista_preco_pld_mes)
+        self.lista_risco_mes = tuple(lista_risco_mes)
+
+    def __len__(self) -> int:
+        return len(self.lista_preco_pld_mes)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TabelaMesesCenario) \
+                and self.lista_preco_pld_mes == other.lista_preco_pld_mes \
+                and self.lista_risco_mes == other.lista_risco_mes
+
+    __hash__ = None
+
+class CromossomoCompacto():
+    """
+    Cromossomo do indivíduo armazenando apenas a quantidade de energia vendida em cada mês (array de inteiros).
+    Preço PLD e risco de cada mês ficam na TabelaMesesCenario compartilhada.
+
+    Mantém os totais (energia, quantidade x preço PLD e quantidade x risco) atualizados a cada alteração de gene,
+    permitindo avaliar o indivíduo sem somar novamente os 12 meses
+    """
+    __slots__ = ('_qtdades', 'tabela_meses', 'soma_qtdade_energia', 'soma_qtdade_preco_pld', 'soma_qtdade_risco')
+
+    def __init__(self, qtdades, tabela_meses: TabelaMesesCenario) -> None:
+        self.tabela_meses = tabela_meses
+        self.qtdades = qtdades
+
+    @property
+    def qtdades(self) -> array:
+        return self._qtdades
+
+    @qtdades.setter
+    def qtdades(self, qtdades) -> None:
+        lista_qtdades = qtdades if isinstance(qtdades, (array, list, tuple)) else list(qtdades)
+
+        try:
+            self._qtdades = array('i', lista_qtdades)
+        except TypeError:
+            # Apenas inteiros são aceitos diretamente pelo array: demais tipos são convertidos (ou rejeitados) gene a gene
+            self._qtdades = array('i', (_converter_qtdade(qtdade) for qtdade in lista_qtdades))
+
+        self._recalcular_totais()
+
+    def _recalcular_totais(self) -> None:
+        self.soma_qtdade_energia = sum(self._qtdades)
+        self.soma_qtdade_preco_pld = sum(qtdade * preco_pld for qtdade, preco_pld in zip(self._qtdades, self.tabela_meses.lista_preco_pld_mes))
+        self.soma_qtdade_risco = sum(qtdade * risco for qtdade, risco in zip(self._qtdades, self.tabela_meses.lista_risco_mes))
+
+    def definir_qtdade(self, indice_gene: int, qtdade: int) -> None:
+        """
+        Altera a quantidade de energia de um gene atualizando os totais apenas com a diferença (O(1))
+        """
+        qtdade = _converter_qtdade(qtdade)
+        delta = qtdade - self._qtdades[indice_gene]
+
+        self._qtdades[indice_gene] = qtdade
+        self.soma_qtdade_energia += delta
+        self.soma_qtdade_preco_pld += delta * self.tabela_meses.lista_preco_pld_mes[indice_gene]
+        self.soma_qtdade_risco += delta * self.tabela_meses.lista_risco_mes[indice_gene]
+
+    def __len__(self) -> int:
+        return len(self._qtdades)
+
+    def somar_qtdade_energia(self) -> int:
+        return self.soma_qtdade_energia
+
+class GeneCromossomo():
+    """
+    Visão de um gene do CromossomoCompacto com a mesma interface de GeneRepresentacaoMes.
+    Alterar qtdade_energia_mwm_venda grava diretamente no cromossomo do indivíduo (e descarta a sua avaliação)
+    """
+    __slots__ = ('_individuo', 'sequencia_mes')
+
+    def __init__(self, individuo, sequencia_mes: int) -> None:
+        self._individuo = individuo
+        self.sequencia_mes = sequencia_mes
+
+    @property
+    def preco_pld(self):
+        return self._individuo.cromossomo.tabela_meses.lista_preco_pld_mes[self.sequencia_mes]
+
+    @property
+    def risco(self):
+        return self._individuo.cromossomo.tabela_meses.lista_risco_mes[self.sequencia_mes]
+
+    @property
+    def qtdade_energia_mwm_venda(self) -> int:
+        return self._individuo.cromossomo.qtdades[self.sequencia_mes]
+
+    @qtdade_energia_mwm_venda.setter
+    def qtdade_energia_mwm_venda(self, valor: int) -> None:
+        self._individuo.definir_qtdade_energia(self.sequencia_mes, valor)
+
+    def __repr__(self) -> str:
+        return f'GeneCromossomo(sequencia_mes={self.sequencia_mes}, preco_pld={self.preco_pld}, risco={self.risco}, qtdade_energia_mwm_venda={self.qtdade_energia_mwm_venda})'
@@ -0,0 +1,71 @@
+import heapq
+from itertools import count
+from carteira_energia.entidades.individuo import Individuo
+
+class HallDaFama():
+    """
+    Guarda os melhores indivíduos encontrados durante a execução do algoritmo genético.
+
+    - Indivíduos com as mesmas quantidades de energia em todos os meses são considerados duplicados e descartados na inserção (O(1))
+    - Apenas os *capacidade* melhores indivíduos são mantidos, portanto a memória não cresce com a quantidade de gerações.
+    O pior indivíduo guardado fica no topo de um heap e é substituído quando chega um indivíduo melhor (O(log capacidade))
+    - É guardada uma cópia de cada indivíduo: o heap e as chaves de duplicidade são calculados na inserção e não podem mudar
+    caso o indivíduo da população seja alterado depois (ex.: ajuste do cromossomo dos sobreviventes)
+    """
+
+    def __init__(self, capacidade: int = 100) -> None:
+        """
+        Args:
+            capacidade (int, optional): quantidade máxima de indivíduos guardados. Defaults to 100.
+        """
+        self.capacidade = capacidade
+
+        # Heap de (chave_ordenacao, contador, chave_cromossomo, individuo): o menor elemento é o pior indivíduo guardado
+        self._heap_individuos = []
+        self._set_chaves_cromossomo = set()
+        self._contador = count()
+
+    @staticmethod
+    def _get_chave_cromossomo(individuo: Individuo) -> tuple:
+        return tuple(individuo.qtdades_energia)
+
+    def adicionar(self, individuo: Individuo) -> bool:
+        """
+        Adiciona uma cópia do indivíduo caso ele ainda não esteja guardado e esteja entre os melhores
+
+        Args:
+            individuo (Individuo): indivíduo candidato
+
+        Returns:
+            bool: True se o indivíduo foi guardado
+        """
+        chave_cromossomo = self._get_chave_cromossomo(individuo)
+
+        if chave_cromossomo in self._set_chaves_cromossomo:
+            return False
+
+        item = (individuo.chave_ordenacao, next(self._contador), chave_cromossomo, individuo.copiar())
+
+        if len(self._heap_individuos) < self.capacidade:
+            heapq.heappush(self._heap_individuos, item)
+        elif item[0] > self._heap_individuos[0][0]:
+            _, _, chave_cromossomo_removido, _ = heapq.heapreplace(self._heap_individuos, item)
+            self._set_chaves_cromossomo.discard(chave_cromossomo_removido)
+        else:
+            return False
+
+        self._set_chaves_cromossomo.add(chave_cromossomo)
+
+        return True
+
+    def get_lista_individuos(self) -> list[Individuo]:
+        """
+        Indivíduos guardados, do melhor para o pior
+        """
+        return [item[3] for item in sorted(self._heap_individuos, key=lambda item: (item[0], -item[1]), reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap_individuos)
+
+    def __contains__(self, individuo: Individuo) -> bool:
+        return self._get_chave_cromossomo(individuo) in self._set_chaves_cromossomo
@@ -1,83 +1,215 @@
-import random
+from array import array
+import numpy as np
 #import sys
 # import import_ipynb
-from carteira_energia.formulas.formulas_agoritmo_genetico import calcular_variavel_dsva, calcular_variavel_rppda, calcular_funcao_minimizar_riscos_compra_energia
-from dataclasses import dataclass, field
+from carteira_energia.formulas.formulas_agoritmo_genetico import calcular_funcao_minimizar_riscos_compra_energia
 from carteira_energia.entidades.gene_representacao_mes import GeneRepresentacaoMes
-from carteira_energia.util.utilidades import somar_qtdade_energia_cromossomos, get_qtdade_horas_ano, get_maior_nota_avaliacao_disponivel
-from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
+from carteira_energia.entidades.avaliacao_individuo import AvaliacaoIndividuo
+from carteira_energia.entidades.cromossomo import CromossomoCompacto, GeneCromossomo, TabelaMesesCenario
+from carteira_energia.operadores.inicializacao import gerar_qtdades_simplex
+from carteira_energia.operadores.reparo import calcular_reducao_proporcional
+from carteira_energia.util.utilidades import get_maior_nota_avaliacao_disponivel
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario, MODO_INICIALIZACAO_SIMPLEX
 
-@dataclass
 class Individuo:
     """
     Classe representando o indivíduo do algoritmo genético
     O indivíduo representa uma possível resposta para o nosso problema.
-    
-    A propriedade *lista_cromossomo* é uma lista de 12 elementos onde cada indice representa a sugestão de compra ou venda de energia para um determinado mês
+
+    O cromossomo é um CromossomoCompacto: 12 inteiros onde cada indice representa a sugestão de compra ou venda de energia para um determinado mês.
+    Preço PLD e risco de cada mês são compartilhados através da tabela de meses do ConfiguracaoCenario.
+
+    A propriedade *lista_cromossomo* expõe o mesmo cromossomo como uma lista de genes (GeneCromossomo), mantendo a interface de GeneRepresentacaoMes
     """
+    __slots__ = ('configuracao_cenario', 'geracao', 'cromossomo', '_avaliacao', '_estourou_limite_venda_energia')
+
+    def __init__(self, configuracao_cenario: ConfiguracaoCenario, geracao: int = 0, lista_cromossomo: list[GeneRepresentacaoMes] = None,
+                 gerar_cromossomo: bool = True, rng: np.random.Generator = None) -> None:
+        self.configuracao_cenario = configuracao_cenario
+        self.geracao = geracao
+        self.cromossomo = CromossomoCompacto((), configuracao_cenario.tabela_meses)
+        self._avaliacao = None
+        self._estourou_limite_venda_energia = False
+
+        if lista_cromossomo:
+            self.lista_cromossomo = lista_cromossomo
+        elif gerar_cromossomo:
+            self._gerar_cromossomo_aleatorio(rng if rng is not None else np.random.default_rng())
+
+    def _gerar_cromossomo_aleatorio(self, rng: np.random.Generator):
+        qtdade_meses_ano = len(self.configuracao_cenario.lista_preco_pld_mes)
 
-    configuracao_cenario: ConfiguracaoCenario = field(repr=False)
-    _estourou_limite_venda_energia: bool = field(default=False, repr=False)
-    nota_maxima_individuo_rodada: int = field(default=0, repr=False)
-    geracao: int = field(default=0, repr=False)
-    lista_cromossomo: list[GeneRepresentacaoMes] = field(default_factory=list)
-    gerar_cromossomo: bool = field(default=True, repr=False)
+        if self.configuracao_cenario.modo_inicializacao == MODO_INICIALIZACAO_SIMPLEX:
+            self.definir_qtdades_energia(gerar_qtdades_simplex(qtdade_meses_ano, self.configuracao_cenario.meta_anual_venda_kwm, rng))
+            return
 
-    def __post_init__(self):
-        self._gerar_cromossomo_aleatorio()
+        self.definir_qtdades_energia(np.rint(rng.random(qtdade_meses_ano) * self.configuracao_cenario.meta_anual_venda_kwm).astype(int).tolist())
 
-    def _gerar_cromossomo_aleatorio(self):
-        qtdade_meses_ano = len(self.configuracao_cenario.lista_preco_pld_mes)
+    @classmethod
+    def criar_a_partir_qtdades(cls, configuracao_cenario: ConfiguracaoCenario, qtdades, geracao: int = 0) -> 'Individuo':
+        """
+        Cria um indivíduo a partir das quantidades de energia de cada mês (ex.: filhos gerados no crossover).
+        Apenas os inteiros são armazenados; preço PLD e risco vêm da tabela de meses do cenário
+
+        Args:
+            configuracao_cenario (ConfiguracaoCenario): configuração do cenário
+            qtdades (Sequence[int]): quantidade de energia de cada mês
+            geracao (int, optional): geração do indivíduo. Defaults to 0.
+
+        Returns:
+            Individuo: novo indivíduo
+        """
+        individuo = cls(configuracao_cenario=configuracao_cenario, gerar_cromossomo=False, geracao=geracao)
+        individuo.definir_qtdades_energia(qtdades)
+
+        return individuo
+
+    def copiar(self) -> 'Individuo':
+        """
+        Cria uma cópia com cromossomo próprio, mantendo a avaliação já calculada.
+        Alterações posteriores no indivíduo original (ex.: ajuste do cromossomo) não afetam a cópia
+
+        Returns:
+            Individuo: cópia do indivíduo
+        """
+        copia = Individuo(configuracao_cenario=self.configuracao_cenario, gerar_cromossomo=False, geracao=self.geracao)
+        copia.cromossomo = CromossomoCompacto(self.cromossomo.qtdades, self.cromossomo.tabela_meses)
+        copia._avaliacao = self._avaliacao
+        copia._estourou_limite_venda_energia = self._estourou_limite_venda_energia
+
+        return copia
+
+    @property
+    def lista_cromossomo(self) -> list[GeneCromossomo]:
+        return [GeneCromossomo(self, mes) for mes in range(len(self.cromossomo))]
 
-        if self.gerar_cromossomo:
-            for mes in range(qtdade_meses_ano):
-                qtdade_energia_mwm_vendida_mes = round(random.random() * self.configuracao_cenario.meta_anual_venda_kwm)
-                
-                gene = GeneRepresentacaoMes(sequencia_mes=mes,
-                                            preco_pld=self.configuracao_cenario.lista_preco_pld_mes[mes],
-                                            risco=self.configuracao_cenario.lista_risco_mes[mes],
-                                            qtdade_energia_mwm_venda=qtdade_energia_mwm_vendida_mes)
+    @lista_cromossomo.setter
+    def lista_cromossomo(self, lista_genes: list) -> None:
+        """
+        Substitui o cromossomo a partir de uma lista de genes (GeneRepresentacaoMes ou GeneCromossomo).
+        Caso o preço PLD ou o risco dos genes seja diferente do cenário, uma tabela de meses própria é criada
+        """
+        tabela_meses = TabelaMesesCenario([gene.preco_pld for gene in lista_genes], [gene.risco for gene in lista_genes])
 
-                self.lista_cromossomo.append(gene)
+        if tabela_meses == self.configuracao_cenario.tabela_meses:
+            tabela_meses = self.configuracao_cenario.tabela_meses
+
+        self.cromossomo = CromossomoCompacto((gene.qtdade_energia_mwm_venda for gene in lista_genes), tabela_meses)
+        self.invalidar_avaliacao()
+
+    def invalidar_avaliacao(self) -> None:
+        """
+        Descarta a avaliação memorizada. Deve ser chamado sempre que a quantidade de energia de algum gene for alterada
+        """
+        self._avaliacao = None
 
     @property
-    def nota_avaliacao(self):
-        self.verificar_estouro_limite_qtdade_energia()
-        
-        if not self._estourou_limite_venda_energia:
-            valor_dsva = calcular_variavel_dsva(self.configuracao_cenario.volume_financeiro_meta_ganhos, self.lista_cromossomo)
-            valor_rppda = calcular_variavel_rppda(self.configuracao_cenario.volume_financeiro_risco_anual, self.lista_cromossomo)
-
-            return calcular_funcao_minimizar_riscos_compra_energia(w1=self.configuracao_cenario.w1_penalizacao_desvio_negativo,
-                                                                   dsva=valor_dsva,
-                                                                   w2=1-self.configuracao_cenario.w1_penalizacao_desvio_negativo,
-                                                                   rppda=valor_rppda)
+    def avaliacao(self) -> AvaliacaoIndividuo:
+        """
+        Avaliação do indivíduo (nota, ganhos, risco e estouro da meta). É calculada apenas quando o cromossomo foi alterado
+        """
+        if self._avaliacao is None:
+            self._avaliacao = self._calcular_avaliacao()
+
+        return self._avaliacao
+
+    @avaliacao.setter
+    def avaliacao(self, avaliacao: AvaliacaoIndividuo) -> None:
+        self._avaliacao = avaliacao
+
+    @property
+    def avaliacao_pendente(self) -> bool:
+        return self._avaliacao is None
+
+    @property
+    def qtdades_energia(self) -> array:
+        """
+        Quantidade de energia de cada gene (array de inteiros do próprio cromossomo).
+        Não deve ser alterado diretamente: utilize definir_qtdade_energia/definir_qtdades_energia
+        """
+        return self.cromossomo.qtdades
+
+    def definir_qtdade_energia(self, indice_gene: int, qtdade: int) -> None:
+        self.cromossomo.definir_qtdade(indice_gene, qtdade)
+        self.invalidar_avaliacao()
+
+    def definir_qtdades_energia(self, qtdades) -> None:
+        """
+        Atualiza a quantidade de energia de cada gene a partir de uma sequência de inteiros
+
+        Args:
+            qtdades (Sequence[int]): quantidades de energia, uma para cada gene do cromossomo
+        """
+        self.cromossomo.qtdades = qtdades
+        self.invalidar_avaliacao()
+
+    def _calcular_avaliacao(self) -> AvaliacaoIndividuo:
+        qtdade_horas_ano = self.configuracao_cenario.qtdade_horas_ano
+
+        # Totais mantidos pelo cromossomo a cada alteração de gene (ver CromossomoCompacto.definir_qtdade)
+        ganhos_financeiro_melhor_cenario = self.cromossomo.soma_qtdade_preco_pld * qtdade_horas_ano
+        risco_financeiro_cenario = self.cromossomo.soma_qtdade_risco * qtdade_horas_ano
+        estourou_limite_venda_energia = self.cromossomo.soma_qtdade_energia > self.configuracao_cenario.meta_anual_venda_kwm
+
+        if not estourou_limite_venda_energia:
+            # Dsv_a e Rppd_a (ver calcular_variavel_dsva e calcular_variavel_rppda) a partir das somas já calculadas
+            valor_dsva = max(self.configuracao_cenario.volume_financeiro_meta_ganhos - ganhos_financeiro_melhor_cenario, 0)
+            valor_rppda = max(risco_financeiro_cenario - self.configuracao_cenario.volume_financeiro_risco_anual, 0)
+
+            nota_avaliacao = calcular_funcao_minimizar_riscos_compra_energia(w1=self.configuracao_cenario.w1_penalizacao_desvio_negativo,
+                                                                             dsva=valor_dsva,
+                                                                             w2=1-self.configuracao_cenario.w1_penalizacao_desvio_negativo,
+                                                                             rppda=valor_rppda)
         else:
-            return get_maior_nota_avaliacao_disponivel(self.configuracao_cenario.tamanho_populacao)
-    
+            nota_avaliacao = get_maior_nota_avaliacao_disponivel(self.configuracao_cenario.tamanho_populacao)
+
+        return AvaliacaoIndividuo(nota_avaliacao=nota_avaliacao,
+                                  ganhos_financeiro_melhor_cenario=ganhos_financeiro_melhor_cenario,
+                                  risco_financeiro_cenario=risco_financeiro_cenario,
+                                  estourou_limite_venda_energia=estourou_limite_venda_energia)
+
+    @property
+    def nota_avaliacao(self):
+        return self.avaliacao.nota_avaliacao
+
     @property
     def ganhos_financeiro_melhor_cenario(self):
-        return sum(gene.qtdade_energia_mwm_venda * gene.preco_pld * get_qtdade_horas_ano() for gene in self.lista_cromossomo)
+        return self.avaliacao.ganhos_financeiro_melhor_cenario
 
     @property
     def risco_financeiro_cenario(self):
-        return sum(gene.qtdade_energia_mwm_venda * gene.risco * get_qtdade_horas_ano() for gene in self.lista_cromossomo)
+        return self.avaliacao.risco_financeiro_cenario
+
+    @property
+    def chave_ordenacao(self) -> tuple:
+        """
+        Chave pré-calculada para ordenação (list.sort(key=...)), evitando os métodos de comparação
+        """
+        return self.avaliacao.chave_ordenacao
 
     def verificar_estouro_limite_qtdade_energia(self):
-        self._estourou_limite_venda_energia = somar_qtdade_energia_cromossomos(self.lista_cromossomo) > self.configuracao_cenario.meta_anual_venda_kwm
+        self._estourou_limite_venda_energia = self.avaliacao.estourou_limite_venda_energia
 
         return self._estourou_limite_venda_energia
-        
 
-    def ajustar_cromossomo(self):
+
+    def ajustar_cromossomo(self, rng: np.random.Generator = None):
         """
-        Ajusta a valor de venda de energia dos genes para que a soma anual não ultrapasse a meta de venda
-        """        
-        while somar_qtdade_energia_cromossomos(self.lista_cromossomo) > self.configuracao_cenario.meta_anual_venda_kwm:
-            posicao_cromossomo_ajuste = round(random.random() * (len(self.lista_cromossomo) - 1))
-            
-            if self.lista_cromossomo[posicao_cromossomo_ajuste].qtdade_energia_mwm_venda > 0:
-                self.lista_cromossomo[posicao_cromossomo_ajuste].qtdade_energia_mwm_venda -= 1
+        Ajusta a valor de venda de energia dos genes para que a soma anual não ultrapasse a meta de venda.
+        O excesso é calculado uma única vez e retirado dos genes proporcionalmente (ver calcular_reducao_proporcional)
+
+        Args:
+            rng (np.random.Generator, optional): gerador de números aleatórios da execução. Defaults to um novo gerador sem semente.
+        """
+        if self.cromossomo.soma_qtdade_energia <= self.configuracao_cenario.meta_anual_venda_kwm:
+            return
+
+        lista_reducao = calcular_reducao_proporcional(self.cromossomo.qtdades, self.configuracao_cenario.meta_anual_venda_kwm, rng)
+
+        self.definir_qtdades_energia(qtdade - reducao for qtdade, reducao in zip(self.cromossomo.qtdades, lista_reducao))
+
+    def __repr__(self) -> str:
+        return f'Individuo(qtdades_energia={list(self.cromossomo.qtdades)}, geracao={self.geracao})'
 
     def __gt__(self, other: object) -> bool:
         return not self.__eq__(other) and not self.__lt__(other)
@@ -95,16 +227,10 @@ class Individuo:
         Returns:
             bool: True se é menor
         """
-               
-        if self.nota_avaliacao == other.nota_avaliacao:
-            if self.ganhos_financeiro_melhor_cenario == other.ganhos_financeiro_melhor_cenario:
-                return self.risco_financeiro_cenario > other.risco_financeiro_cenario
-
-            return self.ganhos_financeiro_melhor_cenario < other.ganhos_financeiro_melhor_cenario
 
-        return self.nota_avaliacao > other.nota_avaliacao
+        return self.chave_ordenacao < other.chave_ordenacao
 
     def __eq__(self, other: object) -> bool:
-        return self.nota_avaliacao == other.nota_avaliacao \
-                and self.ganhos_financeiro_melhor_cenario == other.ganhos_financeiro_melhor_cenario \
-                and self.risco_financeiro_cenario == other.risco_financeiro_cenario
+        return self.chave_ordenacao == other.chave_ordenacao
+
+    __hash__ = None
@@ -1,4 +1,5 @@
 from typing import List
+import numpy as np
 from pandas import DataFrame
 from carteira_energia.util.utilidades import get_qtdade_horas_ano
 from carteira_energia.entidades.gene_representacao_mes import GeneRepresentacaoMes
@@ -61,6 +62,67 @@ def calcular_variavel_rppda(riskppd: float, lista_cromossomo: List[GeneRepresent
 
     return max(soma_multiplicacao_prisco_qcm - riskppd, 0)
 
+def calcular_vetor_coeficientes(lista_valores_mes: list, qtdade_horas_ano: int = QTDADE_HORAS_ANO) -> np.ndarray:
+    """
+    Vetor de coeficientes de um cenário: valor de cada mês (preço PLD ou risco) multiplicado pelas horas do ano.
+    O vetor retornado é somente leitura para poder ser compartilhado
+
+    Args:
+        lista_valores_mes (list): preço PLD ou risco de cada mês
+        qtdade_horas_ano (int, optional): quantidade de horas do ano. Defaults to QTDADE_HORAS_ANO.
+
+    Returns:
+        np.ndarray: coeficientes de cada mês
+    """
+    vetor_coeficientes = np.asarray(lista_valores_mes, dtype=float) * qtdade_horas_ano
+    vetor_coeficientes.flags.writeable = False
+
+    return vetor_coeficientes
+
+def calcular_ganhos_riscos(qtdades, vetor_coeficientes_ganhos: np.ndarray, vetor_coeficientes_riscos: np.ndarray) -> tuple:
+    """
+    Ganhos financeiros (sum QC_m * PV_m) e riscos (sum Prisco_m * QC_m) como dois produtos escalares contra os coeficientes do cenário
+    (ver ConfiguracaoCenario.vetor_coeficientes_ganhos e vetor_coeficientes_riscos)
+
+    Args:
+        qtdades (np.ndarray): quantidades de energia de um cromossomo (12,) ou de um lote de cromossomos (n, 12)
+        vetor_coeficientes_ganhos (np.ndarray): preço PLD de cada mês multiplicado pelas horas do ano
+        vetor_coeficientes_riscos (np.ndarray): risco de cada mês multiplicado pelas horas do ano
+
+    Returns:
+        tuple: ganhos e riscos. Valores escalares para um cromossomo ou vetores para um lote
+    """
+    matriz_qtdades = np.asarray(qtdades)
+
+    return matriz_qtdades @ vetor_coeficientes_ganhos, matriz_qtdades @ vetor_coeficientes_riscos
+
+def calcular_notas_populacao(vetor_ganhos: np.ndarray, vetor_riscos: np.ndarray, vetor_qtdade_energia: np.ndarray,
+                             verec: float, riskppd: float, w1: float, meta_anual_venda_kwm: int, nota_maxima: float) -> np.ndarray:
+    """
+    Versão vetorizada da nota do indivíduo: w_1 * Dsv_a + w_2 * Rppd_a para toda a população de uma só vez.
+    Indivíduos cuja soma de energia ultrapassa a meta anual recebem a nota máxima (pior nota possível)
+
+    Args:
+        vetor_ganhos (np.ndarray): ganhos financeiros de cada indivíduo (sum QC_m * PV_m)
+        vetor_riscos (np.ndarray): risco financeiro de cada indivíduo (sum Prisco_m * QC_m)
+        vetor_qtdade_energia (np.ndarray): soma anual da energia vendida por cada indivíduo
+        verec (float): valor esperado pela diretoria referente a receita
+        riskppd (float): risco máximo ao faturamento aceito pela diretoria
+        w1 (float): penalização atribuída a desvios negativos. w2 é obtido por 1 - w1
+        meta_anual_venda_kwm (int): meta anual de venda de energia
+        nota_maxima (float): nota atribuída aos indivíduos que ultrapassaram a meta de venda
+
+    Returns:
+        np.ndarray: vetor com a nota de cada indivíduo
+    """
+
+    vetor_dsva = np.maximum(verec - vetor_ganhos, 0)
+    vetor_rppda = np.maximum(vetor_riscos - riskppd, 0)
+
+    vetor_notas = calcular_funcao_minimizar_riscos_compra_energia(w1=w1, dsva=vetor_dsva, w2=1 - w1, rppda=vetor_rppda)
+
+    return np.where(vetor_qtdade_energia > meta_anual_venda_kwm, nota_maxima, vetor_notas)
+
 def calcular_variavel_prisco(dataframe_preco_pld_medio_mes: DataFrame, dataframe_cenarios_pld: DataFrame, ano_simulacao: int) -> DataFrame:
     """
     Calculo da variável Prisco
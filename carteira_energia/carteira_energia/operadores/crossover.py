@@ -0,0 +1,21 @@
+""" Operadores de crossover que trabalham diretamente sobre as quantidades de energia dos cromossomos """
+
+from array import array
+
+def crossover_ponto_unico(qtdades_pai: array, qtdades_mae: array, area_corte_cromossomo: int) -> tuple[array, array]:
+    """
+    Crossover de ponto único. Os filhos são montados apenas fatiando e concatenando os arrays de quantidades dos pais,
+    sem copiar os dados de PLD e risco de cada mês (que são compartilhados através do ConfiguracaoCenario)
+
+    Args:
+        qtdades_pai (array): quantidades de energia de cada gene do pai
+        qtdades_mae (array): quantidades de energia de cada gene da mãe
+        area_corte_cromossomo (int): posição do corte. Genes anteriores ao corte vêm do pai (filho 1) ou da mãe (filho 2)
+
+    Returns:
+        tuple[array, array]: quantidades de energia dos dois filhos
+    """
+    qtdades_filho1 = qtdades_pai[:area_corte_cromossomo] + qtdades_mae[area_corte_cromossomo:]
+    qtdades_filho2 = qtdades_mae[:area_corte_cromossomo] + qtdades_pai[area_corte_cromossomo:]
+
+    return qtdades_filho1, qtdades_filho2
@@ -0,0 +1,42 @@
+""" Operadores de inicialização: sorteiam cromossomos viáveis, cuja soma das quantidades de energia é igual à meta anual de venda """
+
+import numpy as np
+
+def gerar_qtdades_simplex(qtdade_meses_ano: int, meta_anual_venda_kwm: int, rng: np.random.Generator) -> list[int]:
+    """
+    Sorteia as quantidades de energia de cada mês uniformemente entre todas as alocações inteiras não negativas cuja soma
+    é igual à meta (método "estrelas e barras": qtdade_meses_ano - 1 barras dividem as unidades da meta entre os meses)
+
+    Args:
+        qtdade_meses_ano (int): quantidade de genes do cromossomo
+        meta_anual_venda_kwm (int): meta anual de venda de energia
+        rng (np.random.Generator): gerador de números aleatórios
+
+    Returns:
+        list[int]: quantidade de energia de cada mês
+    """
+    # A meta lida do sharepoint pode não ser inteira: apenas a parte inteira é distribuída
+    qtdade_posicoes = int(meta_anual_venda_kwm) + qtdade_meses_ano - 1
+
+    # Posições das barras; as estrelas entre duas barras consecutivas são a quantidade do mês
+    lista_barras = [-1] + sorted(rng.choice(qtdade_posicoes, size=qtdade_meses_ano - 1, replace=False).tolist()) + [qtdade_posicoes]
+
+    return [barra - barra_anterior - 1 for barra_anterior, barra in zip(lista_barras[:-1], lista_barras[1:])]
+
+def gerar_matriz_qtdades_simplex(qtdade_individuos: int, qtdade_meses_ano: int, meta_anual_venda_kwm: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Versão vetorizada de gerar_qtdades_simplex. Uma distribuição de Dirichlet com todos os parâmetros iguais a 1 seguida de uma
+    multinomial (Dirichlet-multinomial) produz a mesma distribuição uniforme sobre as alocações
+
+    Args:
+        qtdade_individuos (int): quantidade de cromossomos (linhas da matriz)
+        qtdade_meses_ano (int): quantidade de genes do cromossomo
+        meta_anual_venda_kwm (int): meta anual de venda de energia
+        rng (np.random.Generator): gerador de números aleatórios
+
+    Returns:
+        np.ndarray: matriz (qtdade_individuos, qtdade_meses_ano) com as quantidades de energia
+    """
+    matriz_proporcoes = rng.dirichlet(np.ones(qtdade_meses_ano), size=qtdade_individuos)
+
+    return rng.multinomial(int(meta_anual_venda_kwm), matriz_proporcoes).astype(np.int64)
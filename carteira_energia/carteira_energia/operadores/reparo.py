@@ -0,0 +1,77 @@
+""" Operadores de reparo: retiram o excesso de energia dos cromossomos que ultrapassam a meta anual de venda """
+
+import math
+
+import numpy as np
+
+def calcular_reducao_proporcional(qtdades, meta_anual_venda_kwm: int, rng: np.random.Generator = None) -> list[int]:
+    """
+    Calcula, em uma única passada, quanto deve ser retirado de cada gene para que a soma fique igual à meta.
+
+    O excesso é distribuído proporcionalmente à quantidade de cada gene. As sobras do arredondamento (menos de uma
+    unidade por gene) são sorteadas por amostragem sistemática, de forma que cada unidade de energia tenha a mesma
+    chance de ser retirada. Nenhum gene fica negativo
+
+    Args:
+        qtdades (Sequence[int]): quantidade de energia de cada gene
+        meta_anual_venda_kwm (int): meta anual de venda de energia
+        rng (np.random.Generator, optional): gerador de números aleatórios. Defaults to um novo gerador sem semente.
+
+    Returns:
+        list[int]: quantidade a ser retirada de cada gene
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+
+    soma_qtdade_energia = sum(qtdades)
+    # A meta lida do sharepoint pode não ser inteira: apenas a parte inteira é atingida, mantendo as reduções inteiras
+    excesso = soma_qtdade_energia - math.floor(meta_anual_venda_kwm)
+
+    if excesso <= 0:
+        return [0] * len(qtdades)
+
+    if excesso >= soma_qtdade_energia:
+        return list(qtdades)
+
+    lista_reducao = []
+    resto_acumulado = 0
+    qtdade_sorteios_anteriores = 0
+    # Ponto de partida da amostragem sistemática sobre os restos da divisão
+    inicio_sorteio = int(rng.integers(soma_qtdade_energia))
+
+    for qtdade in qtdades:
+        reducao, resto = divmod(excesso * qtdade, soma_qtdade_energia)
+
+        resto_acumulado += resto
+        qtdade_sorteios = -(-(resto_acumulado - inicio_sorteio) // soma_qtdade_energia) if resto_acumulado > inicio_sorteio else 0
+
+        lista_reducao.append(reducao + qtdade_sorteios - qtdade_sorteios_anteriores)
+        qtdade_sorteios_anteriores = qtdade_sorteios
+
+    return lista_reducao
+
+def calcular_reducao_proporcional_populacao(matriz_qtdades: np.ndarray, meta_anual_venda_kwm: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Versão vetorizada de calcular_reducao_proporcional para todas as linhas (cromossomos) de uma matriz
+
+    Args:
+        matriz_qtdades (np.ndarray): matriz (qtdade_individuos, 12) com as quantidades de energia
+        meta_anual_venda_kwm (int): meta anual de venda de energia
+        rng (np.random.Generator): gerador de números aleatórios
+
+    Returns:
+        np.ndarray: matriz com a quantidade a ser retirada de cada gene (zero nas linhas que não ultrapassam a meta)
+    """
+    vetor_soma = matriz_qtdades.sum(axis=1)
+    # A meta lida do sharepoint pode não ser inteira: apenas a parte inteira é atingida, mantendo as reduções inteiras
+    vetor_excesso = np.clip(vetor_soma - math.floor(meta_anual_venda_kwm), 0, vetor_soma)
+    vetor_divisor = np.maximum(vetor_soma, 1)[:, np.newaxis]
+
+    matriz_reducao, matriz_resto = np.divmod(matriz_qtdades * vetor_excesso[:, np.newaxis], vetor_divisor)
+
+    matriz_resto_acumulado = np.cumsum(matriz_resto, axis=1)
+    vetor_inicio_sorteio = rng.integers(0, vetor_divisor)
+    matriz_sorteios = np.where(matriz_resto_acumulado > vetor_inicio_sorteio,
+                               -((vetor_inicio_sorteio - matriz_resto_acumulado) // vetor_divisor),
+                               0)
+
+    return matriz_reducao + np.diff(matriz_sorteios, axis=1, prepend=0)
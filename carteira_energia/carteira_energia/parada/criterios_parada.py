@@ -0,0 +1,152 @@
+""" Critérios de parada do algoritmo genético. A execução termina quando qualquer um dos critérios configurados é atingido """
+
+import time
+from dataclasses import dataclass, field
+
+@dataclass
+class EstadoExecucao():
+    """
+    Métricas da execução atualizadas a cada geração e consultadas pelos critérios de parada
+
+    - geracao: quantidade de gerações executadas
+    - geracao_ultima_melhora: geração em que o melhor indivíduo foi realmente substituído por um melhor
+    (diferente de Individuo.geracao, que é herdada do pai no crossover)
+    - qtdade_avaliacoes: quantidade de indivíduos avaliados (cálculo da nota)
+    - lista_notas_melhor_individuo: nota do melhor indivíduo ao final de cada geração
+    - diversidade: diversidade da população na última geração (calculada apenas quando algum critério precisa dela)
+    """
+    geracao: int = 0
+    geracao_ultima_melhora: int = 0
+    qtdade_avaliacoes: int = 0
+    lista_notas_melhor_individuo: list[float] = field(default_factory=list)
+    diversidade: float = None
+    tempo_inicio: float = field(default_factory=time.monotonic)
+
+    @property
+    def tempo_decorrido(self) -> float:
+        return time.monotonic() - self.tempo_inicio
+
+    def registrar_geracao(self, nota_melhor_individuo: float, houve_melhora: bool, diversidade: float = None) -> None:
+        self.geracao += 1
+        self.lista_notas_melhor_individuo.append(nota_melhor_individuo)
+        self.diversidade = diversidade
+
+        if houve_melhora:
+            self.geracao_ultima_melhora = self.geracao
+
+class CriterioParada():
+    """
+    Classe base dos critérios de parada
+    """
+    # Indica se o algoritmo deve calcular a diversidade da população a cada geração
+    requer_diversidade = False
+
+    def verificar(self, estado: EstadoExecucao) -> bool:
+        """
+        Args:
+            estado (EstadoExecucao): métricas da execução
+
+        Returns:
+            bool: True quando a execução deve ser encerrada
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({", ".join(f"{nome}={valor}" for nome, valor in vars(self).items())})'
+
+class CriterioEstagnacao(CriterioParada):
+    """
+    Encerra quando o melhor indivíduo não melhora há limite_qtdade_geracoes gerações
+    """
+
+    def __init__(self, limite_qtdade_geracoes: int) -> None:
+        self.limite_qtdade_geracoes = limite_qtdade_geracoes
+
+    def verificar(self, estado: EstadoExecucao) -> bool:
+        return estado.geracao - estado.geracao_ultima_melhora >= self.limite_qtdade_geracoes
+
+class CriterioTempoLimite(CriterioParada):
+    """
+    Encerra quando o tempo de execução ultrapassa o limite (em segundos). A geração em andamento é concluída
+    """
+
+    def __init__(self, limite_segundos: float) -> None:
+        self.limite_segundos = limite_segundos
+
+    def verificar(self, estado: EstadoExecucao) -> bool:
+        return estado.tempo_decorrido >= self.limite_segundos
+
+class CriterioMaximoGeracoes(CriterioParada):
+    """
+    Encerra após a quantidade máxima de gerações
+    """
+
+    def __init__(self, qtdade_maxima_geracoes: int) -> None:
+        self.qtdade_maxima_geracoes = qtdade_maxima_geracoes
+
+    def verificar(self, estado: EstadoExecucao) -> bool:
+        return estado.geracao >= self.qtdade_maxima_geracoes
+
+class CriterioMaximoAvaliacoes(CriterioParada):
+    """
+    Encerra quando a quantidade de indivíduos avaliados atinge o máximo
+    """
+
+    def __init__(self, qtdade_maxima_avaliacoes: int) -> None:
+        self.qtdade_maxima_avaliacoes = qtdade_maxima_avaliacoes
+
+    def verificar(self, estado: EstadoExecucao) -> bool:
+        return estado.qtdade_avaliacoes >= self.qtdade_maxima_avaliacoes
+
+class CriterioMelhoraMinima(CriterioParada):
+    """
+    Encerra quando a nota do melhor indivíduo melhorou, nas últimas *janela* gerações, menos que *epsilon* (variação relativa)
+    """
+
+    def __init__(self, epsilon: float, janela: int) -> None:
+        self.epsilon = epsilon
+        self.janela = janela
+
+    def verificar(self, estado: EstadoExecucao) -> bool:
+        if len(estado.lista_notas_melhor_individuo) <= self.janela:
+            return False
+
+        nota_inicio_janela = estado.lista_notas_melhor_individuo[-self.janela - 1]
+        nota_atual = estado.lista_notas_melhor_individuo[-1]
+
+        # A menor nota é a melhor, portanto a melhora é a redução da nota
+        return (nota_inicio_janela - nota_atual) <= self.epsilon * max(abs(nota_inicio_janela), 1)
+
+class CriterioDiversidade(CriterioParada):
+    """
+    Encerra quando a diversidade da população fica abaixo do limite (população convergida).
+    A diversidade é o desvio padrão médio das quantidades de energia de cada mês dividido pela quantidade média mensal da meta de venda
+    """
+    requer_diversidade = True
+
+    def __init__(self, limite_diversidade: float) -> None:
+        self.limite_diversidade = limite_diversidade
+
+    def verificar(self, estado: EstadoExecucao) -> bool:
+        return estado.diversidade is not None and estado.diversidade < self.limite_diversidade
+
+def criar_criterios_parada_padrao(configuracao_cenario) -> list[CriterioParada]:
+    """
+    Critérios de parada definidos pela configuração do cenário: estagnação do melhor indivíduo e, quando informados,
+    tempo máximo de execução e quantidade máxima de gerações
+
+    Args:
+        configuracao_cenario (ConfiguracaoCenario): configuração do cenário
+
+    Returns:
+        list[CriterioParada]: critérios de parada
+    """
+    lista_criterios = [CriterioEstagnacao(configuracao_cenario.limite_qtdade_geracoes_melhor_individuo)]
+
+    if configuracao_cenario.limite_tempo_execucao_segundos is not None:
+        lista_criterios.append(CriterioTempoLimite(configuracao_cenario.limite_tempo_execucao_segundos))
+
+    if configuracao_cenario.limite_qtdade_geracoes is not None:
+        lista_criterios.append(CriterioMaximoGeracoes(configuracao_cenario.limite_qtdade_geracoes))
+
+    return lista_criterios
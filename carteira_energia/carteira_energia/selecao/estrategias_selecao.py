@@ -0,0 +1,167 @@
+""" Estratégias de seleção de pais utilizadas no crossover do algoritmo genético """
+
+import numpy as np
+
+class EstrategiaSelecao():
+    """
+    Classe base das estratégias de seleção.
+    O método preparar é chamado uma única vez por geração (após a população ser ordenada, do melhor para o pior indivíduo)
+    e deve montar qualquer índice necessário para que cada sorteio seja barato.
+
+    Os sorteios são feitos sobre as posições da população ordenada, portanto a mesma estratégia atende o AlgoritmoGenetico
+    (lista de Individuo, preparar) e o AlgoritmoGeneticoVetorizado (matriz da população e vetor de notas, preparar_indices)
+    """
+    # Estratégias que dependem das notas de avaliação (ex.: roleta) e não apenas da posição dos indivíduos
+    USA_NOTAS = False
+
+    def __init__(self) -> None:
+        self.lista_populacao = []
+        self.qtdade_individuos = 0
+        self.rng = np.random.default_rng()
+
+    def preparar(self, lista_populacao: list, rng: np.random.Generator = None) -> None:
+        """
+        Args:
+            lista_populacao (list): população ordenada do melhor para o pior indivíduo
+            rng (np.random.Generator, optional): gerador de números aleatórios da execução. Defaults to gerador já utilizado pela estratégia.
+        """
+        self.lista_populacao = lista_populacao
+
+        vetor_notas = np.fromiter((individuo.nota_avaliacao for individuo in lista_populacao), dtype=float, count=len(lista_populacao)) \
+                      if self.USA_NOTAS else None
+
+        self.preparar_indices(len(lista_populacao), vetor_notas, rng)
+
+    def preparar_indices(self, qtdade_individuos: int, vetor_notas: np.ndarray = None, rng: np.random.Generator = None) -> None:
+        """
+        Prepara os sorteios apenas pelas posições da população ordenada (utilizado pelo motor vetorizado)
+
+        Args:
+            qtdade_individuos (int): tamanho da população
+            vetor_notas (np.ndarray, optional): notas de avaliação na ordem da população. Obrigatório quando USA_NOTAS. Defaults to None.
+            rng (np.random.Generator, optional): gerador de números aleatórios da execução. Defaults to gerador já utilizado pela estratégia.
+        """
+        self.qtdade_individuos = qtdade_individuos
+
+        if rng is not None:
+            self.rng = rng
+
+    def sortear_indice(self) -> int:
+        """
+        Sorteia a posição de um indivíduo da população preparada
+
+        Returns:
+            int: posição do indivíduo sorteado
+        """
+        raise NotImplementedError
+
+    def _sortear_matriz_indices_pais(self, qtdade_pares: int) -> np.ndarray:
+        return np.array([(self.sortear_indice(), self.sortear_indice()) for _ in range(qtdade_pares)], dtype=np.int64)
+
+    def sortear_matriz_indices_pais(self, qtdade_pares: int) -> np.ndarray:
+        """
+        Sorteia as posições dos pais de todos os pares de uma geração. As estratégias baseadas em pesos acumulados sorteiam
+        todos os valores em uma única chamada ao gerador de números aleatórios
+
+        Args:
+            qtdade_pares (int): quantidade de pares
+
+        Returns:
+            np.ndarray: matriz (qtdade_pares, 2) com as posições do pai e da mãe. Vazia quando a população está vazia
+        """
+        if not self.qtdade_individuos or qtdade_pares <= 0:
+            return np.empty((0, 2), dtype=np.int64)
+
+        return self._sortear_matriz_indices_pais(qtdade_pares)
+
+    def sortear(self):
+        """
+        Sorteia um indivíduo da população preparada
+
+        Returns:
+            Individuo: indivíduo sorteado
+        """
+        return self.lista_populacao[self.sortear_indice()]
+
+    def sortear_pais(self) -> tuple:
+        return self.sortear(), self.sortear()
+
+    def sortear_lista_pais(self, qtdade_pares: int) -> list[tuple]:
+        """
+        Sorteia todos os pares de pais de uma geração
+
+        Args:
+            qtdade_pares (int): quantidade de pares
+
+        Returns:
+            list[tuple]: pares (pai, mae)
+        """
+        return [(self.lista_populacao[indice_pai], self.lista_populacao[indice_mae])
+                for indice_pai, indice_mae in self.sortear_matriz_indices_pais(qtdade_pares).tolist()]
+
+class _SelecaoPesoAcumulado(EstrategiaSelecao):
+    """
+    Base das seleções por peso: o vetor de pesos acumulados é montado uma vez por geração e cada sorteio é feito por busca binária (O(log n))
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.vetor_peso_acumulado = np.empty(0)
+
+    def _get_indices_selecionados(self, vetor_valores_sorteados: np.ndarray) -> np.ndarray:
+        return np.minimum(np.searchsorted(self.vetor_peso_acumulado, vetor_valores_sorteados), self.qtdade_individuos - 1)
+
+    def sortear_indice(self) -> int:
+        return int(self._get_indices_selecionados(self.rng.random() * self.vetor_peso_acumulado[-1]))
+
+    def _sortear_matriz_indices_pais(self, qtdade_pares: int) -> np.ndarray:
+        return self._get_indices_selecionados(self.rng.random((qtdade_pares, 2)) * self.vetor_peso_acumulado[-1])
+
+class SelecaoRoleta(_SelecaoPesoAcumulado):
+    """
+    Seleção por roleta proporcional à nota de avaliação.
+    A soma acumulada das notas é calculada uma vez por geração e cada sorteio é feito por busca binária (O(log n)).
+
+    Como a menor nota é a melhor, a posição sorteada é invertida para priorizar os primeiros indivíduos da lista
+    """
+    USA_NOTAS = True
+
+    def preparar_indices(self, qtdade_individuos: int, vetor_notas: np.ndarray = None, rng: np.random.Generator = None) -> None:
+        super().preparar_indices(qtdade_individuos, vetor_notas, rng)
+        self.vetor_peso_acumulado = np.cumsum(vetor_notas, dtype=float)
+
+    def _get_indices_selecionados(self, vetor_valores_sorteados: np.ndarray) -> np.ndarray:
+        return (self.qtdade_individuos - 1) - super()._get_indices_selecionados(vetor_valores_sorteados)
+
+class SelecaoTorneio(EstrategiaSelecao):
+    """
+    Seleção por torneio: sorteia tamanho_torneio indivíduos e retorna o melhor deles. Cada sorteio é O(tamanho_torneio)
+    """
+
+    def __init__(self, tamanho_torneio: int = 3) -> None:
+        super().__init__()
+        self.tamanho_torneio = tamanho_torneio
+
+    def sortear_indice(self) -> int:
+        qtdade_individuos = self.qtdade_individuos
+        qtdade_participantes = min(self.tamanho_torneio, qtdade_individuos)
+
+        # Amostragem sem reposição de Floyd: O(tamanho_torneio) com uma única chamada ao gerador de números aleatórios
+        set_participantes = set()
+        for limite, valor_sorteado in zip(range(qtdade_individuos - qtdade_participantes, qtdade_individuos), self.rng.random(qtdade_participantes).tolist()):
+            participante = int(valor_sorteado * (limite + 1))
+            set_participantes.add(limite if participante in set_participantes else participante)
+
+        # A população está ordenada do melhor para o pior, portanto o menor índice sorteado é o vencedor
+        return min(set_participantes)
+
+class SelecaoRanking(_SelecaoPesoAcumulado):
+    """
+    Seleção por ranking linear: a probabilidade de escolha depende apenas da posição do indivíduo na população ordenada
+    (o melhor recebe peso n, o pior recebe peso 1), e não da escala das notas.
+    Os pesos acumulados são montados uma vez por geração e cada sorteio é feito por busca binária
+    """
+
+    def preparar_indices(self, qtdade_individuos: int, vetor_notas: np.ndarray = None, rng: np.random.Generator = None) -> None:
+        super().preparar_indices(qtdade_individuos, vetor_notas, rng)
+        self.vetor_peso_acumulado = np.cumsum(np.arange(qtdade_individuos, 0, -1), dtype=float)
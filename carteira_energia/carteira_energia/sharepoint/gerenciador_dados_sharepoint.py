@@ -1,3 +1,4 @@
+import io
 import pandas as pd
 from pandas import DataFrame
 from carteira_energia.util.utilidades import get_qtdade_horas_ano
@@ -14,7 +15,7 @@ class GerenciadorArquivosSharepoint(SharepointSiteCopel):
     def __init__(self) -> None:
         super().__init__(site='PowerBIInsightsComercializacao')
 
-    def salvar_conteudo_dataframe(self, nome_arquivo:str, conteudo_arquivo: DataFrame, index=False) -> None:
+    def salvar_conteudo_dataframe(self, nome_arquivo:str, conteudo_arquivo: DataFrame, index=False, folder: str = None) -> None:
         """
         Salva o conteúdo do dataframe na pasta PLD
 
@@ -22,8 +23,9 @@ class GerenciadorArquivosSharepoint(SharepointSiteCopel):
             nome_arquivo (str): Nome do arquivo que será gerado
             conteudo_arquivo (DataFrame): Dataframe cujo conteúdo será utilizado para popular o arquivo a ser gerado
             index (bool, optional): O valor do index do dataframe será colocado no arquivo?. Defaults to False.
+            folder (str, optional): Pasta de destino. Defaults to pasta do gerenciador.
         """        
-        self.write_df_to_excel(dataframe=conteudo_arquivo, folder=self._get_path_folder(), index=index, filename=nome_arquivo)
+        self.write_df_to_excel(dataframe=conteudo_arquivo, folder=folder or self._get_path_folder(), index=index, filename=nome_arquivo)
    
     def get_dataframe_cenarios_estudo(self) -> pd.DataFrame:
         """
@@ -48,49 +50,90 @@ class GerenciadorArquivosPLDSharepoint(GerenciadorArquivosSharepoint):
     """
     Classe específica que trata os arquivos relacionados a aba de PLD do Power BI
     """
+    NOME_ARQUIVO_PLD = 'PLD.xlsx'
+
+    # Planilhas PLD.xlsx já lidas, compartilhadas por todos os gerenciadores: caminho -> (versão do arquivo no servidor, dataframe)
+    _dict_cache_planilha_pld: dict[str, tuple[tuple, pd.DataFrame]] = {}
     
     def _get_path_folder(self) -> str:
         return 'Base de dados/Newave-Decomp/'
 
-    def get_dataframe_media_meses_ano(self) -> pd.DataFrame:
-        # TODO: Esse método é utilizado pela Carteira de Compra e Venda de energia
-        # No futuro devemos alterar esse método para obter os PLDs dos anos A+2 em diante
-        # Como estamos gerando o PLD apenas para o ano A+1 (de forma fixa), estou me preocupando apenas com esse ano nesse momento
-        # Sugestão para o futuro: Podemos acrescentar uma propriedade ano no construtor da classe
+    def _get_dataframe_planilha_pld(self) -> pd.DataFrame:
+        """
+        Conteúdo da planilha PLD.xlsx. A planilha só é baixada e lida novamente quando a versão do arquivo no sharepoint
+        (ETag e data de modificação) muda, portanto todos os cenários (média, P10, ..., P75) vêm de um único download
+        """
+        folder = f'{self._get_path_folder()}PLD'
+        caminho_arquivo = f'{self._site.site_url}/{folder}/{self.NOME_ARQUIVO_PLD}'
+
+        propriedades_arquivo = self.get_file_properties(folder=folder, filename=self.NOME_ARQUIVO_PLD)
+        versao_arquivo = (propriedades_arquivo.get('ETag'), propriedades_arquivo.get('TimeLastModified'))
+
+        versao_cache, df = self._dict_cache_planilha_pld.get(caminho_arquivo, (None, None))
+
+        # Sem a versão do arquivo não é possível saber se o conteúdo guardado ainda é válido
+        if df is None or versao_cache != versao_arquivo or versao_arquivo == (None, None):
+            # As propriedades já obtidas são repassadas para que o cache de arquivos do site não consulte a versão novamente
+            conteudo_arquivo = self.get_file(folder=folder, filename=self.NOME_ARQUIVO_PLD, properties=propriedades_arquivo)
+            df = pd.read_excel(io.BytesIO(conteudo_arquivo), engine='openpyxl')
+            self._dict_cache_planilha_pld[caminho_arquivo] = (versao_arquivo, df)
+
+        # Cópia para que alterações feitas por quem chamou não afetem o conteúdo guardado
+        return df.copy()
+
+    def _get_indices_meses_ano(self, ano_simulacao: int) -> tuple[int, int]:
+        """
+        Linhas da planilha PLD.xlsx referentes ao ano A+ano_simulacao (12 linhas por ano de estudo)
+        """
+        deslocamento = (ano_simulacao - 1) * 12
+
+        return self.INDICE_MES_INICIO_ESTUDO + deslocamento, self.INDICE_MES_FIM_ESTUDO + deslocamento
 
+    def get_dataframe_media_meses_ano(self, ano_simulacao: int = 1) -> pd.DataFrame:
         """
-        Obtêm a media mensal dos valores do PLD para o ano A+1
+        Obtêm a media mensal dos valores do PLD para o ano A+ano_simulacao
+
+        Parameters
+        ----------
+        ano_simulacao : int, optional
+            Ano do estudo (1 para A+1, 2 para A+2, ...), by default 1
 
         Returns
         -------
         pd.DataFrame
             Dataframe contendo a média anual total do PLD
         """
+        indice_inicio, indice_fim = self._get_indices_meses_ano(ano_simulacao)
 
-        df = self.read_df_from_excel(filename='PLD.xlsx', folder=f'{self._get_path_folder()}PLD')
+        df = self._get_dataframe_planilha_pld()
 
-        df = pd.concat([df.loc[self.INDICE_MES_INICIO_ESTUDO:self.INDICE_MES_FIM_ESTUDO,['mes','valor_avg']].rename(columns={'valor_avg':'valor'}),
-                        df.loc[self.INDICE_MES_INICIO_ESTUDO:self.INDICE_MES_FIM_ESTUDO,['mes','valor_p10']].rename(columns={'valor_p10':'valor'}),
-                        df.loc[self.INDICE_MES_INICIO_ESTUDO:self.INDICE_MES_FIM_ESTUDO,['mes','valor_p25']].rename(columns={'valor_p25':'valor'}),
-                        df.loc[self.INDICE_MES_INICIO_ESTUDO:self.INDICE_MES_FIM_ESTUDO,['mes','valor_p50']].rename(columns={'valor_p50':'valor'}),
-                        df.loc[self.INDICE_MES_INICIO_ESTUDO:self.INDICE_MES_FIM_ESTUDO,['mes','valor_p75']].rename(columns={'valor_p75':'valor'})])
+        df = pd.concat([df.loc[indice_inicio:indice_fim,['mes','valor_avg']].rename(columns={'valor_avg':'valor'}),
+                        df.loc[indice_inicio:indice_fim,['mes','valor_p10']].rename(columns={'valor_p10':'valor'}),
+                        df.loc[indice_inicio:indice_fim,['mes','valor_p25']].rename(columns={'valor_p25':'valor'}),
+                        df.loc[indice_inicio:indice_fim,['mes','valor_p50']].rename(columns={'valor_p50':'valor'}),
+                        df.loc[indice_inicio:indice_fim,['mes','valor_p75']].rename(columns={'valor_p75':'valor'})])
 
         return df.groupby(by='mes').agg({'valor':'mean'}).reset_index().rename(columns={'mes':'MES','valor':'VALOR'})
 
-    def get_valores_pld_cenario(self, desc_cenario: str) -> pd.DataFrame:
+    def get_valores_pld_cenario(self, desc_cenario: str, ano_simulacao: int = 1) -> pd.DataFrame:
         """
         Obtêm os valores de simulação do PLD para o cenário informados.
         Valores esperados: P10, P25, P50, P75 e AVG
 
+        Args:
+            desc_cenario (str): descrição do cenário
+            ano_simulacao (int, optional): ano do estudo (1 para A+1, 2 para A+2, ...). Defaults to 1.
+
         Returns:
             pd.DataFrame: DataFrame contendo os valores de simulação do PLD para o cenário informado 
         """
-        
-        df = self.read_df_from_excel(filename='PLD.xlsx', folder=f'{self._get_path_folder()}PLD')
+        indice_inicio, indice_fim = self._get_indices_meses_ano(ano_simulacao)
+
+        df = self._get_dataframe_planilha_pld()
 
         nome_coluna = f'valor_{desc_cenario.lower()}'
 
-        return df.loc[self.INDICE_MES_INICIO_ESTUDO:self.INDICE_MES_FIM_ESTUDO,['mes',nome_coluna]].rename(columns={nome_coluna:'VALOR', 'mes':'MES'})
+        return df.loc[indice_inicio:indice_fim,['mes',nome_coluna]].rename(columns={nome_coluna:'VALOR', 'mes':'MES'})
 
 class GerenciadorArquivosEARSharepoint(GerenciadorArquivosSharepoint):
     """
@@ -125,51 +168,94 @@ class GerenciadorArquivosSharepointPortifolioRecomendacao(GerenciadorArquivosSha
         GerenciadorArquivosSharepoint (GerenciadorArquivosSharepoint): Classe base
     """
 
-    # TODO Por enquanto a silumação da carteira de venda de energia será fixo em A+1. No futuro temos que implementar A+2, A+3 e A+4
-    # Isso depende do ajuste da obtenção do PLD A+2 em diante
-    def __init__(self, ano_simulacao: int = 1) -> None:
+    def __init__(self, ano_simulacao: int = 1, sharepoint_pld: GerenciadorArquivosPLDSharepoint = None) -> None:
+        """
+        Args:
+            ano_simulacao (int, optional): ano padrão do portfólio (1 para A+1, 2 para A+2, ...). Defaults to 1.
+            sharepoint_pld (GerenciadorArquivosPLDSharepoint, optional): gerenciador do PLD já autenticado, evitando uma nova autenticação.
+        """
         super().__init__()
 
         self.ano_simulacao = ano_simulacao
-        self.dao = InformacoesEstudoDAO(sharepoint=GerenciadorArquivosPLDSharepoint())
+        self.dao = InformacoesEstudoDAO(sharepoint=sharepoint_pld if sharepoint_pld is not None else GerenciadorArquivosPLDSharepoint())
 
-    def _get_path_folder(self):
-        return f'Base de dados/Portfólios Recomendados/A+{self.ano_simulacao}/'
+    def _get_path_folder(self, ano_simulacao: int = None):
+        return f'Base de dados/Portfólios Recomendados/A+{ano_simulacao or self.ano_simulacao}/'
 
-    def get_dataframe_portfolio_ano(self) -> pd.DataFrame:
+    def get_dataframe_portfolio_ano(self, ano_simulacao: int = None) -> pd.DataFrame:
         """
         Obtêm o dataframe com os dados da meta do portfólio de recomendação do ano em questão
 
         Args:
-            ano_simulacao (int): para qual ano os dados simulados devem ser obtidos
+            ano_simulacao (int, optional): para qual ano os dados simulados devem ser obtidos. Defaults to ano do gerenciador.
 
         Returns:
             pd.DataFrame: DataFrame contendo as metas do portifólio de um determinado ano
         """
+        ano_simulacao = ano_simulacao or self.ano_simulacao
+
+        return self.read_df_from_excel(filename=f'Meta - Risco A+{ano_simulacao}.xlsx', folder=self._get_path_folder(ano_simulacao))
+
+    def get_lista_qtdades_portfolio_exportado(self, ano_simulacao: int = None) -> list[list[int]]:
+        """
+        Obtêm as quantidades de energia de cada mês dos indivíduos exportados na última execução (portfolio A+ano.xlsx).
+        Utilizado na partida quente do algoritmo genético. Caso o arquivo não exista, uma lista vazia é retornada
+
+        Args:
+            ano_simulacao (int, optional): ano do portfólio (1 para A+1, 2 para A+2, ...). Defaults to ano do gerenciador.
+
+        Returns:
+            list[list[int]]: quantidades de energia de cada indivíduo exportado, na ordem da exportação (I1, I2, ...)
+        """
+        ano_simulacao = ano_simulacao or self.ano_simulacao
+        nome_arquivo = f'portfolio A+{ano_simulacao}.xlsx'
+        path_folder = self._get_path_folder(ano_simulacao)
+
+        if nome_arquivo not in [arquivo['Name'] for arquivo in self.get_folder(path_folder).files]:
+            return []
+
+        df_portfolio = self.read_df_from_excel(filename=nome_arquivo, folder=path_folder)
 
-        return self.read_df_from_excel(filename=f'Meta - Risco A+{self.ano_simulacao}.xlsx', folder=self._get_path_folder())
+        return [[int(valor) for valor in df_individuo['Valor']] for _, df_individuo in df_portfolio.groupby(f'A+{ano_simulacao}', sort=False)]
 
-    def exportar_resultado_carteira_recomendacao(self, lista_individuos_exportacao: list):
+    def exportar_resultado_carteira_recomendacao(self, lista_individuos_exportacao: list, ano_simulacao: int = None):
+        self.exportar_resultados_carteiras_recomendacao({ano_simulacao or self.ano_simulacao: lista_individuos_exportacao})
+
+    def exportar_resultados_carteiras_recomendacao(self, dict_individuos_por_ano: dict[int, list]):
+        """
+        Exporta em lote os portfólios de vários anos (A+1, A+2, ...), reaproveitando a mesma sessão do sharepoint
+        e obtendo a data inicial do estudo uma única vez
+
+        Args:
+            dict_individuos_por_ano (dict[int, list]): para cada ano (1 para A+1, ...) a lista de indivíduos exportados
+        """
         qtdade_horas_ano = get_qtdade_horas_ano()
+        qtdade_meses_ano = 12
 
-        nome_coluna_ano = F'A+{self.ano_simulacao}'
         nome_coluna_mes = 'Mês'
         nome_coluna_valor = 'Valor'
         nome_coluna_melhor_preco = 'Melhor preço (R$)'
         nome_coluna_risco_preco = 'Preço risco (R$)'
 
-        conteudo_dataframe = []
         mes_referencia = self.dao.get_data_inicial_estudo()
-        for indice_individuo, individuo in enumerate(lista_individuos_exportacao, start=1):
-            for gene in individuo.lista_cromossomo:
-                conteudo_dataframe.append(
-                    {
-                        nome_coluna_ano: f'I{indice_individuo}',
-                        nome_coluna_mes: f'{mes_referencia + gene.sequencia_mes}',
-                        nome_coluna_valor: gene.qtdade_energia_mwm_venda,
-                        nome_coluna_melhor_preco: round(gene.qtdade_energia_mwm_venda * gene.preco_pld * qtdade_horas_ano),
-                        nome_coluna_risco_preco: round(gene.qtdade_energia_mwm_venda * gene.risco * qtdade_horas_ano)
-                    }
-                )
-
-        self.salvar_conteudo_dataframe(nome_arquivo=f'portfolio A+{self.ano_simulacao}.xlsx', conteudo_arquivo=pd.DataFrame(conteudo_dataframe))
\ No newline at end of file
+
+        for ano_simulacao, lista_individuos_exportacao in dict_individuos_por_ano.items():
+            nome_coluna_ano = F'A+{ano_simulacao}'
+            mes_inicial_ano = mes_referencia + (ano_simulacao - 1) * qtdade_meses_ano
+
+            conteudo_dataframe = []
+            for indice_individuo, individuo in enumerate(lista_individuos_exportacao, start=1):
+                for gene in individuo.lista_cromossomo:
+                    conteudo_dataframe.append(
+                        {
+                            nome_coluna_ano: f'I{indice_individuo}',
+                            nome_coluna_mes: f'{mes_inicial_ano + gene.sequencia_mes}',
+                            nome_coluna_valor: gene.qtdade_energia_mwm_venda,
+                            nome_coluna_melhor_preco: round(gene.qtdade_energia_mwm_venda * gene.preco_pld * qtdade_horas_ano),
+                            nome_coluna_risco_preco: round(gene.qtdade_energia_mwm_venda * gene.risco * qtdade_horas_ano)
+                        }
+                    )
+
+            self.salvar_conteudo_dataframe(nome_arquivo=f'portfolio A+{ano_simulacao}.xlsx',
+                                           conteudo_arquivo=pd.DataFrame(conteudo_dataframe),
+                                           folder=self._get_path_folder(ano_simulacao))
\ No newline at end of file
@@ -0,0 +1,76 @@
+""" Leitura e gravação do checkpoint (estado da população) do algoritmo genético em um arquivo local compactado (.npz) """
+
+import json
+import os
+from dataclasses import fields
+import numpy as np
+
+# Versão 2: estado do numpy.random.Generator da execução no lugar do estado do módulo random
+VERSAO_CHECKPOINT = 2
+
+def _converter_valor_json(valor):
+    # Valores lidos do sharepoint podem vir como tipos do NumPy (ex.: numpy.int64)
+    if isinstance(valor, np.generic):
+        return valor.item()
+
+    raise TypeError(f'Valor {valor!r} não pode ser gravado no checkpoint')
+
+def get_parametros_configuracao_cenario(configuracao_cenario) -> dict:
+    """
+    Dados de entrada do cenário (campos do construtor de ConfiguracaoCenario), permitindo recriá-lo sem acessar o sharepoint
+    """
+    return {campo.name: getattr(configuracao_cenario, campo.name) for campo in fields(configuracao_cenario) if campo.init}
+
+def salvar_checkpoint(caminho_checkpoint: str, matriz_populacao: np.ndarray, vetor_geracao: np.ndarray,
+                      matriz_melhores_individuos: np.ndarray, vetor_geracao_melhores_individuos: np.ndarray, dados: dict) -> None:
+    """
+    Grava o checkpoint. O arquivo é escrito em um temporário e renomeado ao final, para que uma interrupção durante a gravação
+    não corrompa o último checkpoint válido
+
+    Args:
+        caminho_checkpoint (str): caminho do arquivo .npz
+        matriz_populacao (np.ndarray): quantidades de energia de cada indivíduo da população (qtdade_individuos, 12)
+        vetor_geracao (np.ndarray): geração de cada indivíduo da população
+        matriz_melhores_individuos (np.ndarray): quantidades de energia dos melhores indivíduos (hall da fama)
+        vetor_geracao_melhores_individuos (np.ndarray): geração dos melhores indivíduos
+        dados (dict): demais dados serializáveis em JSON (cenário, estado do gerador aleatório, métricas da execução, ...)
+    """
+    caminho_temporario = f'{caminho_checkpoint}.tmp'
+
+    with open(caminho_temporario, 'wb') as arquivo:
+        np.savez_compressed(arquivo,
+                            matriz_populacao=np.asarray(matriz_populacao, dtype=np.int64),
+                            vetor_geracao=np.asarray(vetor_geracao, dtype=np.int64),
+                            matriz_melhores_individuos=np.asarray(matriz_melhores_individuos, dtype=np.int64),
+                            vetor_geracao_melhores_individuos=np.asarray(vetor_geracao_melhores_individuos, dtype=np.int64),
+                            dados=np.array(json.dumps({'versao': VERSAO_CHECKPOINT, **dados}, default=_converter_valor_json)))
+
+    os.replace(caminho_temporario, caminho_checkpoint)
+
+def carregar_checkpoint(caminho_checkpoint: str) -> dict:
+    """
+    Lê o checkpoint gravado por salvar_checkpoint
+
+    Args:
+        caminho_checkpoint (str): caminho do arquivo .npz
+
+    Returns:
+        dict: dados do checkpoint com as matrizes (matriz_populacao, vetor_geracao, matriz_melhores_individuos e
+        vetor_geracao_melhores_individuos) e os demais dados gravados
+    """
+    with np.load(caminho_checkpoint, allow_pickle=False) as arquivo:
+        dados = json.loads(str(arquivo['dados']))
+
+        if dados.get('versao') != VERSAO_CHECKPOINT:
+            raise ValueError(f'Versão do checkpoint {dados.get("versao")} não suportada')
+
+        dados.update({nome: arquivo[nome] for nome in ('matriz_populacao', 'vetor_geracao', 'matriz_melhores_individuos', 'vetor_geracao_melhores_individuos')})
+
+    return dados
+
+def get_lista_qtdades_melhores_checkpoint(caminho_checkpoint: str) -> list[list[int]]:
+    """
+    Quantidades de energia dos melhores indivíduos (hall da fama) gravados no checkpoint, do melhor para o pior.
+    Utilizado na partida quente de uma nova execução
+    """
+    return carregar_checkpoint(caminho_checkpoint)['matriz_melhores_individuos'].tolist()
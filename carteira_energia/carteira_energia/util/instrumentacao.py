@@ -0,0 +1,82 @@
+""" Instrumentação da execução do algoritmo genético: tempo de cada etapa e métricas de cada geração, sem necessidade de um profiler """
+
+import csv
+import json
+import logging
+from dataclasses import dataclass, asdict, fields
+from typing import Callable
+
+@dataclass
+class RegistroGeracao():
+    """
+    Métricas de uma geração
+
+    - tempo_*: tempo de execução (segundos) de cada etapa da geração. O tempo do crossover inclui a avaliação dos filhos
+    - qtdade_avaliacoes: quantidade de indivíduos avaliados na geração
+    - qtdade_individuos_ajustados: quantidade de cromossomos reparados por ultrapassarem a meta anual de venda
+    - tamanho_populacao: quantidade de indivíduos após a avaliação descartar os inválidos
+    - diversidade: diversidade da população (None quando não calculada, ver InstrumentacaoExecucao.calcular_diversidade)
+    """
+    geracao: int
+    tempo_ajuste: float
+    tempo_avaliacao: float
+    tempo_selecao: float
+    tempo_crossover: float
+    tempo_mutacao: float
+    qtdade_avaliacoes: int
+    qtdade_individuos_ajustados: int
+    tamanho_populacao: int
+    nota_melhor_individuo: float
+    diversidade: float = None
+
+    @property
+    def tempo_total(self) -> float:
+        return self.tempo_ajuste + self.tempo_avaliacao + self.tempo_selecao + self.tempo_crossover + self.tempo_mutacao
+
+class InstrumentacaoExecucao():
+    """
+    Guarda um RegistroGeracao por geração executada e, opcionalmente, repassa cada registro para uma função de callback
+    (ex.: envio para um sistema de monitoramento)
+    """
+
+    def __init__(self, callback: Callable[[RegistroGeracao], None] = None, calcular_diversidade: bool = False) -> None:
+        """
+        Args:
+            callback (Callable[[RegistroGeracao], None], optional): chamada ao final de cada geração com o registro. Defaults to None.
+            calcular_diversidade (bool, optional): calcula a diversidade da população em todas as gerações. Quando False a diversidade
+                só é registrada se algum critério de parada precisar dela. Defaults to False.
+        """
+        self.callback = callback
+        self.calcular_diversidade = calcular_diversidade
+        self.lista_registros: list[RegistroGeracao] = []
+
+    def registrar(self, registro: RegistroGeracao) -> None:
+        self.lista_registros.append(registro)
+
+        logging.debug('Geracao %s: %.4f s (ajuste %.4f, avaliacao %.4f, selecao %.4f, crossover %.4f, mutacao %.4f), %s avaliacoes',
+                      registro.geracao, registro.tempo_total, registro.tempo_ajuste, registro.tempo_avaliacao, registro.tempo_selecao,
+                      registro.tempo_crossover, registro.tempo_mutacao, registro.qtdade_avaliacoes)
+
+        if self.callback is not None:
+            self.callback(registro)
+
+    def get_lista_dicts(self) -> list[dict]:
+        return [{**asdict(registro), 'tempo_total': registro.tempo_total} for registro in self.lista_registros]
+
+    def exportar_csv(self, caminho_arquivo: str) -> None:
+        """
+        Args:
+            caminho_arquivo (str): caminho do arquivo CSV (uma linha por geração)
+        """
+        with open(caminho_arquivo, 'w', newline='', encoding='utf-8') as arquivo:
+            writer = csv.DictWriter(arquivo, fieldnames=[campo.name for campo in fields(RegistroGeracao)] + ['tempo_total'])
+            writer.writeheader()
+            writer.writerows(self.get_lista_dicts())
+
+    def exportar_json(self, caminho_arquivo: str) -> None:
+        """
+        Args:
+            caminho_arquivo (str): caminho do arquivo JSON (lista com um objeto por geração)
+        """
+        with open(caminho_arquivo, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.get_lista_dicts(), arquivo, indent=2)
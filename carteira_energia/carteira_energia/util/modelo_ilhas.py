@@ -0,0 +1,173 @@
+""" Modelo de ilhas: várias subpopulações do algoritmo genético evoluindo em processos separados e trocando seus melhores indivíduos """
+
+import logging
+import multiprocessing
+import queue
+from threading import BrokenBarrierError
+
+# Tempo máximo que uma ilha espera pelas demais em cada migração
+TEMPO_LIMITE_SINCRONIZACAO_SEGUNDOS = 1800
+# Intervalo entre as verificações dos processos das ilhas enquanto os resultados não chegam
+INTERVALO_VERIFICACAO_PROCESSOS_SEGUNDOS = 1
+
+def executar_modelo_ilhas(classe_algoritmo, configuracao_cenario, lista_sementes: list, intervalo_migracao: int,
+                          qtdade_migrantes: int, parametros_algoritmo: dict = None,
+                          tempo_limite_sincronizacao: float = TEMPO_LIMITE_SINCRONIZACAO_SEGUNDOS) -> list[tuple]:
+    """
+    Executa uma ilha por processo. A cada intervalo_migracao gerações cada ilha grava seus melhores indivíduos em um buffer
+    compartilhado (multiprocessing.Array) e recebe os migrantes da ilha anterior (topologia em anel).
+    A execução termina quando todas as ilhas atingiram algum critério de parada no final de uma mesma época
+
+    Args:
+        classe_algoritmo (type): classe do algoritmo genético (AlgoritmoGenetico ou subclasse)
+        configuracao_cenario (ConfiguracaoCenario): configuração do cenário, compartilhada por todas as ilhas
+        lista_sementes (list[np.random.SeedSequence]): semente de cada ilha, derivadas (spawn) da semente da execução para que os
+            fluxos de números aleatórios das ilhas sejam independentes. A quantidade de ilhas é o tamanho da lista
+        intervalo_migracao (int): quantidade de gerações entre duas migrações
+        qtdade_migrantes (int): quantidade de indivíduos enviados por cada ilha em cada migração
+        parametros_algoritmo (dict, optional): parâmetros adicionais do construtor da classe do algoritmo. Defaults to None.
+        tempo_limite_sincronizacao (float, optional): tempo máximo, em segundos, que uma ilha espera pelas demais em cada migração.
+            Defaults to TEMPO_LIMITE_SINCRONIZACAO_SEGUNDOS.
+
+    Raises:
+        RuntimeError: quando alguma ilha falha, é encerrada sem enviar o resultado ou não sincroniza dentro do tempo limite
+
+    Returns:
+        list[tuple]: (quantidades de energia, geração) dos melhores indivíduos de todas as ilhas
+    """
+    qtdade_ilhas = len(lista_sementes)
+    qtdade_meses_ano = len(configuracao_cenario.lista_preco_pld_mes)
+    contexto = multiprocessing.get_context()
+
+    buffer_migrantes = contexto.Array('i', qtdade_ilhas * qtdade_migrantes * qtdade_meses_ano, lock=False)
+    vetor_qtdade_migrantes = contexto.Array('i', qtdade_ilhas, lock=False)
+    vetor_estagnacao = contexto.Array('b', qtdade_ilhas, lock=False)
+    barreira = contexto.Barrier(qtdade_ilhas)
+    fila_resultados = contexto.Queue()
+
+    lista_processos = [contexto.Process(target=_executar_ilha,
+                                        args=(classe_algoritmo, configuracao_cenario, parametros_algoritmo or {}, indice_ilha, semente,
+                                              intervalo_migracao, qtdade_migrantes, buffer_migrantes, vetor_qtdade_migrantes,
+                                              vetor_estagnacao, barreira, fila_resultados, tempo_limite_sincronizacao))
+                       for indice_ilha, semente in enumerate(lista_sementes)]
+
+    for processo in lista_processos:
+        processo.start()
+
+    # A fila deve ser esvaziada antes do join para não bloquear os processos filhos
+    dict_resultados = _coletar_resultados(lista_processos, fila_resultados, barreira)
+
+    for processo in lista_processos:
+        processo.join(timeout=INTERVALO_VERIFICACAO_PROCESSOS_SEGUNDOS)
+        if processo.is_alive():
+            processo.terminate()
+            processo.join()
+
+    lista_erros = [_descrever_falha_ilha(indice_ilha, processo, dict_resultados) for indice_ilha, processo in enumerate(lista_processos)
+                   if not isinstance(dict_resultados.get(indice_ilha), list)]
+
+    if lista_erros:
+        raise RuntimeError('Falha na execução do modelo de ilhas do algoritmo genético: ' + '; '.join(lista_erros))
+
+    return [melhor for indice_ilha in sorted(dict_resultados) for melhor in dict_resultados[indice_ilha]]
+
+def _coletar_resultados(lista_processos: list, fila_resultados, barreira) -> dict:
+    """
+    Aguarda o resultado de cada ilha. Quando uma ilha é encerrada sem enviar o resultado (ex.: processo morto pelo sistema)
+    ou a barreira é rompida, as ilhas restantes são liberadas (barreira.abort) e a coleta termina com os resultados já recebidos
+    """
+    dict_resultados = {}
+
+    while len(dict_resultados) < len(lista_processos):
+        try:
+            indice_ilha, resultado = fila_resultados.get(timeout=INTERVALO_VERIFICACAO_PROCESSOS_SEGUNDOS)
+            dict_resultados[indice_ilha] = resultado
+            continue
+        except queue.Empty:
+            pass
+
+        ilha_encerrada = any(processo.exitcode is not None and indice_ilha not in dict_resultados
+                             for indice_ilha, processo in enumerate(lista_processos))
+
+        if ilha_encerrada or barreira.broken:
+            barreira.abort()
+
+            # Resultados ainda em trânsito das ilhas liberadas pela barreira
+            while len(dict_resultados) < len(lista_processos):
+                try:
+                    indice_ilha, resultado = fila_resultados.get(timeout=INTERVALO_VERIFICACAO_PROCESSOS_SEGUNDOS)
+                    dict_resultados[indice_ilha] = resultado
+                except queue.Empty:
+                    break
+            break
+
+    return dict_resultados
+
+def _descrever_falha_ilha(indice_ilha: int, processo, dict_resultados: dict) -> str:
+    if indice_ilha not in dict_resultados:
+        return f'ilha {indice_ilha} encerrada sem enviar o resultado (exitcode {processo.exitcode})'
+
+    if dict_resultados[indice_ilha] is None:
+        return f'ilha {indice_ilha} interrompida na migração (outra ilha falhou ou o tempo limite de sincronização foi atingido)'
+
+    return f'ilha {indice_ilha} falhou: {dict_resultados[indice_ilha]}'
+
+def _executar_ilha(classe_algoritmo, configuracao_cenario, parametros_algoritmo: dict, indice_ilha: int, semente,
+                   intervalo_migracao: int, qtdade_migrantes: int, buffer_migrantes, vetor_qtdade_migrantes, vetor_estagnacao,
+                   barreira, fila_resultados, tempo_limite_sincronizacao: float):
+    try:
+        algoritmo = classe_algoritmo(ano_simulacao=configuracao_cenario.ano_simulacao,
+                                     configuracao_cenario=configuracao_cenario,
+                                     semente=semente,
+                                     **parametros_algoritmo)
+
+        qtdade_ilhas = len(vetor_estagnacao)
+        qtdade_meses_ano = len(configuracao_cenario.lista_preco_pld_mes)
+        tamanho_slot = qtdade_migrantes * qtdade_meses_ano
+        indice_ilha_origem = (indice_ilha - 1) % qtdade_ilhas
+
+        algoritmo._iniciar_execucao()
+
+        while True:
+            # A ilha é considerada parada se algum critério foi atingido em qualquer geração da época
+            estagnada = False
+            for _ in range(intervalo_migracao):
+                algoritmo._executar_geracao()
+                estagnada = estagnada or algoritmo._verificar_parada() is not None
+
+            geracao = algoritmo.estado_execucao.geracao
+
+            lista_emigrantes = algoritmo._obter_emigrantes(qtdade_migrantes)
+
+            inicio_slot = indice_ilha * tamanho_slot
+            for indice, qtdades in enumerate(lista_emigrantes):
+                buffer_migrantes[inicio_slot + indice * qtdade_meses_ano:inicio_slot + (indice + 1) * qtdade_meses_ano] = qtdades
+
+            vetor_qtdade_migrantes[indice_ilha] = len(lista_emigrantes)
+            vetor_estagnacao[indice_ilha] = estagnada
+
+            barreira.wait(timeout=tempo_limite_sincronizacao)
+
+            inicio_slot = indice_ilha_origem * tamanho_slot
+            lista_imigrantes = [buffer_migrantes[inicio_slot + indice * qtdade_meses_ano:inicio_slot + (indice + 1) * qtdade_meses_ano]
+                                for indice in range(vetor_qtdade_migrantes[indice_ilha_origem])]
+            todas_estagnadas = all(vetor_estagnacao)
+
+            # Segunda barreira: nenhuma ilha sobrescreve o seu slot antes da vizinha terminar a leitura
+            barreira.wait(timeout=tempo_limite_sincronizacao)
+
+            if todas_estagnadas:
+                break
+
+            algoritmo._receber_migrantes(lista_imigrantes, geracao)
+
+        logging.info('Ilha %s finalizada na geracao %s', indice_ilha, geracao)
+
+        fila_resultados.put((indice_ilha, [(list(individuo.qtdades_energia), individuo.geracao)
+                                           for individuo in algoritmo.get_lista_melhores_individuos()]))
+    except BrokenBarrierError:
+        fila_resultados.put((indice_ilha, None))
+    except BaseException as erro:
+        logging.exception('Erro na execucao da ilha %s', indice_ilha)
+        barreira.abort()
+        fila_resultados.put((indice_ilha, repr(erro)))
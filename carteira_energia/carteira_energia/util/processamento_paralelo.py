@@ -0,0 +1,115 @@
+""" Funções executadas nos processos auxiliares (ProcessPoolExecutor) para avaliação e ajuste dos cromossomos em paralelo """
+
+from array import array
+from dataclasses import dataclass
+import numpy as np
+from carteira_energia.formulas.formulas_agoritmo_genetico import calcular_funcao_minimizar_riscos_compra_energia
+from carteira_energia.operadores.reparo import calcular_reducao_proporcional
+from carteira_energia.util.utilidades import get_maior_nota_avaliacao_disponivel, criar_gerador_individuo
+
+@dataclass(frozen=True)
+class DadosAvaliacaoCenario():
+    """
+    Dados mínimos do cenário enviados aos processos auxiliares.
+    Evita serializar o ConfiguracaoCenario (e os objetos de acesso ao sharepoint) a cada lote
+    """
+    lista_preco_pld_mes: tuple
+    lista_risco_mes: tuple
+    meta_anual_venda_kwm: int
+    volume_financeiro_meta_ganhos: float
+    volume_financeiro_risco_anual: float
+    w1_penalizacao_desvio_negativo: float
+    nota_maxima: float
+    qtdade_horas_ano: int
+
+    @classmethod
+    def a_partir_configuracao(cls, configuracao_cenario) -> 'DadosAvaliacaoCenario':
+        return cls(lista_preco_pld_mes=tuple(configuracao_cenario.lista_preco_pld_mes),
+                   lista_risco_mes=tuple(configuracao_cenario.lista_risco_mes),
+                   meta_anual_venda_kwm=configuracao_cenario.meta_anual_venda_kwm,
+                   volume_financeiro_meta_ganhos=configuracao_cenario.volume_financeiro_meta_ganhos,
+                   volume_financeiro_risco_anual=configuracao_cenario.volume_financeiro_risco_anual,
+                   w1_penalizacao_desvio_negativo=configuracao_cenario.w1_penalizacao_desvio_negativo,
+                   nota_maxima=get_maior_nota_avaliacao_disponivel(configuracao_cenario.tamanho_populacao),
+                   qtdade_horas_ano=configuracao_cenario.qtdade_horas_ano)
+
+def compactar_lote_cromossomos(lista_qtdades: list) -> array:
+    """
+    Concatena as quantidades de energia de vários cromossomos em um único array de inteiros
+
+    Args:
+        lista_qtdades (list): lista com as quantidades de energia (uma sequência por cromossomo)
+
+    Returns:
+        array: array('i') com todas as quantidades em sequência
+    """
+    lote = array('i')
+
+    for qtdades in lista_qtdades:
+        lote.extend(qtdades)
+
+    return lote
+
+def dividir_em_lotes(lista: list, qtdade_lotes: int) -> list[list]:
+    """
+    Divide a lista em até qtdade_lotes partes de tamanho semelhante, preservando a ordem
+    """
+    tamanho_lote = max(1, -(-len(lista) // max(1, qtdade_lotes)))
+
+    return [lista[indice:indice + tamanho_lote] for indice in range(0, len(lista), tamanho_lote)]
+
+def avaliar_lote_cromossomos(dados: DadosAvaliacaoCenario, lote: array) -> list[tuple]:
+    """
+    Avalia um lote de cromossomos. Mesmas regras de Individuo._calcular_avaliacao
+
+    Args:
+        dados (DadosAvaliacaoCenario): dados do cenário
+        lote (array): quantidades de energia de vários cromossomos concatenadas
+
+    Returns:
+        list[tuple]: (nota, ganhos, risco, estourou_limite) de cada cromossomo do lote
+    """
+    qtdade_meses_ano = len(dados.lista_preco_pld_mes)
+    lista_avaliacoes = []
+
+    for inicio in range(0, len(lote), qtdade_meses_ano):
+        qtdades = lote[inicio:inicio + qtdade_meses_ano]
+
+        ganhos = sum(qtdade * preco * dados.qtdade_horas_ano for qtdade, preco in zip(qtdades, dados.lista_preco_pld_mes))
+        risco = sum(qtdade * risco_mes * dados.qtdade_horas_ano for qtdade, risco_mes in zip(qtdades, dados.lista_risco_mes))
+        estourou_limite = sum(qtdades) > dados.meta_anual_venda_kwm
+
+        if not estourou_limite:
+            nota = calcular_funcao_minimizar_riscos_compra_energia(w1=dados.w1_penalizacao_desvio_negativo,
+                                                                   dsva=max(dados.volume_financeiro_meta_ganhos - ganhos, 0),
+                                                                   w2=1 - dados.w1_penalizacao_desvio_negativo,
+                                                                   rppda=max(risco - dados.volume_financeiro_risco_anual, 0))
+        else:
+            nota = dados.nota_maxima
+
+        lista_avaliacoes.append((nota, ganhos, risco, estourou_limite))
+
+    return lista_avaliacoes
+
+def ajustar_lote_cromossomos(meta_anual_venda_kwm: int, qtdade_meses_ano: int, lote: array, semente: int, indice_inicial: int = 0) -> array:
+    """
+    Ajusta um lote de cromossomos para que a soma anual não ultrapasse a meta de venda. Mesmas regras de Individuo.ajustar_cromossomo
+
+    Args:
+        meta_anual_venda_kwm (int): meta anual de venda de energia
+        qtdade_meses_ano (int): quantidade de genes de cada cromossomo
+        lote (array): quantidades de energia de vários cromossomos concatenadas
+        semente (int): semente do ajuste da geração (sorteada pelo gerador da execução)
+        indice_inicial (int, optional): posição do primeiro cromossomo do lote entre todos os sorteados para ajuste.
+            Cada cromossomo usa o gerador da sua posição (criar_gerador_individuo), como no ajuste sem processos. Defaults to 0.
+
+    Returns:
+        array: lote com as quantidades ajustadas
+    """
+    for indice, inicio in enumerate(range(0, len(lote), qtdade_meses_ano), start=indice_inicial):
+        qtdades = lote[inicio:inicio + qtdade_meses_ano]
+        lista_reducao = calcular_reducao_proporcional(qtdades, meta_anual_venda_kwm, criar_gerador_individuo(semente, indice))
+
+        lote[inicio:inicio + qtdade_meses_ano] = array('i', (qtdade - reducao for qtdade, reducao in zip(qtdades, lista_reducao)))
+
+    return lote
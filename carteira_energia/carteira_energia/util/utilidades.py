@@ -2,6 +2,8 @@
 
 import sys
 from datetime import datetime
+from functools import lru_cache
+import numpy as np
 
 def somar_qtdade_energia_cromossomos(lista_cromossomo: list) -> int:
     """
@@ -16,11 +18,48 @@ def somar_qtdade_energia_cromossomos(lista_cromossomo: list) -> int:
     
     return sum([gene.qtdade_energia_mwm_venda for gene in lista_cromossomo])
 
-def get_qtdade_horas_ano():
-    primeiro_dia_ano = datetime(year=datetime.now().year, month=1, day=1)
-    ultimo_dia_ano = datetime(year=datetime.now().year, month=12, day=31)
+def get_qtdade_horas_ano(ano: int = None):
+    """
+    Quantidade de horas do ano. O cálculo é memorizado por ano
+
+    Args:
+        ano (int, optional): ano de referência. Defaults to ano atual.
+    """
+    return _calcular_qtdade_horas_ano(ano if ano is not None else datetime.now().year)
+
+@lru_cache(maxsize=None)
+def _calcular_qtdade_horas_ano(ano: int):
+    primeiro_dia_ano = datetime(year=ano, month=1, day=1)
+    ultimo_dia_ano = datetime(year=ano, month=12, day=31)
 
     return ((ultimo_dia_ano - primeiro_dia_ano).days + 1) * 24
 
 def get_maior_nota_avaliacao_disponivel(tamanho_populacao: int):
-    return round(sys.maxsize / tamanho_populacao)
\ No newline at end of file
+    return round(sys.maxsize / tamanho_populacao)
+
+def criar_sequencia_sementes(semente) -> np.random.SeedSequence:
+    """
+    Sequência de sementes (numpy.random.SeedSequence) de uma execução. A partir dela são derivados (spawn) fluxos
+    independentes e reprodutíveis de números aleatórios para ilhas e anos executados em paralelo
+
+    Args:
+        semente (int | np.random.SeedSequence): semente inteira ou sequência já derivada de outra execução
+
+    Returns:
+        np.random.SeedSequence: sequência de sementes
+    """
+    return semente if isinstance(semente, np.random.SeedSequence) else np.random.SeedSequence(semente)
+
+def criar_gerador_individuo(semente: int, indice_individuo: int) -> np.random.Generator:
+    """
+    Gerador de números aleatórios próprio de um indivíduo, derivado (mesmo resultado de SeedSequence.spawn) da semente sorteada
+    pela execução. Como depende apenas da posição do indivíduo, o resultado não muda com a divisão em lotes entre processos
+
+    Args:
+        semente (int): semente sorteada pelo gerador da execução
+        indice_individuo (int): posição do indivíduo entre os sorteados
+
+    Returns:
+        np.random.Generator: gerador do indivíduo
+    """
+    return np.random.default_rng(np.random.SeedSequence(semente, spawn_key=(indice_individuo,)))
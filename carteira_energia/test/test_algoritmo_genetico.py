@@ -1,3 +1,4 @@
+import pytest
 import test.conftest as conftest
 from carteira_energia.entidades.algoritmo_genetico import AlgoritmoGenetico
 from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
@@ -47,4 +48,77 @@ def test_verificar_cromossomos_nova_populacao_apos_crossover(configuracao_cenari
             f'Tamanho do cromossomo do indivíduo não pode ultrapassar o valor de {conftest.QTDADE_MESES_ANO}. Valor atual é de {len(individuo.lista_cromossomo)}'
         
         assert somar_qtdade_energia_cromossomos(individuo.lista_cromossomo) <= conftest.META_ANUAL_VENDA_KWM, \
-                f'A soma dos genes do cromossomo do individuo não pode ultrapassar o valor de {conftest.META_ANUAL_VENDA_KWM}. Valor atual foi de {somar_qtdade_energia_cromossomos(individuo.lista_cromossomo)}'
\ No newline at end of file
+                f'A soma dos genes do cromossomo do individuo não pode ultrapassar o valor de {conftest.META_ANUAL_VENDA_KWM}. Valor atual foi de {somar_qtdade_energia_cromossomos(individuo.lista_cromossomo)}'
+
+def test_elite_mantida_sem_alteracao_apos_crossover(configuracao_cenario: ConfiguracaoCenario):
+    configuracao_cenario.qtdade_elite = 3
+
+    algoritmo = AlgoritmoGenetico(ano_simulacao=1, configuracao_cenario=configuracao_cenario)
+    algoritmo._avaliar_populacao()
+    lista_elite = algoritmo.lista_populacao[:configuracao_cenario.qtdade_elite]
+    lista_qtdades_elite = [list(individuo.qtdades_energia) for individuo in lista_elite]
+
+    algoritmo._crossover()
+    algoritmo._mutacao_gene()
+
+    for individuo, qtdades in zip(lista_elite, lista_qtdades_elite):
+        assert individuo in algoritmo.lista_populacao, 'Os indivíduos da elite devem ser mantidos na nova população'
+        assert list(individuo.qtdades_energia) == qtdades, 'Os indivíduos da elite não podem sofrer mutação'
+        assert not individuo.avaliacao_pendente, 'Os indivíduos da elite não precisam ser avaliados novamente'
+
+def test_modo_estado_estacionario_substitui_apenas_fracao(configuracao_cenario: ConfiguracaoCenario):
+    configuracao_cenario.modo_substituicao = 'estado_estacionario'
+    configuracao_cenario.fracao_substituicao = 0.1
+
+    algoritmo = AlgoritmoGenetico(ano_simulacao=1, configuracao_cenario=configuracao_cenario)
+    algoritmo._avaliar_populacao()
+    qtdade_sobreviventes = configuracao_cenario.get_qtdade_sobreviventes()
+    lista_sobreviventes = algoritmo.lista_populacao[:qtdade_sobreviventes]
+
+    algoritmo._crossover()
+
+    assert qtdade_sobreviventes == round(configuracao_cenario.tamanho_populacao * 0.9)
+    assert len(algoritmo._lista_novos_individuos) == configuracao_cenario.tamanho_populacao - qtdade_sobreviventes
+    assert all(individuo in algoritmo.lista_populacao for individuo in lista_sobreviventes), 'Apenas os piores indivíduos podem ser substituídos'
+
+def test_semear_populacao_partida_quente(configuracao_cenario: ConfiguracaoCenario, melhor_individuo: Individuo):
+    algoritmo = AlgoritmoGenetico(ano_simulacao=1, configuracao_cenario=configuracao_cenario)
+    qtdades_semente = list(melhor_individuo.qtdades_energia)
+
+    algoritmo.semear_populacao([qtdades_semente], fracao_populacao=0.1)
+
+    qtdade_individuos_semeados = round(configuracao_cenario.tamanho_populacao * 0.1)
+
+    assert len(algoritmo.lista_populacao) == configuracao_cenario.tamanho_populacao
+    assert list(algoritmo.lista_populacao[0].qtdades_energia) == qtdades_semente, 'A solução conhecida deve entrar na população sem alteração'
+    assert all(individuo.avaliacao_pendente for individuo in algoritmo.lista_populacao[:qtdade_individuos_semeados]), \
+            'Os indivíduos semeados devem ser avaliados'
+
+def test_semear_populacao_qtdades_float_inteiras(configuracao_cenario: ConfiguracaoCenario, melhor_individuo: Individuo):
+    algoritmo = AlgoritmoGenetico(ano_simulacao=1, configuracao_cenario=configuracao_cenario)
+    qtdades_semente = list(melhor_individuo.qtdades_energia)
+
+    # Valores lidos do Excel pelo pandas chegam como float
+    algoritmo.semear_populacao([[float(qtdade) for qtdade in qtdades_semente]], fracao_populacao=0.1)
+
+    assert list(algoritmo.lista_populacao[0].qtdades_energia) == qtdades_semente
+
+def test_individuo_qtdade_nao_inteira_invalida(configuracao_cenario: ConfiguracaoCenario):
+    with pytest.raises(ValueError, match='inteiro'):
+        Individuo.criar_a_partir_qtdades(configuracao_cenario, [1.5] + [1] * 11)
+
+    individuo = Individuo.criar_a_partir_qtdades(configuracao_cenario, [1] * 12)
+    with pytest.raises(ValueError, match='inteiro'):
+        individuo.definir_qtdade_energia(0, 2.5)
+
+def test_execucoes_mesma_semente_reprodutiveis(configuracao_cenario: ConfiguracaoCenario):
+    algoritmo1 = AlgoritmoGenetico(ano_simulacao=1, configuracao_cenario=configuracao_cenario, semente=7)
+    algoritmo2 = AlgoritmoGenetico(ano_simulacao=1, configuracao_cenario=configuracao_cenario, semente=7)
+
+    # Gerações intercaladas: cada execução utiliza apenas o seu próprio gerador de números aleatórios
+    for _ in range(3):
+        algoritmo1._executar_geracao()
+        algoritmo2._executar_geracao()
+
+    assert [list(individuo.qtdades_energia) for individuo in algoritmo1.lista_populacao] == \
+            [list(individuo.qtdades_energia) for individuo in algoritmo2.lista_populacao], 'Execuções com a mesma semente devem gerar a mesma população'
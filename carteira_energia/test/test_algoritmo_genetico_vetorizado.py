@@ -0,0 +1,87 @@
+import numpy as np
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
+from carteira_energia.entidades.individuo import Individuo
+from carteira_energia.entidades.algoritmo_genetico_vetorizado import AlgoritmoGeneticoVetorizado
+from carteira_energia.selecao.estrategias_selecao import SelecaoTorneio, SelecaoRanking
+from carteira_energia.parada.criterios_parada import CriterioMaximoGeracoes
+from carteira_energia.formulas.formulas_agoritmo_genetico import calcular_ganhos_riscos, calcular_notas_populacao
+from carteira_energia.util.utilidades import get_maior_nota_avaliacao_disponivel, somar_qtdade_energia_cromossomos
+
+def test_avaliacao_vetorizada_igual_individuo(configuracao_cenario: ConfiguracaoCenario):
+    lista_individuos = [Individuo(configuracao_cenario) for _ in range(50)]
+
+    matriz_qtdades = np.array([[gene.qtdade_energia_mwm_venda for gene in individuo.lista_cromossomo] for individuo in lista_individuos])
+
+    vetor_ganhos, vetor_riscos = calcular_ganhos_riscos(matriz_qtdades, configuracao_cenario.vetor_coeficientes_ganhos, configuracao_cenario.vetor_coeficientes_riscos)
+    vetor_notas = calcular_notas_populacao(vetor_ganhos=vetor_ganhos,
+                                           vetor_riscos=vetor_riscos,
+                                           vetor_qtdade_energia=matriz_qtdades.sum(axis=1),
+                                           verec=configuracao_cenario.volume_financeiro_meta_ganhos,
+                                           riskppd=configuracao_cenario.volume_financeiro_risco_anual,
+                                           w1=configuracao_cenario.w1_penalizacao_desvio_negativo,
+                                           meta_anual_venda_kwm=configuracao_cenario.meta_anual_venda_kwm,
+                                           nota_maxima=get_maior_nota_avaliacao_disponivel(configuracao_cenario.tamanho_populacao))
+
+    for indice, individuo in enumerate(lista_individuos):
+        assert vetor_ganhos[indice] == individuo.ganhos_financeiro_melhor_cenario, 'Ganhos calculados de forma vetorizada estão diferentes'
+        assert vetor_riscos[indice] == individuo.risco_financeiro_cenario, 'Risco calculado de forma vetorizada está diferente'
+        assert vetor_notas[indice] == individuo.nota_avaliacao, 'Nota calculada de forma vetorizada está diferente'
+        assert matriz_qtdades[indice].sum() == somar_qtdade_energia_cromossomos(individuo.lista_cromossomo)
+
+def test_ganhos_riscos_coeficientes_cenario(configuracao_cenario: ConfiguracaoCenario):
+    individuo = Individuo(configuracao_cenario)
+
+    ganhos, riscos = calcular_ganhos_riscos(individuo.qtdades_energia, configuracao_cenario.vetor_coeficientes_ganhos, configuracao_cenario.vetor_coeficientes_riscos)
+
+    assert np.isclose(ganhos, individuo.ganhos_financeiro_melhor_cenario), 'Ganhos calculados pelos coeficientes do cenário estão diferentes'
+    assert np.isclose(riscos, individuo.risco_financeiro_cenario), 'Risco calculado pelos coeficientes do cenário está diferente'
+    assert not configuracao_cenario.vetor_coeficientes_ganhos.flags.writeable, 'Os coeficientes do cenário devem ser somente leitura'
+
+def test_vetorizado_estrategia_selecao(configuracao_cenario: ConfiguracaoCenario):
+    for estrategia_selecao in (SelecaoTorneio(), SelecaoRanking()):
+        algoritmo = AlgoritmoGeneticoVetorizado(ano_simulacao=1, configuracao_cenario=configuracao_cenario, estrategia_selecao=estrategia_selecao,
+                                                criterios_parada=[CriterioMaximoGeracoes(3)])
+        algoritmo.executar()
+
+        assert algoritmo.estrategia_selecao is estrategia_selecao
+        assert estrategia_selecao.qtdade_individuos > 0, 'A seleção dos pais deve ser feita pela estratégia informada'
+        assert algoritmo.get_lista_melhores_individuos()
+
+def test_vetorizado_selecao_populacao_vazia(configuracao_cenario: ConfiguracaoCenario):
+    algoritmo = AlgoritmoGeneticoVetorizado(ano_simulacao=1, configuracao_cenario=configuracao_cenario)
+    algoritmo._definir_matriz_populacao(np.empty((0, 12), dtype=np.int64), np.empty(0, dtype=np.int64))
+    algoritmo._avaliar_populacao()
+
+    indices_pais, indices_maes = algoritmo._selecao_pais(5)
+    algoritmo._crossover()
+
+    assert len(indices_pais) == len(indices_maes) == 0
+    assert len(algoritmo.matriz_populacao) == 0
+
+def test_vetorizado_avalia_apenas_linhas_pendentes(configuracao_cenario: ConfiguracaoCenario):
+    algoritmo = AlgoritmoGeneticoVetorizado(ano_simulacao=1, configuracao_cenario=configuracao_cenario, criterios_parada=[CriterioMaximoGeracoes(3)])
+    algoritmo.executar()
+
+    # Após a mutação apenas os filhos alterados estão pendentes; sobreviventes e demais filhos mantêm a avaliação
+    qtdade_pendentes = int(algoritmo.vetor_avaliacao_pendente.sum())
+    qtdade_avaliacoes_anterior = algoritmo.estado_execucao.qtdade_avaliacoes
+    algoritmo._avaliar_populacao()
+
+    assert 0 < qtdade_pendentes < len(algoritmo.vetor_avaliacao_pendente)
+    assert algoritmo.estado_execucao.qtdade_avaliacoes - qtdade_avaliacoes_anterior == qtdade_pendentes, 'Apenas as linhas pendentes devem ser avaliadas'
+    assert not algoritmo.vetor_avaliacao_pendente.any()
+
+    matriz_populacao = algoritmo.matriz_populacao
+    vetor_ganhos, vetor_riscos = calcular_ganhos_riscos(matriz_populacao, configuracao_cenario.vetor_coeficientes_ganhos, configuracao_cenario.vetor_coeficientes_riscos)
+    vetor_notas = calcular_notas_populacao(vetor_ganhos=vetor_ganhos,
+                                           vetor_riscos=vetor_riscos,
+                                           vetor_qtdade_energia=matriz_populacao.sum(axis=1),
+                                           verec=configuracao_cenario.volume_financeiro_meta_ganhos,
+                                           riskppd=configuracao_cenario.volume_financeiro_risco_anual,
+                                           w1=configuracao_cenario.w1_penalizacao_desvio_negativo,
+                                           meta_anual_venda_kwm=configuracao_cenario.meta_anual_venda_kwm,
+                                           nota_maxima=get_maior_nota_avaliacao_disponivel(configuracao_cenario.tamanho_populacao))
+
+    assert np.array_equal(algoritmo._vetor_ganhos, vetor_ganhos), 'Ganhos reaproveitados devem ser iguais aos recalculados'
+    assert np.array_equal(algoritmo._vetor_riscos, vetor_riscos), 'Riscos reaproveitados devem ser iguais aos recalculados'
+    assert np.array_equal(algoritmo._vetor_notas, vetor_notas), 'Notas reaproveitadas devem ser iguais às recalculadas'
@@ -0,0 +1,71 @@
+import io
+import pandas as pd
+from carteira_energia.sharepoint.gerenciador_dados_sharepoint import GerenciadorArquivosPLDSharepoint
+
+class _SiteFalso():
+    site_url = 'https://sharepoint/sites/teste'
+
+def _criar_gerenciador_pld(monkeypatch, dict_propriedades_arquivo: dict, lista_downloads: list,
+                           lista_consultas_propriedades: list = None) -> GerenciadorArquivosPLDSharepoint:
+    """
+    Gerenciador sem autenticação no sharepoint: as propriedades e o conteúdo da planilha PLD.xlsx são simulados
+    """
+    monkeypatch.setattr(GerenciadorArquivosPLDSharepoint, '_dict_cache_planilha_pld', {})
+    lista_consultas_propriedades = [] if lista_consultas_propriedades is None else lista_consultas_propriedades
+
+    gerenciador_pld = GerenciadorArquivosPLDSharepoint.__new__(GerenciadorArquivosPLDSharepoint)
+    gerenciador_pld._site = _SiteFalso()
+
+    def get_file_properties(folder: str, filename: str):
+        lista_consultas_propriedades.append(filename)
+
+        return dict(dict_propriedades_arquivo)
+
+    def get_file(folder: str, filename: str, properties: dict = None):
+        lista_downloads.append(properties)
+        lista_valores = [float(mes) for mes in range(24)]
+
+        bytes_io = io.BytesIO()
+        pd.DataFrame({'mes': [f'2024-{mes % 12 + 1:02d}' for mes in range(24)], 'valor_avg': lista_valores, 'valor_p10': lista_valores,
+                      'valor_p25': lista_valores, 'valor_p50': lista_valores, 'valor_p75': lista_valores}).to_excel(bytes_io, index=False)
+
+        return bytes_io.getvalue()
+
+    monkeypatch.setattr(gerenciador_pld, 'get_file_properties', get_file_properties)
+    monkeypatch.setattr(gerenciador_pld, 'get_file', get_file)
+
+    return gerenciador_pld
+
+def test_planilha_pld_baixada_uma_vez_por_versao(monkeypatch):
+    dict_propriedades_arquivo = {'ETag': '"{1},1"', 'TimeLastModified': '2024-01-01T00:00:00Z'}
+    lista_downloads = []
+    gerenciador_pld = _criar_gerenciador_pld(monkeypatch, dict_propriedades_arquivo, lista_downloads)
+
+    gerenciador_pld.get_dataframe_media_meses_ano(ano_simulacao=2)
+    gerenciador_pld.get_valores_pld_cenario('P75', ano_simulacao=2)
+    gerenciador_pld.get_valores_pld_cenario('P10')
+
+    assert len(lista_downloads) == 1, 'Todos os cenários devem ser obtidos de um único download enquanto a planilha não mudar'
+
+    dict_propriedades_arquivo['ETag'] = '"{1},2"'
+    gerenciador_pld.get_valores_pld_cenario('P75')
+
+    assert len(lista_downloads) == 2, 'Uma nova versão da planilha deve ser baixada novamente'
+
+def test_planilha_pld_cache_nao_alterado_pelo_chamador(monkeypatch):
+    gerenciador_pld = _criar_gerenciador_pld(monkeypatch, {'ETag': '"{1},1"', 'TimeLastModified': '2024-01-01T00:00:00Z'}, [])
+
+    df_pld = gerenciador_pld._get_dataframe_planilha_pld()
+    df_pld['valor_p75'] = 0
+
+    assert gerenciador_pld.get_valores_pld_cenario('P75')['VALOR'].iloc[1] == 1
+
+def test_planilha_pld_uma_consulta_propriedades_por_leitura(monkeypatch):
+    dict_propriedades_arquivo = {'ETag': '"{1},1"', 'TimeLastModified': '2024-01-01T00:00:00Z'}
+    lista_downloads, lista_consultas_propriedades = [], []
+    gerenciador_pld = _criar_gerenciador_pld(monkeypatch, dict_propriedades_arquivo, lista_downloads, lista_consultas_propriedades)
+
+    gerenciador_pld.get_valores_pld_cenario('P75')
+
+    assert len(lista_consultas_propriedades) == 1, 'A versão da planilha deve ser consultada uma única vez por leitura'
+    assert lista_downloads == [dict_propriedades_arquivo], 'As propriedades já obtidas devem ser repassadas para o download (cache do site)'
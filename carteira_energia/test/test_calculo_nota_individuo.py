@@ -9,7 +9,7 @@ QTDADE_MESES_ANO = 12
 QTDADE_GERACOES = 40
 
 def test_calculo_nota_individuo():
-    configuracao = ConfiguracaoCenario(ano_simulacao=1)
+    configuracao = ConfiguracaoCenario(ano_simulacao=1, carregar_dados_sharepoint=False)
     configuracao.meta_anual_venda_kwm = META_ANUAL_VENDA_KWM
     configuracao.volume_financeiro_meta_ganhos = VOLUME_META_ANUAL
     configuracao.volume_financeiro_risco_anual = VOLUME_RISCO_ANUAL
@@ -33,3 +33,41 @@ def test_calculo_nota_individuo():
     individuo.lista_cromossomo[11].qtdade_energia_mwm_venda = 0
 
     assert individuo.nota_avaliacao == 12209040, 'Valor do calculo esta errado'
+
+def test_avaliacao_invalidada_apos_ajuste_cromossomo(configuracao_cenario: ConfiguracaoCenario):
+    individuo = Individuo(configuracao_cenario)
+    for gene in individuo.lista_cromossomo:
+        gene.qtdade_energia_mwm_venda = configuracao_cenario.meta_anual_venda_kwm
+
+    assert individuo.verificar_estouro_limite_qtdade_energia(), 'Indivíduo deveria ultrapassar a meta de venda'
+    avaliacao_antes_ajuste = individuo.avaliacao
+
+    individuo.ajustar_cromossomo()
+
+    assert individuo.avaliacao is not avaliacao_antes_ajuste, 'A avaliação memorizada deveria ser descartada após o ajuste do cromossomo'
+    assert not individuo.verificar_estouro_limite_qtdade_energia(), 'Após o ajuste o indivíduo não pode ultrapassar a meta de venda'
+    assert individuo.avaliacao is individuo.avaliacao, 'A avaliação deve ser reaproveitada enquanto o cromossomo não for alterado'
+
+def test_cromossomo_compartilha_tabela_meses_cenario(configuracao_cenario: ConfiguracaoCenario):
+    individuo = Individuo(configuracao_cenario)
+    outro_individuo = Individuo(configuracao_cenario)
+
+    assert individuo.cromossomo.tabela_meses is outro_individuo.cromossomo.tabela_meses, 'Os dados mensais do cenário devem ser compartilhados entre os indivíduos'
+
+    individuo.lista_cromossomo[0].qtdade_energia_mwm_venda = 7
+
+    assert individuo.qtdades_energia[0] == 7, 'Alteração feita pelo gene deve ser gravada no cromossomo compacto'
+
+def test_totais_cromossomo_atualizados_incrementalmente(configuracao_cenario: ConfiguracaoCenario):
+    individuo = Individuo(configuracao_cenario)
+
+    for indice_gene, qtdade in [(0, 3), (5, 0), (11, 9), (5, 4), (0, 1)]:
+        individuo.definir_qtdade_energia(indice_gene, qtdade)
+
+    cromossomo = individuo.cromossomo
+    soma_qtdade_preco_pld = sum(qtdade * preco_pld for qtdade, preco_pld in zip(cromossomo.qtdades, configuracao_cenario.lista_preco_pld_mes))
+    soma_qtdade_risco = sum(qtdade * risco for qtdade, risco in zip(cromossomo.qtdades, configuracao_cenario.lista_risco_mes))
+
+    assert cromossomo.soma_qtdade_energia == sum(cromossomo.qtdades), 'Total de energia do cromossomo desatualizado'
+    assert abs(cromossomo.soma_qtdade_preco_pld - soma_qtdade_preco_pld) <= 1e-6 * max(1, abs(soma_qtdade_preco_pld)), 'Total de ganhos do cromossomo desatualizado'
+    assert abs(cromossomo.soma_qtdade_risco - soma_qtdade_risco) <= 1e-6 * max(1, abs(soma_qtdade_risco)), 'Total de risco do cromossomo desatualizado'
@@ -0,0 +1,51 @@
+from carteira_energia.carteira_compra_venda_energia import CarteiraCompraVendaEnergiaMultiAno
+from carteira_energia.dao.fonte_cenario import DadosCenario, FonteCenarioMemoria
+from carteira_energia.parada.criterios_parada import CriterioMaximoGeracoes
+
+LISTA_ANOS_SIMULACAO = (1, 2, 3, 4)
+
+class _ExportadorFalso:
+    def __init__(self) -> None:
+        self.lista_exportacoes = []
+
+    def exportar_resultados_carteiras_recomendacao(self, dict_individuos_exportacao: dict) -> None:
+        self.lista_exportacoes.append(dict_individuos_exportacao)
+
+def test_multi_ano_resultado_e_exportacao_por_ano(dados_cenario: DadosCenario):
+    # Cada horizonte tem uma meta diferente para identificar de qual ano veio cada resultado
+    dict_dados_cenario = {horizonte: DadosCenario(meta_anual_venda_kwm=dados_cenario.meta_anual_venda_kwm + horizonte,
+                                                  volume_financeiro_meta_ganhos=dados_cenario.volume_financeiro_meta_ganhos,
+                                                  volume_financeiro_risco_anual=dados_cenario.volume_financeiro_risco_anual,
+                                                  lista_preco_pld_mes=dados_cenario.lista_preco_pld_mes,
+                                                  lista_risco_mes=dados_cenario.lista_risco_mes)
+                          for horizonte in LISTA_ANOS_SIMULACAO}
+
+    carteira = CarteiraCompraVendaEnergiaMultiAno(lista_anos_simulacao=LISTA_ANOS_SIMULACAO, criterios_parada=[CriterioMaximoGeracoes(2)],
+                                                  fonte_cenario=FonteCenarioMemoria(dict_dados_cenario))
+
+    assert carteira.sharepoint_pld is None and carteira.sharepoint_portfolio_recomendacao is None, \
+           'Com fonte_cenario informada o sharepoint não deve ser acessado na criação da carteira'
+
+    for ano_simulacao, configuracao_cenario in carteira.dict_configuracao_cenario.items():
+        assert configuracao_cenario.ano_simulacao == configuracao_cenario.horizonte == ano_simulacao
+        assert configuracao_cenario.meta_anual_venda_kwm == dados_cenario.meta_anual_venda_kwm + ano_simulacao
+
+    dict_melhores_individuos = carteira.encontrar_recomendacao()
+
+    assert sorted(dict_melhores_individuos) == list(LISTA_ANOS_SIMULACAO)
+    for ano_simulacao, lista_individuos in dict_melhores_individuos.items():
+        assert lista_individuos, 'Cada ano deve ter o seu próprio resultado'
+        assert all(individuo.configuracao_cenario.ano_simulacao == ano_simulacao for individuo in lista_individuos)
+        assert all(individuo.configuracao_cenario.meta_anual_venda_kwm == dados_cenario.meta_anual_venda_kwm + ano_simulacao
+                   for individuo in lista_individuos)
+
+    exportador = _ExportadorFalso()
+    carteira.sharepoint_portfolio_recomendacao = exportador
+    carteira.exportar_resultado_pasta_sharepoint()
+
+    assert len(exportador.lista_exportacoes) == 1, 'Os anos devem ser exportados em lote'
+    dict_exportacao = exportador.lista_exportacoes[0]
+    assert sorted(dict_exportacao) == list(LISTA_ANOS_SIMULACAO), 'A exportação deve ter uma tabela por ano'
+    for ano_simulacao, lista_individuos in dict_exportacao.items():
+        assert 0 < len(lista_individuos) <= 3
+        assert all(individuo.configuracao_cenario.ano_simulacao == ano_simulacao for individuo in lista_individuos)
@@ -0,0 +1,35 @@
+from carteira_energia.entidades.algoritmo_genetico import AlgoritmoGenetico
+from carteira_energia.entidades.algoritmo_genetico_vetorizado import AlgoritmoGeneticoVetorizado
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
+from carteira_energia.parada.criterios_parada import CriterioMaximoGeracoes
+
+QTDADE_GERACOES_CHECKPOINT = 4
+QTDADE_GERACOES_TOTAL = 8
+
+def _verificar_retomada_igual_execucao_continua(classe_algoritmo, configuracao_cenario: ConfiguracaoCenario, caminho_checkpoint: str):
+    algoritmo_continuo = classe_algoritmo(ano_simulacao=1, configuracao_cenario=configuracao_cenario,
+                                          criterios_parada=[CriterioMaximoGeracoes(QTDADE_GERACOES_TOTAL)])
+    algoritmo_continuo.executar()
+
+    algoritmo_interrompido = classe_algoritmo(ano_simulacao=1, configuracao_cenario=configuracao_cenario,
+                                              criterios_parada=[CriterioMaximoGeracoes(QTDADE_GERACOES_CHECKPOINT)])
+    algoritmo_interrompido.executar(caminho_checkpoint=caminho_checkpoint)
+
+    algoritmo_retomado = classe_algoritmo.retomar(caminho_checkpoint, criterios_parada=[CriterioMaximoGeracoes(QTDADE_GERACOES_TOTAL)])
+
+    assert algoritmo_retomado.estado_execucao.geracao == QTDADE_GERACOES_CHECKPOINT
+    assert algoritmo_retomado.configuracao_cenario.lista_preco_pld_mes == configuracao_cenario.lista_preco_pld_mes
+
+    algoritmo_retomado.executar()
+
+    assert algoritmo_retomado.estado_execucao.geracao == QTDADE_GERACOES_TOTAL
+    assert list(algoritmo_retomado.melhor_individuo.qtdades_energia) == list(algoritmo_continuo.melhor_individuo.qtdades_energia), \
+            'A execução retomada do checkpoint deve chegar ao mesmo resultado da execução sem interrupção'
+    assert [list(individuo.qtdades_energia) for individuo in algoritmo_retomado.get_lista_melhores_individuos()] == \
+           [list(individuo.qtdades_energia) for individuo in algoritmo_continuo.get_lista_melhores_individuos()]
+
+def test_retomar_checkpoint(configuracao_cenario: ConfiguracaoCenario, tmp_path):
+    _verificar_retomada_igual_execucao_continua(AlgoritmoGenetico, configuracao_cenario, str(tmp_path / 'checkpoint.npz'))
+
+def test_retomar_checkpoint_vetorizado(configuracao_cenario: ConfiguracaoCenario, tmp_path):
+    _verificar_retomada_igual_execucao_continua(AlgoritmoGeneticoVetorizado, configuracao_cenario, str(tmp_path / 'checkpoint_vetorizado.npz'))
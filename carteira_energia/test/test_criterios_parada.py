@@ -0,0 +1,45 @@
+from carteira_energia.parada.criterios_parada import EstadoExecucao, CriterioEstagnacao, CriterioMaximoGeracoes, CriterioMaximoAvaliacoes, \
+                                                     CriterioMelhoraMinima, CriterioDiversidade, CriterioTempoLimite
+
+def test_estagnacao_conta_geracoes_sem_melhora():
+    estado = EstadoExecucao()
+    criterio = CriterioEstagnacao(limite_qtdade_geracoes=2)
+
+    estado.registrar_geracao(nota_melhor_individuo=100, houve_melhora=True)
+    estado.registrar_geracao(nota_melhor_individuo=100, houve_melhora=False)
+    assert not criterio.verificar(estado)
+
+    estado.registrar_geracao(nota_melhor_individuo=100, houve_melhora=False)
+    assert criterio.verificar(estado), 'Duas gerações sem melhora devem encerrar a execução'
+
+def test_limites_geracoes_avaliacoes_e_tempo():
+    estado = EstadoExecucao(qtdade_avaliacoes=500)
+    estado.registrar_geracao(nota_melhor_individuo=100, houve_melhora=True)
+
+    assert CriterioMaximoGeracoes(1).verificar(estado)
+    assert not CriterioMaximoGeracoes(2).verificar(estado)
+    assert CriterioMaximoAvaliacoes(500).verificar(estado)
+    assert not CriterioMaximoAvaliacoes(501).verificar(estado)
+    assert CriterioTempoLimite(0).verificar(estado)
+    assert not CriterioTempoLimite(3600).verificar(estado)
+
+def test_melhora_minima_na_janela():
+    estado = EstadoExecucao()
+    criterio = CriterioMelhoraMinima(epsilon=0.01, janela=2)
+
+    for nota in (1000, 900, 800):
+        estado.registrar_geracao(nota_melhor_individuo=nota, houve_melhora=True)
+    assert not criterio.verificar(estado)
+
+    for nota in (799, 799):
+        estado.registrar_geracao(nota_melhor_individuo=nota, houve_melhora=nota < 800)
+    assert criterio.verificar(estado), 'Melhora menor que epsilon na janela deve encerrar a execução'
+
+def test_diversidade_abaixo_do_limite():
+    estado = EstadoExecucao()
+    criterio = CriterioDiversidade(limite_diversidade=0.05)
+
+    assert not criterio.verificar(estado), 'Sem diversidade calculada o critério não pode encerrar a execução'
+
+    estado.registrar_geracao(nota_melhor_individuo=100, houve_melhora=True, diversidade=0.01)
+    assert criterio.verificar(estado)
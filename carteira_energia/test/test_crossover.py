@@ -0,0 +1,13 @@
+from array import array
+from carteira_energia.operadores.crossover import crossover_ponto_unico
+
+def test_crossover_ponto_unico_gera_filhos_complementares():
+    qtdades_pai = array('i', range(12))
+    qtdades_mae = array('i', range(100, 112))
+    area_corte_cromossomo = 5
+
+    qtdades_filho1, qtdades_filho2 = crossover_ponto_unico(qtdades_pai, qtdades_mae, area_corte_cromossomo)
+
+    assert list(qtdades_filho1) == list(qtdades_pai[:area_corte_cromossomo]) + list(qtdades_mae[area_corte_cromossomo:])
+    assert list(qtdades_filho2) == list(qtdades_mae[:area_corte_cromossomo]) + list(qtdades_pai[area_corte_cromossomo:])
+    assert list(qtdades_pai) == list(range(12)), 'O crossover não pode alterar o cromossomo do pai'
@@ -0,0 +1,72 @@
+from collections import Counter, namedtuple
+import numpy as np
+from carteira_energia.selecao.estrategias_selecao import SelecaoRoleta, SelecaoTorneio, SelecaoRanking
+
+IndividuoTeste = namedtuple('IndividuoTeste', ['nome', 'nota_avaliacao'])
+
+QTDADE_SORTEIOS = 5000
+
+def _gerar_populacao_ordenada():
+    return [IndividuoTeste(nome=f'I{indice}', nota_avaliacao=nota) for indice, nota in enumerate([10, 20, 30, 40, 100])]
+
+def test_selecao_roleta_prioriza_primeiros_individuos():
+    lista_populacao = _gerar_populacao_ordenada()
+
+    estrategia = SelecaoRoleta()
+    estrategia.preparar(lista_populacao, np.random.default_rng(146))
+
+    contador = Counter(estrategia.sortear().nome for _ in range(QTDADE_SORTEIOS))
+
+    # A roleta é invertida: o primeiro indivíduo (menor nota) recebe a fatia do último (maior nota)
+    assert contador['I0'] > contador['I4'], 'O melhor indivíduo deveria ser sorteado mais vezes que o pior'
+
+def test_selecao_torneio_retorna_individuo_da_populacao():
+    lista_populacao = _gerar_populacao_ordenada()
+
+    estrategia = SelecaoTorneio(tamanho_torneio=len(lista_populacao))
+    estrategia.preparar(lista_populacao, np.random.default_rng(146))
+
+    assert estrategia.sortear() is lista_populacao[0], 'Com torneio do tamanho da população o vencedor deve ser sempre o melhor indivíduo'
+
+def test_selecao_ranking_prioriza_primeiros_individuos():
+    lista_populacao = _gerar_populacao_ordenada()
+
+    estrategia = SelecaoRanking()
+    estrategia.preparar(lista_populacao, np.random.default_rng(146))
+
+    contador = Counter(estrategia.sortear().nome for _ in range(QTDADE_SORTEIOS))
+
+    assert contador['I0'] > contador['I2'] > contador['I4'], 'A frequência de sorteio deve seguir a posição no ranking'
+
+def test_selecao_roleta_sorteio_em_lote_prioriza_primeiros_individuos():
+    lista_populacao = _gerar_populacao_ordenada()
+
+    estrategia = SelecaoRoleta()
+    estrategia.preparar(lista_populacao, np.random.default_rng(146))
+
+    lista_pais = estrategia.sortear_lista_pais(QTDADE_SORTEIOS)
+    contador = Counter(individuo.nome for par in lista_pais for individuo in par)
+
+    assert len(lista_pais) == QTDADE_SORTEIOS
+    assert contador['I0'] > contador['I4'], 'O melhor indivíduo deveria ser sorteado mais vezes que o pior'
+
+def test_selecao_indices_populacao_vazia():
+    for estrategia in (SelecaoRoleta(), SelecaoTorneio(), SelecaoRanking()):
+        estrategia.preparar_indices(0, np.empty(0), np.random.default_rng(146))
+
+        assert estrategia.sortear_matriz_indices_pais(10).shape == (0, 2), 'Sem indivíduos nenhum par deve ser sorteado'
+
+def test_selecao_indices_igual_lista():
+    lista_populacao = _gerar_populacao_ordenada()
+    vetor_notas = np.array([individuo.nota_avaliacao for individuo in lista_populacao], dtype=float)
+
+    for classe_estrategia in (SelecaoRoleta, SelecaoTorneio, SelecaoRanking):
+        estrategia_lista, estrategia_indices = classe_estrategia(), classe_estrategia()
+        estrategia_lista.preparar(lista_populacao, np.random.default_rng(146))
+        estrategia_indices.preparar_indices(len(lista_populacao), vetor_notas, np.random.default_rng(146))
+
+        lista_pais = estrategia_lista.sortear_lista_pais(100)
+        matriz_indices = estrategia_indices.sortear_matriz_indices_pais(100)
+
+        assert [(pai.nome, mae.nome) for pai, mae in lista_pais] == [(f'I{pai}', f'I{mae}') for pai, mae in matriz_indices.tolist()], \
+               'Os sorteios por índice devem ser os mesmos da população de indivíduos'
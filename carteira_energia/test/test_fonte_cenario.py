@@ -0,0 +1,33 @@
+import pytest
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
+from carteira_energia.dao.fonte_cenario import DadosCenario, FonteCenarioArquivo, FonteCenarioMemoria
+
+def test_configuracao_cenario_fonte_memoria(dados_cenario: DadosCenario):
+    dados_cenario_a2 = DadosCenario(meta_anual_venda_kwm=20, volume_financeiro_meta_ganhos=1, volume_financeiro_risco_anual=2,
+                                    lista_preco_pld_mes=[50] * 12, lista_risco_mes=[60] * 12)
+    fonte_cenario = FonteCenarioMemoria({1: dados_cenario, 2: dados_cenario_a2})
+
+    configuracao_a1 = ConfiguracaoCenario(ano_simulacao=1, horizonte=1, fonte_cenario=fonte_cenario)
+    configuracao_a2 = ConfiguracaoCenario(ano_simulacao=2, horizonte=2, fonte_cenario=fonte_cenario)
+
+    assert configuracao_a1.get_dados_cenario() == dados_cenario
+    assert configuracao_a2.get_dados_cenario() == dados_cenario_a2
+
+@pytest.mark.parametrize('extensao', [FonteCenarioArquivo.EXTENSAO_CSV, FonteCenarioArquivo.EXTENSAO_PARQUET])
+def test_fonte_arquivo_salvar_carregar(tmp_path, extensao: str, configuracao_cenario: ConfiguracaoCenario):
+    if extensao == FonteCenarioArquivo.EXTENSAO_PARQUET:
+        pytest.importorskip('pyarrow')
+
+    fonte_cenario = FonteCenarioArquivo(str(tmp_path), extensao=extensao)
+    caminho_arquivo = fonte_cenario.salvar_dados_cenario(configuracao_cenario.get_dados_cenario(), horizonte=3)
+
+    assert caminho_arquivo.endswith(f'cenario_A+3.{extensao}')
+
+    configuracao_arquivo = ConfiguracaoCenario(ano_simulacao=3, horizonte=3, fonte_cenario=fonte_cenario)
+
+    assert configuracao_arquivo.get_dados_cenario() == configuracao_cenario.get_dados_cenario()
+    assert (configuracao_arquivo.vetor_coeficientes_ganhos == configuracao_cenario.vetor_coeficientes_ganhos).all()
+
+def test_fonte_arquivo_extensao_invalida(tmp_path):
+    with pytest.raises(ValueError):
+        FonteCenarioArquivo(str(tmp_path), extensao='xlsx')
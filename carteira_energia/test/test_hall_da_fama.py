@@ -0,0 +1,42 @@
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
+from carteira_energia.entidades.hall_da_fama import HallDaFama
+from carteira_energia.entidades.individuo import Individuo
+
+def test_hall_da_fama_descarta_cromossomos_repetidos(configuracao_cenario: ConfiguracaoCenario):
+    hall_da_fama = HallDaFama(capacidade=10)
+    qtdades = [1] * 12
+
+    assert hall_da_fama.adicionar(Individuo.criar_a_partir_qtdades(configuracao_cenario, qtdades))
+    assert not hall_da_fama.adicionar(Individuo.criar_a_partir_qtdades(configuracao_cenario, qtdades, geracao=3)), 'Cromossomo repetido não pode ser guardado'
+    assert len(hall_da_fama) == 1
+
+def test_hall_da_fama_mantem_apenas_melhores(configuracao_cenario: ConfiguracaoCenario):
+    capacidade = 5
+    hall_da_fama = HallDaFama(capacidade=capacidade)
+    lista_individuos = [Individuo(configuracao_cenario) for _ in range(50)]
+
+    for individuo in lista_individuos:
+        hall_da_fama.adicionar(individuo)
+
+    lista_esperada = sorted(lista_individuos, key=lambda individuo: individuo.chave_ordenacao, reverse=True)[:capacidade]
+
+    assert len(hall_da_fama) == capacidade
+    assert [individuo.chave_ordenacao for individuo in hall_da_fama.get_lista_individuos()] == \
+           [individuo.chave_ordenacao for individuo in lista_esperada], 'O hall da fama deve guardar os melhores indivíduos em ordem'
+
+def test_hall_da_fama_nao_muda_com_alteracao_do_individuo(configuracao_cenario: ConfiguracaoCenario):
+    hall_da_fama = HallDaFama(capacidade=10)
+    qtdades = [2] * 12
+    individuo = Individuo.criar_a_partir_qtdades(configuracao_cenario, qtdades)
+    chave_ordenacao = individuo.chave_ordenacao
+
+    hall_da_fama.adicionar(individuo)
+    individuo.ajustar_cromossomo()
+
+    individuo_guardado, = hall_da_fama.get_lista_individuos()
+
+    assert list(individuo.qtdades_energia) != qtdades, 'O ajuste deve alterar o indivíduo da população'
+    assert list(individuo_guardado.qtdades_energia) == qtdades, 'O hall da fama deve guardar o indivíduo como ele era na inserção'
+    assert individuo_guardado.chave_ordenacao == chave_ordenacao
+    assert Individuo.criar_a_partir_qtdades(configuracao_cenario, qtdades) in hall_da_fama
+    assert hall_da_fama.adicionar(Individuo.criar_a_partir_qtdades(configuracao_cenario, individuo.qtdades_energia))
@@ -0,0 +1,34 @@
+import numpy as np
+from carteira_energia.operadores.inicializacao import gerar_qtdades_simplex, gerar_matriz_qtdades_simplex
+
+META_ANUAL_VENDA_KWM = 20
+QTDADE_MESES_ANO = 12
+
+def test_qtdades_simplex_viaveis():
+    rng = np.random.default_rng(146)
+
+    for _ in range(500):
+        qtdades = gerar_qtdades_simplex(QTDADE_MESES_ANO, META_ANUAL_VENDA_KWM, rng)
+
+        assert len(qtdades) == QTDADE_MESES_ANO
+        assert all(qtdade >= 0 for qtdade in qtdades), 'Nenhum gene pode ser negativo'
+        assert sum(qtdades) == META_ANUAL_VENDA_KWM, 'A soma dos genes deve ser igual à meta'
+
+def test_matriz_qtdades_simplex_viavel():
+    matriz_qtdades = gerar_matriz_qtdades_simplex(1000, QTDADE_MESES_ANO, META_ANUAL_VENDA_KWM, np.random.default_rng(146))
+
+    assert matriz_qtdades.shape == (1000, QTDADE_MESES_ANO)
+    assert (matriz_qtdades >= 0).all(), 'Nenhum gene pode ser negativo'
+    assert (matriz_qtdades.sum(axis=1) == META_ANUAL_VENDA_KWM).all(), 'A soma dos genes deve ser igual à meta'
+
+def test_qtdades_simplex_mesma_distribuicao_vetorizada():
+    # Ambas as versões sorteiam uniformemente entre as alocações: a probabilidade de um mês ficar zerado é
+    # (qtdade_meses_ano - 1) / (meta + qtdade_meses_ano - 1)
+    fracao_zeros_esperada = (QTDADE_MESES_ANO - 1) / (META_ANUAL_VENDA_KWM + QTDADE_MESES_ANO - 1)
+
+    rng = np.random.default_rng(146)
+    matriz_qtdades = np.array([gerar_qtdades_simplex(QTDADE_MESES_ANO, META_ANUAL_VENDA_KWM, rng) for _ in range(5000)])
+    matriz_qtdades_vetorizada = gerar_matriz_qtdades_simplex(5000, QTDADE_MESES_ANO, META_ANUAL_VENDA_KWM, np.random.default_rng(146))
+
+    assert abs((matriz_qtdades == 0).mean() - fracao_zeros_esperada) < 0.01
+    assert abs((matriz_qtdades_vetorizada == 0).mean() - fracao_zeros_esperada) < 0.01
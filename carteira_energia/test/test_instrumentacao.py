@@ -0,0 +1,47 @@
+import csv
+import json
+from carteira_energia.entidades.algoritmo_genetico import AlgoritmoGenetico
+from carteira_energia.entidades.algoritmo_genetico_vetorizado import AlgoritmoGeneticoVetorizado
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
+from carteira_energia.parada.criterios_parada import CriterioMaximoGeracoes
+from carteira_energia.util.instrumentacao import InstrumentacaoExecucao
+
+QTDADE_GERACOES = 3
+
+def _executar_instrumentado(classe_algoritmo, configuracao_cenario: ConfiguracaoCenario) -> tuple[AlgoritmoGenetico, list]:
+    lista_registros_callback = []
+    instrumentacao = InstrumentacaoExecucao(callback=lista_registros_callback.append, calcular_diversidade=True)
+
+    algoritmo = classe_algoritmo(ano_simulacao=1, configuracao_cenario=configuracao_cenario, instrumentacao=instrumentacao,
+                                 criterios_parada=[CriterioMaximoGeracoes(QTDADE_GERACOES)])
+    algoritmo.executar()
+
+    return algoritmo, lista_registros_callback
+
+def test_registro_por_geracao(configuracao_cenario: ConfiguracaoCenario):
+    for classe_algoritmo in (AlgoritmoGenetico, AlgoritmoGeneticoVetorizado):
+        algoritmo, lista_registros_callback = _executar_instrumentado(classe_algoritmo, configuracao_cenario)
+        lista_registros = algoritmo.instrumentacao.lista_registros
+
+        assert [registro.geracao for registro in lista_registros] == list(range(1, QTDADE_GERACOES + 1))
+        assert lista_registros_callback == lista_registros, 'O callback deve receber o registro de cada geração'
+        assert sum(registro.qtdade_avaliacoes for registro in lista_registros) == algoritmo.estado_execucao.qtdade_avaliacoes
+        assert all(registro.tempo_total > 0 for registro in lista_registros)
+        assert all(0 < registro.tamanho_populacao <= configuracao_cenario.tamanho_populacao for registro in lista_registros)
+        assert all(registro.diversidade is not None for registro in lista_registros)
+
+def test_exportar_registros_csv_json(configuracao_cenario: ConfiguracaoCenario, tmp_path):
+    algoritmo, _ = _executar_instrumentado(AlgoritmoGeneticoVetorizado, configuracao_cenario)
+
+    algoritmo.instrumentacao.exportar_csv(tmp_path / 'instrumentacao.csv')
+    algoritmo.instrumentacao.exportar_json(tmp_path / 'instrumentacao.json')
+
+    with open(tmp_path / 'instrumentacao.csv', newline='', encoding='utf-8') as arquivo:
+        lista_linhas_csv = list(csv.DictReader(arquivo))
+
+    with open(tmp_path / 'instrumentacao.json', encoding='utf-8') as arquivo:
+        lista_registros_json = json.load(arquivo)
+
+    assert len(lista_linhas_csv) == len(lista_registros_json) == QTDADE_GERACOES
+    assert lista_registros_json == algoritmo.instrumentacao.get_lista_dicts()
+    assert int(lista_linhas_csv[0]['qtdade_avaliacoes']) == lista_registros_json[0]['qtdade_avaliacoes']
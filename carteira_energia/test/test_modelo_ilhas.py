@@ -0,0 +1,106 @@
+import multiprocessing
+import os
+import pytest
+from carteira_energia.dao.fonte_cenario import DadosCenario, FonteCenarioMemoria
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
+from carteira_energia.entidades.algoritmo_genetico import AlgoritmoGenetico
+from carteira_energia.entidades.algoritmo_genetico_vetorizado import AlgoritmoGeneticoVetorizado
+from carteira_energia.parada.criterios_parada import CriterioMaximoGeracoes
+from carteira_energia.util.modelo_ilhas import executar_modelo_ilhas
+
+QTDADE_ILHAS = 3
+TAMANHO_POPULACAO = 60
+
+class _RegistroMigrantes:
+    """
+    Cada ilha envia migrantes marcados com o seu índice (a semente da ilha) no primeiro mês e registra de qual ilha recebeu os seus
+    """
+
+    def __init__(self, ano_simulacao: int, semente: int = 0, vetor_origem_migrantes=None, **kwargs):
+        super().__init__(ano_simulacao, semente=semente, **kwargs)
+        self.indice_ilha = semente
+        self.vetor_origem_migrantes = vetor_origem_migrantes
+
+    def _obter_emigrantes(self, qtdade_migrantes: int) -> list[list[int]]:
+        return [[self.indice_ilha] + qtdades[1:] for qtdades in super()._obter_emigrantes(qtdade_migrantes)]
+
+    def _receber_migrantes(self, lista_qtdades: list, geracao: int):
+        self.vetor_origem_migrantes[self.indice_ilha] = lista_qtdades[0][0]
+        super()._receber_migrantes(lista_qtdades, geracao)
+
+class _AlgoritmoGeneticoRegistroMigrantes(_RegistroMigrantes, AlgoritmoGenetico):
+    pass
+
+class _AlgoritmoGeneticoVetorizadoRegistroMigrantes(_RegistroMigrantes, AlgoritmoGeneticoVetorizado):
+    pass
+
+class _AlgoritmoGeneticoFalhaIlha(AlgoritmoGenetico):
+    """ A ilha 1 falha na segunda geração: encerrando o processo abruptamente ou lançando uma exceção """
+
+    def __init__(self, ano_simulacao: int, semente: int = 0, encerrar_processo: bool = False, **kwargs):
+        super().__init__(ano_simulacao, semente=semente, **kwargs)
+        self.indice_ilha = semente
+        self.encerrar_processo = encerrar_processo
+
+    def _executar_geracao(self):
+        if self.indice_ilha == 1 and self.estado_execucao.geracao >= 1:
+            if self.encerrar_processo:
+                os._exit(1)
+            raise ValueError('falha simulada')
+        super()._executar_geracao()
+
+@pytest.fixture
+def configuracao_cenario_ilhas(dados_cenario: DadosCenario):
+    return ConfiguracaoCenario(tamanho_populacao=TAMANHO_POPULACAO,
+                               ano_simulacao=1,
+                               fonte_cenario=FonteCenarioMemoria(dados_cenario))
+
+@pytest.mark.parametrize('classe_algoritmo', [_AlgoritmoGeneticoRegistroMigrantes, _AlgoritmoGeneticoVetorizadoRegistroMigrantes])
+def test_migrantes_vem_da_ilha_vizinha(configuracao_cenario_ilhas: ConfiguracaoCenario, classe_algoritmo):
+    vetor_origem_migrantes = multiprocessing.Array('i', [-1] * QTDADE_ILHAS, lock=False)
+
+    lista_resultados = executar_modelo_ilhas(classe_algoritmo=classe_algoritmo,
+                                             configuracao_cenario=configuracao_cenario_ilhas,
+                                             lista_sementes=list(range(QTDADE_ILHAS)),
+                                             intervalo_migracao=2,
+                                             qtdade_migrantes=2,
+                                             parametros_algoritmo={'criterios_parada': [CriterioMaximoGeracoes(6)],
+                                                                   'vetor_origem_migrantes': vetor_origem_migrantes})
+
+    assert lista_resultados, 'Os melhores indivíduos das ilhas devem ser retornados'
+    assert list(vetor_origem_migrantes) == [(indice_ilha - 1) % QTDADE_ILHAS for indice_ilha in range(QTDADE_ILHAS)], \
+           'Cada ilha deve receber os migrantes da ilha anterior do anel'
+
+@pytest.mark.parametrize('classe_algoritmo', [AlgoritmoGenetico, AlgoritmoGeneticoVetorizado])
+def test_modelo_ilhas_reune_hall_da_fama(configuracao_cenario_ilhas: ConfiguracaoCenario, classe_algoritmo):
+    algoritmo = classe_algoritmo(ano_simulacao=1, configuracao_cenario=configuracao_cenario_ilhas, criterios_parada=[CriterioMaximoGeracoes(4)])
+    algoritmo.executar(qtdade_ilhas=QTDADE_ILHAS, intervalo_migracao=2, qtdade_migrantes=2)
+
+    lista_melhores_individuos = algoritmo.get_lista_melhores_individuos()
+
+    assert lista_melhores_individuos, 'O hall da fama deve reunir os melhores indivíduos de todas as ilhas'
+    assert algoritmo.melhor_individuo is lista_melhores_individuos[0]
+    assert all(individuo.configuracao_cenario is configuracao_cenario_ilhas for individuo in lista_melhores_individuos)
+
+@pytest.mark.parametrize('encerrar_processo, mensagem', [(True, 'ilha 1 encerrada sem enviar o resultado'),
+                                                         (False, 'ilha 1 falhou: ValueError')])
+def test_falha_ilha_identificada(configuracao_cenario_ilhas: ConfiguracaoCenario, encerrar_processo: bool, mensagem: str):
+    with pytest.raises(RuntimeError, match=mensagem):
+        executar_modelo_ilhas(classe_algoritmo=_AlgoritmoGeneticoFalhaIlha,
+                              configuracao_cenario=configuracao_cenario_ilhas,
+                              lista_sementes=list(range(QTDADE_ILHAS)),
+                              intervalo_migracao=2,
+                              qtdade_migrantes=2,
+                              parametros_algoritmo={'criterios_parada': [CriterioMaximoGeracoes(6)],
+                                                    'encerrar_processo': encerrar_processo})
+
+def test_tempo_limite_sincronizacao(configuracao_cenario_ilhas: ConfiguracaoCenario):
+    # Com tempo limite zero as ilhas não esperam umas pelas outras na migração
+    with pytest.raises(RuntimeError, match='tempo limite de sincronização'):
+        executar_modelo_ilhas(classe_algoritmo=AlgoritmoGenetico,
+                              configuracao_cenario=configuracao_cenario_ilhas,
+                              lista_sementes=list(range(QTDADE_ILHAS)),
+                              intervalo_migracao=2,
+                              qtdade_migrantes=2,
+                              parametros_algoritmo={'criterios_parada': [CriterioMaximoGeracoes(6)]},
+                              tempo_limite_sincronizacao=0)
@@ -0,0 +1,40 @@
+from carteira_energia.entidades.configuracao_cenario import ConfiguracaoCenario
+from carteira_energia.entidades.individuo import Individuo
+from carteira_energia.entidades.algoritmo_genetico import AlgoritmoGenetico
+from carteira_energia.parada.criterios_parada import CriterioMaximoGeracoes
+from carteira_energia.util.processamento_paralelo import DadosAvaliacaoCenario, compactar_lote_cromossomos, avaliar_lote_cromossomos, ajustar_lote_cromossomos
+
+def test_avaliacao_lote_igual_individuo(configuracao_cenario: ConfiguracaoCenario):
+    lista_individuos = [Individuo(configuracao_cenario) for _ in range(20)]
+
+    lote = compactar_lote_cromossomos(individuo.qtdades_energia for individuo in lista_individuos)
+    lista_avaliacoes = avaliar_lote_cromossomos(DadosAvaliacaoCenario.a_partir_configuracao(configuracao_cenario), lote)
+
+    for individuo, (nota, ganhos, risco, estourou_limite) in zip(lista_individuos, lista_avaliacoes):
+        assert nota == individuo.nota_avaliacao, 'Nota calculada no lote está diferente da nota do indivíduo'
+        assert ganhos == individuo.ganhos_financeiro_melhor_cenario
+        assert risco == individuo.risco_financeiro_cenario
+        assert estourou_limite == individuo.verificar_estouro_limite_qtdade_energia()
+
+def test_ajuste_lote_respeita_meta(configuracao_cenario: ConfiguracaoCenario):
+    qtdade_meses_ano = len(configuracao_cenario.lista_preco_pld_mes)
+    lista_individuos = [Individuo(configuracao_cenario) for _ in range(20)]
+
+    lote = ajustar_lote_cromossomos(configuracao_cenario.meta_anual_venda_kwm, qtdade_meses_ano,
+                                    compactar_lote_cromossomos(individuo.qtdades_energia for individuo in lista_individuos), semente=146)
+
+    for inicio in range(0, len(lote), qtdade_meses_ano):
+        assert sum(lote[inicio:inicio + qtdade_meses_ano]) <= configuracao_cenario.meta_anual_venda_kwm, 'Cromossomo ajustado ultrapassa a meta de venda'
+        assert min(lote[inicio:inicio + qtdade_meses_ano]) >= 0, 'Cromossomo ajustado não pode ter quantidade negativa'
+
+def test_execucao_paralela_igual_serial(configuracao_cenario: ConfiguracaoCenario):
+    lista_resultados = []
+
+    for n_workers in (1, 3):
+        algoritmo = AlgoritmoGenetico(ano_simulacao=1, n_workers=n_workers, configuracao_cenario=configuracao_cenario, semente=146,
+                                      criterios_parada=[CriterioMaximoGeracoes(3)])
+        algoritmo.executar()
+
+        lista_resultados.append([list(individuo.qtdades_energia) for individuo in algoritmo.get_lista_melhores_individuos()])
+
+    assert lista_resultados[0] == lista_resultados[1], 'Com a mesma semente o resultado não pode depender da quantidade de processos'
@@ -0,0 +1,54 @@
+import numpy as np
+from carteira_energia.operadores.reparo import calcular_reducao_proporcional, calcular_reducao_proporcional_populacao
+from carteira_energia.util.processamento_paralelo import compactar_lote_cromossomos, ajustar_lote_cromossomos
+
+META_ANUAL_VENDA_KWM = 20
+META_ANUAL_VENDA_KWM_FRACIONARIA = 14.5
+
+def test_reducao_proporcional_atinge_meta():
+    rng = np.random.default_rng(146)
+
+    for _ in range(200):
+        qtdades = [int(rng.integers(0, 60)) for _ in range(12)]
+        lista_reducao = calcular_reducao_proporcional(qtdades, META_ANUAL_VENDA_KWM, rng)
+
+        assert all(0 <= reducao <= qtdade for qtdade, reducao in zip(qtdades, lista_reducao)), 'Nenhum gene pode ficar negativo'
+        assert sum(qtdades) - sum(lista_reducao) == min(sum(qtdades), META_ANUAL_VENDA_KWM), 'Após o reparo a soma deve ser igual à meta'
+
+def test_reducao_proporcional_populacao_atinge_meta():
+    rng = np.random.default_rng(146)
+    matriz_qtdades = rng.integers(0, 60, size=(500, 12))
+
+    matriz_ajustada = matriz_qtdades - calcular_reducao_proporcional_populacao(matriz_qtdades, META_ANUAL_VENDA_KWM, rng)
+
+    assert (matriz_ajustada >= 0).all(), 'Nenhum gene pode ficar negativo'
+    assert (matriz_ajustada.sum(axis=1) == np.minimum(matriz_qtdades.sum(axis=1), META_ANUAL_VENDA_KWM)).all(), 'Após o reparo a soma deve ser igual à meta'
+
+def test_reducao_proporcional_meta_fracionaria():
+    rng = np.random.default_rng(146)
+    qtdades = [int(rng.integers(0, 60)) for _ in range(12)]
+
+    lista_reducao = calcular_reducao_proporcional(qtdades, META_ANUAL_VENDA_KWM_FRACIONARIA, rng)
+
+    assert all(isinstance(reducao, int) for reducao in lista_reducao), 'As reduções devem ser inteiras'
+    assert sum(qtdades) - sum(lista_reducao) == int(META_ANUAL_VENDA_KWM_FRACIONARIA), 'Após o reparo a soma deve ser a parte inteira da meta'
+
+def test_reducao_proporcional_populacao_meta_fracionaria():
+    rng = np.random.default_rng(146)
+    matriz_qtdades = rng.integers(0, 60, size=(500, 12))
+
+    matriz_reducao = calcular_reducao_proporcional_populacao(matriz_qtdades, META_ANUAL_VENDA_KWM_FRACIONARIA, rng)
+    # Subtração no próprio array, como no algoritmo vetorizado
+    matriz_qtdades -= matriz_reducao
+
+    assert matriz_reducao.dtype == np.int64, 'As reduções devem ser inteiras'
+    assert (matriz_qtdades.sum(axis=1) <= int(META_ANUAL_VENDA_KWM_FRACIONARIA)).all(), 'Após o reparo a soma não pode ultrapassar a meta'
+
+def test_ajuste_lote_meta_fracionaria():
+    rng = np.random.default_rng(146)
+    lista_qtdades = [[int(qtdade) for qtdade in rng.integers(0, 60, size=12)] for _ in range(20)]
+
+    lote = ajustar_lote_cromossomos(META_ANUAL_VENDA_KWM_FRACIONARIA, 12, compactar_lote_cromossomos(lista_qtdades), semente=146)
+
+    assert all(sum(lote[inicio:inicio + 12]) == int(META_ANUAL_VENDA_KWM_FRACIONARIA) for inicio in range(0, len(lote), 12)), \
+           'Após o reparo a soma deve ser a parte inteira da meta'
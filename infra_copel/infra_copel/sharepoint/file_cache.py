@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Cache local (em disco) do conteúdo de arquivos do Sharepoint."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import time
+
+
+class FileCache:
+    """
+    Cache em disco do conteúdo de arquivos, com tamanho máximo.
+
+    Cada entrada guarda o conteúdo do arquivo e a versão (ETag e data de
+    modificação no servidor) com que foi baixado. A entrada só é válida
+    enquanto a versão no servidor for a mesma. Quando o tamanho total
+    ultrapassa o máximo, as entradas usadas há mais tempo são removidas
+    (LRU).
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_size: int = 512 * 2**20):
+        """
+        Construtor do cache.
+
+        Parameters
+        ----------
+        directory : str | os.PathLike
+            Diretório onde os arquivos são guardados (criado se não existir).
+        max_size : int, default is 512 MiB
+            Tamanho máximo, em bytes, do conteúdo guardado.
+
+        """
+        self.directory = pathlib.Path(directory)
+        self.max_size = max_size
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def get_key(*parts: str) -> str:
+        """
+        Chave de uma entrada do cache.
+
+        Parameters
+        ----------
+        *parts : str
+            Partes que identificam o arquivo (site, pasta e nome do arquivo).
+
+        Returns
+        -------
+        str
+
+        """
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    def _get_paths(self, key: str) -> tuple[pathlib.Path, pathlib.Path]:
+        return self.directory / f"{key}.bin", self.directory / f"{key}.json"
+
+    def get(self, key: str, version: str) -> bytes | None:
+        """
+        Retorna o conteúdo guardado, se ainda for da versão informada.
+
+        Parameters
+        ----------
+        key : str
+            Chave da entrada (ver get_key).
+        version : str
+            Versão atual do arquivo no servidor.
+
+        Returns
+        -------
+        bytes | None
+            Conteúdo do arquivo ou None se não estiver no cache ou se a
+            versão guardada for outra.
+
+        """
+        path_content, path_metadata = self._get_paths(key)
+
+        try:
+            metadata = json.loads(path_metadata.read_text(encoding="utf-8"))
+            if metadata["version"] != version:
+                return None
+            content = path_content.read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+
+        if len(content) != metadata.get("size"):
+            # Entrada incompleta (ex.: gravação interrompida)
+            self.remove(key)
+            return None
+
+        # A data de acesso define a ordem de remoção (LRU)
+        now = time.time()
+        os.utime(path_content, (now, now))
+
+        return content
+
+    def put(self, key: str, version: str, content: bytes) -> None:
+        """
+        Guarda o conteúdo de um arquivo e remove as entradas mais antigas
+        caso o tamanho máximo seja ultrapassado.
+
+        Parameters
+        ----------
+        key : str
+            Chave da entrada (ver get_key).
+        version : str
+            Versão do arquivo no servidor.
+        content : bytes
+            Conteúdo do arquivo.
+
+        """
+        if len(content) > self.max_size:
+            return
+
+        path_content, path_metadata = self._get_paths(key)
+
+        # Escrita em temporários renomeados ao final: leitores nunca veem
+        # um arquivo pela metade
+        for path, data in ((path_content, content),
+                           (path_metadata, json.dumps({"version": version, "size": len(content)}).encode("utf-8"))):
+            path_tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            path_tmp.write_bytes(data)
+            os.replace(path_tmp, path)
+
+        self._evict()
+
+    def remove(self, key: str) -> None:
+        """
+        Remove uma entrada do cache (ex.: após upload ou exclusão do arquivo).
+
+        Parameters
+        ----------
+        key : str
+            Chave da entrada (ver get_key).
+
+        """
+        for path in self._get_paths(key):
+            path.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.bin"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path.stem))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, key in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self.remove(key)
+            total_size -= size
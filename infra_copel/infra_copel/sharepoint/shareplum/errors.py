@@ -1,5 +1,7 @@
 class ShareplumError(Exception):
     def __init__(self, msg, details=None):
+        # Original exception (e.g. requests.HTTPError, with the response)
+        self.details = details
         if details:
             super().__init__(f"{msg} : {details}")
         else:
@@ -1,23 +1,25 @@
-from .request_helper import get, post
+from .request_helper import get
+from .form_digest import _FormDigest
 import json
 
 
 class _Folder():
-    def __init__(self, session, folder_name, url, timeout=None):
+    def __init__(self, session, folder_name, url, timeout=None, create=True, form_digest=None):
         self._session = session
+        # Digest shared with the site (and its other folders) when given
+        self._form_digest = form_digest if form_digest is not None else _FormDigest(session, url)
         self.folder_name = folder_name
         self._escaped_folder_name = self._escape_name(self.folder_name)
         self.site_url = url
         self.timeout = timeout
 
-        self.info = self._create_folder()
+        # create=False only looks the folder up (single GET) and fails if it does not exist
+        self.info = self._create_folder() if create else self._get_folder_info()
         self._escaped_relative_url = self._escape_name(self.info['d']['ServerRelativeUrl'])
 
     @property
     def contextinfo(self):
-        response = post(self._session, self.site_url + "/_api/contextinfo")
-        data = response.json()
-        return data
+        return self._form_digest.contextinfo
 
     def _escape_name(self, name):
         return name.replace("'", "''")
@@ -31,10 +33,17 @@ class _Folder():
         url = self.site_url + f"/_api/web/folders"
 
         headers = {'Accept': 'application/json;odata=verbose',
-                   'Content-Type': 'application/json;odata=verbose',
-                   'X-RequestDigest': self.contextinfo['FormDigestValue']}
+                   'Content-Type': 'application/json;odata=verbose'}
 
-        response = post(self._session, url=url, headers=headers, data=body, timeout=self.timeout)
+        response = self._form_digest.post(url=url, headers=headers, data=body, timeout=self.timeout)
+
+        return response.json()
+
+    def _get_folder_info(self):
+        url = self.site_url + f"/_api/web/GetFolderByServerRelativeUrl('{self._escaped_folder_name}')"
+        headers = {'Accept': 'application/json;odata=verbose'}
+
+        response = get(self._session, url=url, headers=headers, timeout=self.timeout)
 
         return response.json()
 
@@ -45,10 +54,9 @@ class _Folder():
             headers = {'Accept': 'application/json;odata=verbose',
                        'If-Match': '*',
                        'X-HTTP-Method': 'DELETE',
-                       'Content-Type': 'application/json;odata=verbose',
-                       'X-RequestDigest': self.contextinfo['FormDigestValue']}
+                       'Content-Type': 'application/json;odata=verbose'}
 
-            post(self._session, url=url, headers=headers)
+            self._form_digest.post(url=url, headers=headers)
         else:
             print('You must pass the relative folder url to delete a folder')
 
@@ -59,10 +67,9 @@ class _Folder():
         headers = {'Accept': 'application/json;odata=verbose',
                    'If-Match': '*',
                    'X-HTTP-Method': 'DELETE',
-                   'Content-Type': 'application/json;odata=verbose',
-                   'X-RequestDigest': self.contextinfo['FormDigestValue']}
+                   'Content-Type': 'application/json;odata=verbose'}
 
-        post(self._session, url=url, headers=headers)
+        self._form_digest.post(url=url, headers=headers)
 
     @property
     def items(self):
@@ -82,22 +89,19 @@ class _Folder():
     def upload_file(self, content, file_name):
         escaped_file_name = self._escape_name(file_name)
         url = self.site_url + f"/_api/web/GetFolderByServerRelativeUrl('{self._escaped_folder_name}')/Files/add(url='{escaped_file_name}',overwrite=true)"
-        headers = {'X-RequestDigest': self.contextinfo['FormDigestValue']}
 
-        post(self._session, url=url, headers=headers, data=content, timeout=self.timeout)
+        self._form_digest.post(url=url, data=content, timeout=self.timeout)
 
     def check_out(self, file_name):
         escaped_file_name = self._escape_name(file_name)
         url = self.site_url + f"/_api/web/GetFileByServerRelativeUrl('{self._escaped_relative_url}/{escaped_file_name}')/CheckOut()"
-        headers = {'X-RequestDigest': self.contextinfo['FormDigestValue']}
 
-        post(self._session, url=url, headers=headers)
+        self._form_digest.post(url=url)
 
     def check_in(self, file_name, comment):
         escaped_file_name = self._escape_name(file_name)
         url = self.site_url + f"/_api/web/GetFileByServerRelativeUrl('{self._escaped_relative_url}/{escaped_file_name}')/CheckIn(comment='{comment}',checkintype=0)"
-        headers = {'X-RequestDigest': self.contextinfo['FormDigestValue']}
-        post(self._session, url=url, headers=headers)
+        self._form_digest.post(url=url)
 
     def get_file(self, file_name):
         escaped_file_name = self._escape_name(file_name)
@@ -105,5 +109,6 @@ class _Folder():
         return response.content
     
     def get_file_properties(self, file_name):
-        file_properties= get(self._session, self.site_url + f"/_api/web/GetFileByServerRelativeUrl('{self.info['d']['ServerRelativeUrl']}/{file_name}')?/$expand=ListItemAllFields")
+        escaped_file_name = self._escape_name(file_name)
+        file_properties = get(self._session, self.site_url + f"/_api/web/GetFileByServerRelativeUrl('{self._escaped_relative_url}/{escaped_file_name}')?$expand=ListItemAllFields")
         return file_properties.json()
@@ -0,0 +1,60 @@
+import time
+
+from .request_helper import post
+from .errors import ShareplumRequestError
+
+
+class _FormDigest():
+    """Request digest (X-RequestDigest) of a site session.
+
+    The digest returned by /_api/contextinfo is valid for FormDigestTimeoutSeconds, so it is
+    fetched once and shared by the site and its folders until it expires or is rejected (403).
+    """
+    # Renew the digest a little before the server timeout
+    EXPIRY_MARGIN_SECONDS = 60
+    DEFAULT_TIMEOUT_SECONDS = 1800
+
+    def __init__(self, session, site_url):
+        self._session = session
+        self.site_url = site_url
+        self._value = None
+        self._expires_at = 0.0
+
+    @property
+    def contextinfo(self):
+        response = post(self._session, self.site_url + "/_api/contextinfo")
+        data = response.json()
+        # odata=verbose wraps the response
+        return data.get('d', {}).get('GetContextWebInformation', data)
+
+    @property
+    def value(self):
+        if self._value is None or time.monotonic() >= self._expires_at:
+            self.refresh()
+        return self._value
+
+    def refresh(self):
+        contextinfo = self.contextinfo
+        timeout_seconds = int(contextinfo.get('FormDigestTimeoutSeconds', self.DEFAULT_TIMEOUT_SECONDS))
+
+        self._value = contextinfo['FormDigestValue']
+        self._expires_at = time.monotonic() + max(timeout_seconds - self.EXPIRY_MARGIN_SECONDS, 0)
+        return self._value
+
+    def invalidate(self):
+        self._value = None
+
+    def post(self, url, headers=None, **kwargs):
+        """POST with the digest header, fetching a new digest and retrying once if it is rejected (403)"""
+        headers = dict(headers or {})
+        headers['X-RequestDigest'] = self.value
+
+        try:
+            return post(self._session, url=url, headers=headers, **kwargs)
+        except ShareplumRequestError as err:
+            response = getattr(err.details, 'response', None)
+            if getattr(response, 'status_code', None) != 403:
+                raise
+
+        headers['X-RequestDigest'] = self.refresh()
+        return post(self._session, url=url, headers=headers, **kwargs)
@@ -12,6 +12,7 @@ from lxml import etree
 from .request_helper import get, post
 from .list import _List2007, _List365
 from .folder import _Folder
+from .form_digest import _FormDigest
 from .soap import Soap
 from .version import __version__
 
@@ -408,25 +409,26 @@ class _Site365(_Site2007):
         self._session.headers.update({'Accept': 'application/json',
                                       'Content-Type': 'application/json;odata=nometadata'})
         self.version = "v365"
+        # Digest shared by every write of this site session (folders included)
+        self._form_digest = _FormDigest(self._session, self.site_url)
 
     @property
     def info(self):
         response = get(self._session, self.site_url + "/_api/site")
         return response.json()
 
-    def Folder(self, folder_name):
+    def Folder(self, folder_name, create=True):
         """Sharepoint Folder Web Service
         """
-        return _Folder(self._session, folder_name, self.site_url, timeout=self.timeout)
+        return _Folder(self._session, folder_name, self.site_url, timeout=self.timeout, create=create,
+                       form_digest=self._form_digest)
 
     def _get_form_digest_value(self):
-        response = post(self._session, self.site_url + "/_api/contextinfo")
-        return response.json()['FormDigestValue']
+        return self._form_digest.value
 
     @property
     def contextinfo(self):
-        response = post(self._session, self.site_url + "/_api/contextinfo")
-        return response.json()
+        return self._form_digest.contextinfo
 
     @property
     def contenttypes(self):
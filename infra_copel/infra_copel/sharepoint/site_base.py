@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import io
+import os
 import pickle
 import requests
 import openpyxl
@@ -17,6 +18,7 @@ from infra_copel.sharepoint.shareplum.errors import ShareplumRequestError
 
 from infra_copel.sharepoint.errors import _analyze_shareplum_err
 from infra_copel.sharepoint.errors import LockedError, NotFoundError
+from infra_copel.sharepoint.file_cache import FileCache
 
 
 class SharepointSite:
@@ -29,6 +31,8 @@ class SharepointSite:
         password: str,
         site_url: str,
         verify_ssl: bool,
+        cache_dir: str | os.PathLike | None = None,
+        cache_max_size: int = 512 * 2**20,
     ):
         """
         Construtor para acesso a arquivos compartilhados via Sharepoint.
@@ -46,8 +50,21 @@ class SharepointSite:
             ("https://<something>.sharepoint.com/sites/something).
         verify_ssl : bool, default is True
             Verificar SSL. Desabilitar se houver problemas com certificados.
+        cache_dir : str | os.PathLike | None, default is None
+            Diretório do cache local do conteúdo dos arquivos lidos. Quando
+            informado, get_file só baixa o arquivo se a versão no servidor
+            (ETag e data de modificação) mudou. None desabilita o cache.
+        cache_max_size : int, default is 512 MiB
+            Tamanho máximo, em bytes, do cache local. Os arquivos lidos há
+            mais tempo são removidos primeiro.
 
         """
+        self._file_cache = (
+            FileCache(cache_dir, cache_max_size) if cache_dir is not None else None
+        )
+        # Pastas já obtidas: endereço -> _Folder
+        self._folders: dict[str, _Folder] = {}
+
         if verify_ssl is False:
             # Desabilita warnings
             # pylint:disable=no-member
@@ -75,7 +92,8 @@ class SharepointSite:
         """
         Retorna uma pasta do site do sharepoint.
 
-        Cria recursivamente a pasta caso não exista.
+        Cria recursivamente a pasta caso não exista. As pastas obtidas são
+        reaproveitadas nas chamadas seguintes, sem novas requisições.
 
         Parameters
         ----------
@@ -87,6 +105,22 @@ class SharepointSite:
         _Folder
             Objeto que representa uma pasta do Sharepoint.
         """
+        if (_folder := self._folders.get(folder)) is not None:
+            return _folder
+
+        try:
+            # Apenas consulta (GET), sem tentar criar a pasta
+            _folder = self._site.Folder(folder, create=False)
+        except ShareplumRequestError:
+            _folder = None
+
+        if _folder is None or not _folder.info["d"].get("Exists", True):
+            _folder = self._create_folder(folder)
+
+        self._folders[folder] = _folder
+        return _folder
+
+    def _create_folder(self, folder: str) -> _Folder:
         try:
             _folder = self._site.Folder(folder)
         except ShareplumRequestError:
@@ -97,7 +131,7 @@ class SharepointSite:
                 _folder = self._site.Folder("/".join(subpastas[:i]))
         return _folder
 
-    def get_file(self, folder: str, filename: str):
+    def get_file(self, folder: str, filename: str, properties: dict | None = None):
         """
         Retorna conteúdo de um arquivo do sharepoint.
 
@@ -107,6 +141,10 @@ class SharepointSite:
             Endereço da pasta.
         filename : str
             Nome do arquivo.
+        properties : dict | None, default is None
+            Propriedades do arquivo já obtidas com get_file_properties. Quando
+            informadas, a versão do arquivo no servidor não é consultada
+            novamente para validar o cache.
 
         Returns
         -------
@@ -114,6 +152,29 @@ class SharepointSite:
             Conteúdo do arquivo lido.
 
         """
+        if self._file_cache is None:
+            return self._download_file(folder, filename)
+
+        if properties is None:
+            properties = self.get_file_properties(folder, filename)
+        etag = properties.get("ETag")
+        time_last_modified = properties.get("TimeLastModified")
+
+        if etag is None and time_last_modified is None:
+            # Sem a versão do arquivo não é possível validar o cache
+            return self._download_file(folder, filename)
+
+        key = self._get_cache_key(folder, filename)
+        version = f"{etag}|{time_last_modified}"
+
+        content = self._file_cache.get(key, version)
+        if content is None:
+            content = self._download_file(folder, filename)
+            self._file_cache.put(key, version, content)
+
+        return content
+
+    def _download_file(self, folder: str, filename: str) -> bytes:
         _folder = self.get_folder(folder)
 
         try:
@@ -121,6 +182,43 @@ class SharepointSite:
         except ShareplumRequestError as err:
             _analyze_shareplum_err(err)
 
+    def _get_cache_key(self, folder: str, filename: str) -> str:
+        return FileCache.get_key(self._site.site_url, folder.strip("/"), filename)
+
+    def _invalidate_cache(self, folder: str, filename: str) -> None:
+        if self._file_cache is not None:
+            self._file_cache.remove(self._get_cache_key(folder, filename))
+
+    def get_file_properties(self, folder: str, filename: str) -> dict:
+        """
+        Retorna as propriedades (metadados) de um arquivo do sharepoint.
+
+        Não baixa o conteúdo do arquivo. Os campos 'ETag' e
+        'TimeLastModified' identificam a versão do arquivo no servidor.
+
+        Parameters
+        ----------
+        folder : str
+            Endereço da pasta.
+        filename : str
+            Nome do arquivo.
+
+        Returns
+        -------
+        dict
+            Propriedades do arquivo.
+
+        """
+        _folder = self.get_folder(folder)
+
+        try:
+            properties = _folder.get_file_properties(filename)
+        except ShareplumRequestError as err:
+            _analyze_shareplum_err(err)
+
+        # Com odata=verbose as propriedades vêm dentro de 'd'
+        return properties.get("d", properties)
+
     def check_in(
         self,
         folder: str,
@@ -250,6 +348,7 @@ class SharepointSite:
                 pass
         
         # Envia o arquivo
+        self._invalidate_cache(folder, filename)
         _folder.upload_file(content, filename)
 
         try:
@@ -485,6 +584,7 @@ class SharepointSite:
                     filename: str):
         
         _folder = self.get_folder(folder)
+        self._invalidate_cache(folder, filename)
 
         try:
             _folder.delete_file(filename)
@@ -12,7 +12,7 @@ class SharepointSiteCopel(SharepointSite):
     É feito um apontamento para locais diferentes dependendo da configuração.
     """
 
-    def __init__(self, site):
+    def __init__(self, site, cache_dir=None, cache_max_size=512 * 2**20):
 
         # Dados do arquivo de configuração ou do airflow
         cfg = cfg_sharepoint()
@@ -24,4 +24,6 @@ class SharepointSiteCopel(SharepointSite):
                          password=cfg['password'],
                          site_url=f'{site_url_base}/sites/{site}',
                          verify_ssl=False,
+                         cache_dir=cache_dir,
+                         cache_max_size=cache_max_size,
                          )
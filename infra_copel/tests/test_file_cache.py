@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Tests for the sharepoint local file cache."""
+import os
+
+from infra_copel.sharepoint.file_cache import FileCache
+from infra_copel.sharepoint.site_base import SharepointSite
+
+
+def test_get_put_version(tmp_path):
+    cache = FileCache(tmp_path)
+    key = FileCache.get_key('site', 'Base de Dados', 'PLD.xlsx')
+
+    assert cache.get(key, 'v1') is None
+
+    cache.put(key, 'v1', b'conteudo')
+    assert cache.get(key, 'v1') == b'conteudo'
+    # Nova versão no servidor invalida a entrada
+    assert cache.get(key, 'v2') is None
+
+    cache.remove(key)
+    assert cache.get(key, 'v1') is None
+
+
+def test_lru_eviction(tmp_path):
+    cache = FileCache(tmp_path, max_size=25)
+    keys = [FileCache.get_key('site', 'pasta', f'arquivo_{i}') for i in range(3)]
+
+    for i, key in enumerate(keys[:2]):
+        cache.put(key, 'v1', b'x' * 10)
+        os.utime(tmp_path / f'{key}.bin', (i, i))
+
+    # Acesso torna a primeira entrada a mais recente
+    assert cache.get(keys[0], 'v1') is not None
+
+    cache.put(keys[2], 'v1', b'x' * 10)
+
+    assert cache.get(keys[0], 'v1') is not None
+    assert cache.get(keys[1], 'v1') is None
+    assert cache.get(keys[2], 'v1') is not None
+
+
+def test_site_get_file_reuses_given_properties(tmp_path, monkeypatch):
+    site = SharepointSite.__new__(SharepointSite)
+    site._file_cache = FileCache(tmp_path)
+    site._site = type('SiteFalso', (), {'site_url': 'https://sharepoint/sites/teste'})()
+
+    consultas_propriedades, downloads = [], []
+    properties = {'ETag': '"{1},1"', 'TimeLastModified': '2024-01-01T00:00:00Z'}
+    monkeypatch.setattr(site, 'get_file_properties', lambda folder, filename: consultas_propriedades.append(filename) or properties)
+    monkeypatch.setattr(site, '_download_file', lambda folder, filename: downloads.append(filename) or b'conteudo')
+
+    assert site.get_file('pasta', 'PLD.xlsx', properties=properties) == b'conteudo'
+    assert site.get_file('pasta', 'PLD.xlsx', properties=properties) == b'conteudo'
+    # Propriedades informadas dispensam a consulta da versão no servidor
+    assert consultas_propriedades == []
+    assert downloads == ['PLD.xlsx']
+
+    assert site.get_file('pasta', 'PLD.xlsx') == b'conteudo'
+    assert consultas_propriedades == ['PLD.xlsx']
+    assert downloads == ['PLD.xlsx']
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shared request digest of a sharepoint site (sessão HTTP simulada, sem rede)."""
+import pytest
+import requests
+
+from infra_copel.sharepoint.shareplum import form_digest
+from infra_copel.sharepoint.shareplum.errors import ShareplumRequestError
+from infra_copel.sharepoint.shareplum.form_digest import _FormDigest
+
+SITE_URL = 'https://sharepoint/sites/teste'
+URL_ESCRITA = SITE_URL + "/_api/web/GetFolderByServerRelativeUrl('pasta_403')/Files/add(url='a',overwrite=true)"
+
+
+class _RespostaFalsa:
+    def __init__(self, url, status_code=200, json_data=None):
+        self.url = url
+        self.status_code = status_code
+        self._json_data = json_data
+
+    def json(self):
+        return self._json_data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            # Mesmo formato da mensagem do requests, que inclui a URL
+            raise requests.HTTPError(f'{self.status_code} Client Error: for url: {self.url}', response=self)
+
+
+class _SessaoFalsa:
+    """Cada contextinfo devolve um novo digest; as escritas respondem com os status informados."""
+
+    def __init__(self, lista_status_escrita=()):
+        self.lista_status_escrita = list(lista_status_escrita)
+        self.qtd_contextinfo = 0
+        self.digests_escrita = []
+
+    def post(self, url, headers=None, **kwargs):
+        if url.endswith('/_api/contextinfo'):
+            self.qtd_contextinfo += 1
+            return _RespostaFalsa(url, json_data={'d': {'GetContextWebInformation': {
+                'FormDigestValue': f'digest_{self.qtd_contextinfo}', 'FormDigestTimeoutSeconds': 1800}}})
+
+        self.digests_escrita.append(headers['X-RequestDigest'])
+        status_code = self.lista_status_escrita.pop(0) if self.lista_status_escrita else 200
+        return _RespostaFalsa(url, status_code=status_code, json_data={})
+
+
+def test_digest_reused_across_posts():
+    sessao = _SessaoFalsa()
+    digest = _FormDigest(sessao, SITE_URL)
+
+    for _ in range(3):
+        digest.post(URL_ESCRITA)
+
+    assert sessao.qtd_contextinfo == 1
+    assert sessao.digests_escrita == ['digest_1'] * 3
+
+
+def test_digest_refreshed_after_expiry(monkeypatch):
+    sessao = _SessaoFalsa()
+    digest = _FormDigest(sessao, SITE_URL)
+    agora = [1000.0]
+    monkeypatch.setattr(form_digest.time, 'monotonic', lambda: agora[0])
+
+    digest.post(URL_ESCRITA)
+    # Ainda dentro da validade (timeout menos a margem)
+    agora[0] += 1800 - _FormDigest.EXPIRY_MARGIN_SECONDS - 1
+    digest.post(URL_ESCRITA)
+    assert sessao.qtd_contextinfo == 1
+
+    agora[0] += 1
+    digest.post(URL_ESCRITA)
+
+    assert sessao.qtd_contextinfo == 2
+    assert sessao.digests_escrita == ['digest_1', 'digest_1', 'digest_2']
+
+
+def test_rejected_digest_retried_once():
+    sessao = _SessaoFalsa(lista_status_escrita=[403])
+    digest = _FormDigest(sessao, SITE_URL)
+
+    digest.post(URL_ESCRITA)
+
+    assert sessao.qtd_contextinfo == 2
+    assert sessao.digests_escrita == ['digest_1', 'digest_2']
+
+
+def test_rejected_digest_not_retried_twice():
+    sessao = _SessaoFalsa(lista_status_escrita=[403, 403])
+    digest = _FormDigest(sessao, SITE_URL)
+
+    with pytest.raises(ShareplumRequestError):
+        digest.post(URL_ESCRITA)
+
+    assert len(sessao.digests_escrita) == 2
+
+
+def test_other_errors_not_retried():
+    # A URL contém '403', mas apenas o status da resposta decide a nova tentativa
+    sessao = _SessaoFalsa(lista_status_escrita=[404])
+    digest = _FormDigest(sessao, SITE_URL)
+
+    with pytest.raises(ShareplumRequestError):
+        digest.post(URL_ESCRITA)
+
+    assert sessao.qtd_contextinfo == 1
+    assert len(sessao.digests_escrita) == 1
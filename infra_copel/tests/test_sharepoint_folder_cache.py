@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Tests for the sharepoint folder cache (sessão HTTP simulada, sem rede)."""
+import json
+
+import pytest
+import requests
+
+from infra_copel.sharepoint.file_cache import FileCache
+from infra_copel.sharepoint.site_base import SharepointSite
+from infra_copel.sharepoint.shareplum.site import _Site365
+from infra_copel.sharepoint.shareplum.form_digest import _FormDigest
+
+SITE_URL = 'https://sharepoint/sites/teste'
+
+
+class _RespostaFalsa:
+    def __init__(self, status_code=200, json_data=None, content=b''):
+        self.status_code = status_code
+        self._json_data = json_data
+        self.content = content
+
+    def json(self):
+        return self._json_data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error', response=self)
+
+
+class _SessaoFalsa:
+    """Simula as rotas REST usadas pelo SharepointSite e registra as requisições."""
+
+    def __init__(self, pastas_existentes=()):
+        self.pastas = set(pastas_existentes)
+        self.requisicoes = []
+
+    def _get_nome(self, url):
+        return url.split("('", 1)[1].split("')", 1)[0]
+
+    def get(self, url, **kwargs):
+        self.requisicoes.append(('GET', url))
+
+        if url.endswith('?$expand=ListItemAllFields'):
+            return _RespostaFalsa(json_data={'d': {'ETag': '"{1},1"', 'TimeLastModified': '2024-01-01T00:00:00Z'}})
+        if url.endswith('/$value'):
+            return _RespostaFalsa(content=b'conteudo')
+
+        nome_pasta = self._get_nome(url)
+        if nome_pasta not in self.pastas:
+            return _RespostaFalsa(status_code=404)
+        return _RespostaFalsa(json_data={'d': {'Exists': True, 'ServerRelativeUrl': f'/sites/teste/{nome_pasta}'}})
+
+    def post(self, url, **kwargs):
+        self.requisicoes.append(('POST', url))
+
+        if url.endswith('/_api/contextinfo'):
+            return _RespostaFalsa(json_data={'d': {'GetContextWebInformation': {'FormDigestValue': 'digest',
+                                                                               'FormDigestTimeoutSeconds': 1800}}})
+        if url.endswith('/_api/web/folders'):
+            nome_pasta = json.loads(kwargs['data'])['ServerRelativeUrl']
+            self.pastas.add(nome_pasta)
+            return _RespostaFalsa(json_data={'d': {'ServerRelativeUrl': f'/sites/teste/{nome_pasta}'}})
+        return _RespostaFalsa(json_data={})
+
+    def get_requisicoes(self, metodo, trecho_url=''):
+        return [url for metodo_requisicao, url in self.requisicoes
+                if metodo_requisicao == metodo and trecho_url in url]
+
+
+def _criar_site(sessao, cache_dir=None):
+    """SharepointSite sem autenticação, usando a sessão simulada."""
+    site_365 = _Site365.__new__(_Site365)
+    site_365.site_url = SITE_URL
+    site_365.timeout = None
+    site_365._session = sessao
+    site_365._form_digest = _FormDigest(sessao, SITE_URL)
+
+    site = SharepointSite.__new__(SharepointSite)
+    site._file_cache = FileCache(cache_dir) if cache_dir is not None else None
+    site._folders = {}
+    site._site = site_365
+    return site
+
+
+def test_get_folder_cached():
+    sessao = _SessaoFalsa(pastas_existentes={'pasta'})
+    site = _criar_site(sessao)
+
+    folder = site.get_folder('pasta')
+    qtd_requisicoes = len(sessao.requisicoes)
+
+    assert site.get_folder('pasta') is folder
+    # A segunda chamada não acessa a rede
+    assert len(sessao.requisicoes) == qtd_requisicoes
+
+
+def test_get_folder_existing_not_created():
+    sessao = _SessaoFalsa(pastas_existentes={'pasta'})
+    site = _criar_site(sessao)
+
+    site.get_folder('pasta')
+
+    assert len(sessao.get_requisicoes('GET', "GetFolderByServerRelativeUrl('pasta')")) == 1
+    # Pasta existente: nenhuma criação (e nem o digest é obtido)
+    assert sessao.get_requisicoes('POST') == []
+
+
+def test_get_folder_missing_created_once():
+    sessao = _SessaoFalsa()
+    site = _criar_site(sessao)
+
+    site.get_folder('pasta/nova')
+    site.get_folder('pasta/nova')
+
+    assert len(sessao.get_requisicoes('POST', '/_api/web/folders')) == 1
+    assert 'pasta/nova' in sessao.pastas
+
+
+@pytest.mark.parametrize('operacao', ['upload_file', 'delete_file'])
+def test_write_invalidates_file_cache(tmp_path, operacao):
+    sessao = _SessaoFalsa(pastas_existentes={'pasta'})
+    site = _criar_site(sessao, cache_dir=tmp_path)
+
+    assert site.get_file('pasta', 'arquivo.xlsx') == b'conteudo'
+    assert site.get_file('pasta', 'arquivo.xlsx') == b'conteudo'
+    assert len(sessao.get_requisicoes('GET', '/$value')) == 1
+
+    if operacao == 'upload_file':
+        site.upload_file('pasta', b'novo', 'arquivo.xlsx')
+    else:
+        site.delete_file('pasta', 'arquivo.xlsx')
+
+    # Mesmo com a mesma versão no servidor o conteúdo local foi descartado
+    assert site.get_file('pasta', 'arquivo.xlsx') == b'conteudo'
+    assert len(sessao.get_requisicoes('GET', '/$value')) == 2
+    # As escritas reaproveitam a pasta já obtida
+    assert len(sessao.get_requisicoes('GET', "GetFolderByServerRelativeUrl('pasta')")) == 1